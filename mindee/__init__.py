@@ -1,4 +1,11 @@
+from mindee.client_options.http_options import HTTPOptions
 from mindee.client_options.polling_options import PollingOptions
+from mindee.client_options.polling_strategy import (
+    AdaptivePollingStrategy,
+    FixedPollingStrategy,
+    JobDurationEstimator,
+    PollingStrategy,
+)
 from mindee.input import PageOptions
 from mindee.input.base_64_input import Base64Input
 from mindee.input.bytes_input import BytesInput
@@ -28,6 +35,7 @@
 from mindee.v2.product.split.split_response import SplitResponse
 
 __all__ = [
+    "AdaptivePollingStrategy",
     "Base64Input",
     "BytesInput",
     "ClassificationParameters",
@@ -38,6 +46,9 @@
     "ExtractionResponse",
     "ExtractionResult",
     "FileInput",
+    "FixedPollingStrategy",
+    "HTTPOptions",
+    "JobDurationEstimator",
     "JobResponse",
     "LocalInputSource",
     "LocalResponse",
@@ -46,6 +57,7 @@
     "PageOptions",
     "PathInput",
     "PollingOptions",
+    "PollingStrategy",
     "SplitParameters",
     "SplitResponse",
     "URLInputSource",
@@ -0,0 +1,67 @@
+import httpx
+
+from mindee.mindee_http.rate_limiter import RateLimiter
+from mindee.mindee_http.retry_policy import RetryPolicy
+from mindee.parsing.common.string_dict import StringDict
+
+
+class HTTPOptions:
+    """Options for the pooled HTTP connections shared by all requests of a client."""
+
+    http2: bool
+    """Whether to use HTTP/2 when the server supports it."""
+    max_connections: int
+    """Maximum number of concurrent connections."""
+    max_keepalive_connections: int
+    """Maximum number of idle connections kept open."""
+    keepalive_expiry_sec: float
+    """Time after which an idle connection is closed."""
+    connect_timeout_sec: float
+    """Timeout for establishing a connection."""
+    read_timeout_sec: float | None
+    """Timeout for reading a response, defaults to the client's request timeout."""
+    retry_policy: RetryPolicy
+    """Policy for retrying failed requests."""
+    rate_limiter: RateLimiter | None
+    """Rate limiter consulted before each request, if any."""
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry_sec: float = 30,
+        connect_timeout_sec: float = 10,
+        read_timeout_sec: float | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ):
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry_sec = keepalive_expiry_sec
+        self.connect_timeout_sec = connect_timeout_sec
+        self.read_timeout_sec = read_timeout_sec
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+
+    def get_client_kwargs(self, request_timeout: float) -> StringDict:
+        """
+        Keyword arguments used to create an HTTP client.
+
+        :param request_timeout: Timeout set on the client, used as the read timeout
+            unless ``read_timeout_sec`` is set.
+        :return: Arguments for ``httpx.Client`` or ``httpx.AsyncClient``.
+        """
+        return {
+            "http2": self.http2,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry_sec,
+            ),
+            "timeout": httpx.Timeout(
+                self.read_timeout_sec or request_timeout,
+                connect=self.connect_timeout_sec,
+            ),
+        }
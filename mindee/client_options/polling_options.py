@@ -1,3 +1,9 @@
+from mindee.client_options.polling_strategy import (
+    FixedPollingStrategy,
+    PollingStrategy,
+)
+
+
 class PollingOptions:
     """Options for asynchronous polling."""
 
@@ -7,13 +13,41 @@ class PollingOptions:
     """Delay between each polling attempt."""
     max_retries: int
     """Total number of polling attempts."""
+    strategy: PollingStrategy
+    """Strategy computing the actual delays, fixed by default."""
 
     def __init__(
         self,
         initial_delay_sec: float = 2,
         delay_sec: float = 1.5,
         max_retries: int = 80,
+        strategy: PollingStrategy | None = None,
     ):
         self.initial_delay_sec = initial_delay_sec
         self.delay_sec = delay_sec
         self.max_retries = max_retries
+        self.strategy = strategy or FixedPollingStrategy()
+
+    def get_initial_delay(
+        self, model_id: str | None = None, page_count: int | None = None
+    ) -> float:
+        """
+        Delay before the first polling attempt.
+
+        :param model_id: ID of the model processing the document, if known.
+        :param page_count: Number of pages in the document, if known.
+        :return: Delay in seconds.
+        """
+        return self.strategy.get_initial_delay(
+            self.initial_delay_sec, model_id, page_count
+        )
+
+    def get_delay(self, attempt: int, retry_after_sec: float | None = None) -> float:
+        """
+        Delay before the next polling attempt.
+
+        :param attempt: Number of polling attempts already made, starting at 1.
+        :param retry_after_sec: Delay requested by the server, if any.
+        :return: Delay in seconds.
+        """
+        return self.strategy.get_delay(self.delay_sec, attempt, retry_after_sec)
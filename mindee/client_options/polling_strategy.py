@@ -0,0 +1,220 @@
+import random
+import threading
+from abc import ABC, abstractmethod
+
+from mindee.error.mindee_error import MindeeClientError
+
+MIN_POLLING_DELAY_SEC = 1.0
+"""The API should not be polled more than once per second."""
+
+
+class PollingStrategy(ABC):
+    """Computes the delays between polling attempts."""
+
+    @property
+    def uses_page_count(self) -> bool:
+        """Whether the delays depend on the number of pages of the document."""
+        return False
+
+    @abstractmethod
+    def get_initial_delay(
+        self,
+        initial_delay_sec: float,
+        model_id: str | None = None,
+        page_count: int | None = None,
+    ) -> float:
+        """
+        Delay before the first polling attempt.
+
+        :param initial_delay_sec: Initial delay set in the polling options.
+        :param model_id: ID of the model processing the document, if known.
+        :param page_count: Number of pages in the document, if known.
+        :return: Delay in seconds.
+        """
+
+    @abstractmethod
+    def get_delay(
+        self, delay_sec: float, attempt: int, retry_after_sec: float | None = None
+    ) -> float:
+        """
+        Delay before the next polling attempt.
+
+        :param delay_sec: Delay set in the polling options.
+        :param attempt: Number of polling attempts already made, starting at 1.
+        :param retry_after_sec: Delay requested by the server, if any.
+        :return: Delay in seconds.
+        """
+
+    def record_duration(  # noqa: B027
+        self, model_id: str | None, page_count: int | None, duration_sec: float
+    ) -> None:
+        """
+        Record the processing time of a finished job.
+
+        Does nothing by default.
+
+        :param model_id: ID of the model which processed the document.
+        :param page_count: Number of pages in the document, if known.
+        :param duration_sec: Processing time of the job, in seconds.
+        """
+
+
+class FixedPollingStrategy(PollingStrategy):
+    """Polls at a fixed interval, unless the server asks to wait longer."""
+
+    def get_initial_delay(
+        self,
+        initial_delay_sec: float,
+        model_id: str | None = None,
+        page_count: int | None = None,
+    ) -> float:
+        return initial_delay_sec
+
+    def get_delay(
+        self, delay_sec: float, attempt: int, retry_after_sec: float | None = None
+    ) -> float:
+        return max(delay_sec, retry_after_sec or 0)
+
+
+class JobDurationEstimator:
+    """
+    Learns the processing time of jobs, per model.
+
+    Keeps an exponential moving average of the time taken to process a single page,
+    for each model.
+    Safe to share between threads and clients.
+    """
+
+    smoothing: float
+    """Weight of the latest duration in the moving average, between 0 and 1."""
+
+    def __init__(self, smoothing: float = 0.3) -> None:
+        """
+        Learns the processing time of jobs, per model.
+
+        :param smoothing: Weight of the latest duration in the moving average,
+            between 0 and 1.
+        """
+        if not 0 < smoothing <= 1:
+            raise MindeeClientError("Smoothing must be between 0 (excluded) and 1.")
+        self.smoothing = smoothing
+        self._sec_per_page: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, model_id: str, page_count: int | None, duration_sec: float
+    ) -> None:
+        """
+        Record the processing time of a finished job.
+
+        :param model_id: ID of the model which processed the document.
+        :param page_count: Number of pages in the document, if known.
+        :param duration_sec: Processing time of the job, in seconds.
+        """
+        if duration_sec <= 0:
+            return
+        sec_per_page = duration_sec / max(page_count or 1, 1)
+        with self._lock:
+            previous = self._sec_per_page.get(model_id)
+            if previous is None:
+                self._sec_per_page[model_id] = sec_per_page
+            else:
+                self._sec_per_page[model_id] = (
+                    self.smoothing * sec_per_page + (1 - self.smoothing) * previous
+                )
+
+    def estimate(self, model_id: str, page_count: int | None) -> float | None:
+        """
+        Estimate the processing time of a job.
+
+        :param model_id: ID of the model processing the document.
+        :param page_count: Number of pages in the document, if known.
+        :return: Estimated duration in seconds, ``None`` if the model is not known yet.
+        """
+        with self._lock:
+            sec_per_page = self._sec_per_page.get(model_id)
+        if sec_per_page is None:
+            return None
+        return sec_per_page * max(page_count or 1, 1)
+
+
+class AdaptivePollingStrategy(PollingStrategy):
+    """
+    Polls with an exponential backoff and random jitter, up to a ceiling.
+
+    The ``Retry-After`` delay sent by the server always takes precedence when longer.
+    When a duration estimator is set, the first poll is sent around the time the job
+    is expected to finish, instead of after the fixed initial delay.
+    """
+
+    backoff_factor: float
+    """Multiplier applied to the delay after each polling attempt."""
+    max_delay_sec: float
+    """Ceiling for the delay between two polling attempts."""
+    jitter_ratio: float
+    """Maximum fraction of the delay which is randomly removed, between 0 and 1."""
+    duration_estimator: JobDurationEstimator | None
+    """Learned processing times, used to time the first polling attempt."""
+
+    def __init__(
+        self,
+        backoff_factor: float = 1.5,
+        max_delay_sec: float = 30,
+        jitter_ratio: float = 0.2,
+        duration_estimator: JobDurationEstimator | None = None,
+    ) -> None:
+        """
+        Polls with an exponential backoff and random jitter, up to a ceiling.
+
+        :param backoff_factor: Multiplier applied to the delay after each attempt.
+        :param max_delay_sec: Ceiling for the delay between two polling attempts.
+        :param jitter_ratio: Maximum fraction of the delay which is randomly removed,
+            so that many clients do not poll in lockstep.
+        :param duration_estimator: Learned processing times,
+            used to time the first polling attempt.
+        """
+        if backoff_factor < 1:
+            raise MindeeClientError("Backoff factor cannot be less than 1.")
+        if max_delay_sec < MIN_POLLING_DELAY_SEC:
+            raise MindeeClientError(
+                f"Maximum delay cannot be less than {MIN_POLLING_DELAY_SEC} second(s)."
+            )
+        if not 0 <= jitter_ratio < 1:
+            raise MindeeClientError("Jitter ratio must be between 0 and 1 (excluded).")
+        self.backoff_factor = backoff_factor
+        self.max_delay_sec = max_delay_sec
+        self.jitter_ratio = jitter_ratio
+        self.duration_estimator = duration_estimator
+
+    @property
+    def uses_page_count(self) -> bool:
+        return self.duration_estimator is not None
+
+    def get_initial_delay(
+        self,
+        initial_delay_sec: float,
+        model_id: str | None = None,
+        page_count: int | None = None,
+    ) -> float:
+        estimate = None
+        if self.duration_estimator and model_id:
+            estimate = self.duration_estimator.estimate(model_id, page_count)
+        if estimate is None:
+            return initial_delay_sec
+        return min(max(estimate, MIN_POLLING_DELAY_SEC), self.max_delay_sec)
+
+    def get_delay(
+        self, delay_sec: float, attempt: int, retry_after_sec: float | None = None
+    ) -> float:
+        delay = min(
+            delay_sec * self.backoff_factor ** max(attempt - 1, 0), self.max_delay_sec
+        )
+        delay -= delay * random.uniform(0, self.jitter_ratio)
+        delay = max(delay, MIN_POLLING_DELAY_SEC)
+        return max(delay, retry_after_sec or 0)
+
+    def record_duration(
+        self, model_id: str | None, page_count: int | None, duration_sec: float
+    ) -> None:
+        if self.duration_estimator and model_id:
+            self.duration_estimator.record(model_id, page_count, duration_sec)
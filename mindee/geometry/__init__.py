@@ -1,5 +1,10 @@
 from mindee.geometry.bbox import BBox, get_bbox
 from mindee.geometry.minmax import MinMax, get_min_max_x, get_min_max_y
+from mindee.geometry.perspective import (
+    get_perspective_coefficients,
+    get_quadrilateral_size,
+    order_quadrilateral,
+)
 from mindee.geometry.point import Point, Points
 from mindee.geometry.polygon import (
     Polygon,
@@ -24,8 +29,11 @@
     "get_centroid",
     "get_min_max_x",
     "get_min_max_y",
+    "get_perspective_coefficients",
+    "get_quadrilateral_size",
     "is_point_in_x",
     "is_point_in_y",
     "merge_polygons",
+    "order_quadrilateral",
     "quadrilateral_from_prediction",
 ]
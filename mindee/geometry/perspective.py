@@ -0,0 +1,91 @@
+import math
+
+from mindee.error.geometry_error import MindeeGeometryError
+from mindee.geometry.point import Point, Points
+from mindee.geometry.polygon_utils import get_centroid
+from mindee.geometry.quadrilateral import Quadrilateral
+
+
+def order_quadrilateral(points: Points) -> Quadrilateral:
+    """
+    Orders the 4 corners of a skewed rectangle, whatever their starting point.
+
+    Corners are sorted clockwise around their centroid, starting from the one
+    closest to the top left.
+
+    :param points: Exactly 4 points.
+    :return: The corners, from top left to bottom left, clockwise.
+    """
+    if len(points) != 4:
+        raise MindeeGeometryError("A quadrilateral must have exactly 4 points.")
+    centroid = get_centroid(points)
+    clockwise = sorted(
+        points,
+        key=lambda point: math.atan2(point.y - centroid.y, point.x - centroid.x),
+    )
+    start = min(range(4), key=lambda index: clockwise[index].x + clockwise[index].y)
+    return Quadrilateral(*(clockwise[(start + index) % 4] for index in range(4)))
+
+
+def get_quadrilateral_size(quadrilateral: Quadrilateral) -> tuple[int, int]:
+    """
+    Size of the rectangle a quadrilateral is straightened into.
+
+    :param quadrilateral: Corners of the quadrilateral, in pixels.
+    :return: Width and height, from the longest opposite sides, at least 1.
+    """
+    top_left, top_right, bottom_right, bottom_left = quadrilateral
+    width = max(math.dist(top_left, top_right), math.dist(bottom_left, bottom_right))
+    height = max(math.dist(top_left, bottom_left), math.dist(top_right, bottom_right))
+    return max(round(width), 1), max(round(height), 1)
+
+
+def get_perspective_coefficients(
+    quadrilateral: Quadrilateral, width: int, height: int
+) -> tuple[float, ...]:
+    """
+    Coefficients of the perspective transform of a rectangle into a quadrilateral.
+
+    Maps each point of a ``width`` by ``height`` rectangle to the point of the
+    quadrilateral it comes from, as expected by Pillow's ``PERSPECTIVE`` transform.
+
+    :param quadrilateral: Corners of the source quadrilateral, in pixels.
+    :param width: Width of the destination rectangle.
+    :param height: Height of the destination rectangle.
+    :return: The 8 transform coefficients.
+    """
+    rectangle = (Point(0, 0), Point(width, 0), Point(width, height), Point(0, height))
+    rows: list[list[float]] = []
+    for (x, y), (u, v) in zip(rectangle, quadrilateral, strict=True):
+        rows.append([x, y, 1, 0, 0, 0, -x * u, -y * u, u])
+        rows.append([0, 0, 0, x, y, 1, -x * v, -y * v, v])
+    return tuple(_solve_linear_system(rows))
+
+
+def _solve_linear_system(rows: list[list[float]]) -> list[float]:
+    """
+    Solves a linear system by Gaussian elimination with partial pivoting.
+
+    :param rows: Augmented matrix of the system, modified in place.
+    :return: The solution.
+    """
+    size = len(rows)
+    for column in range(size):
+        pivot = column
+        for row in range(column + 1, size):
+            if abs(rows[row][column]) > abs(rows[pivot][column]):
+                pivot = row
+        if math.isclose(rows[pivot][column], 0, abs_tol=1e-12):
+            raise MindeeGeometryError("Quadrilateral is degenerate.")
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        for row in range(column + 1, size):
+            factor = rows[row][column] / rows[column][column]
+            for index in range(column, size + 1):
+                rows[row][index] -= factor * rows[column][index]
+    solution = [0.0] * size
+    for row in reversed(range(size)):
+        known = sum(
+            rows[row][index] * solution[index] for index in range(row + 1, size)
+        )
+        solution[row] = (rows[row][size] - known) / rows[row][row]
+    return solution
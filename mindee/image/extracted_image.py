@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import io
+import shutil
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, BinaryIO
 
@@ -16,11 +19,28 @@
     Image: Any = None  # type: ignore[no-redef] # pylint: disable=invalid-name
 
 
+@requires_pillow
+def encode_image(image: Image.Image, file_format: str) -> BinaryIO:
+    """
+    Saves an image as a buffer.
+
+    :param image: Pillow wrapper for the image.
+    :param file_format: Format to save the file as.
+    :return: A valid buffer.
+    """
+    buffer = io.BytesIO()
+    image.save(buffer, format=file_format)
+    buffer.seek(0)
+    return buffer
+
+
 class ExtractedImage:
     """Generic class for image extraction."""
 
-    buffer: BinaryIO
     filename: str
+    _buffer: BinaryIO | None
+    _crop: tuple[Callable[[], Image.Image], str] | None
+    """Crop function and file format, until the crop is encoded."""
     _page_id: int
     """Id of the page the image was extracted from."""
     _element_id: int
@@ -28,7 +48,7 @@ class ExtractedImage:
 
     def __init__(
         self,
-        img_byte_stream: BinaryIO,
+        img_byte_stream: BinaryIO | None,
         filename: str,
         page_id: int,
         element_id: int,
@@ -36,22 +56,70 @@ def __init__(
         """
         Initialize the ExtractedImage with a buffer and an internal file name.
 
-        :param img_byte_stream: The raw image bytes.
+        :param img_byte_stream: The raw image bytes, ``None`` for crops created with
+            ``from_crop``.
         :param filename: Name of the file.
         :param page_id: ID of the page the element was found on.
         :param element_id: ID of the element in a page.
         """
-        self.buffer = img_byte_stream
-        self.buffer.seek(0)
+        self._buffer = img_byte_stream
+        if self._buffer is not None:
+            self._buffer.seek(0)
+        self._crop = None
         self.filename = filename
         self._page_id = page_id
         self._element_id = 0 if element_id is None else element_id
 
-    @requires_pillow
+    @classmethod
+    def from_crop(
+        cls,
+        crop: Callable[[], Image.Image],
+        file_format: str,
+        filename: str,
+        page_id: int,
+        element_id: int,
+    ) -> ExtractedImage:
+        """
+        Create an image from a region of a larger image, encoded on first use.
+
+        Only the crop function, usually holding a reference to the rendered page,
+        is kept until then, so that unused crops cost neither memory nor encoding
+        time.
+
+        :param crop: Function returning the cropped image.
+        :param file_format: Format of the encoded image.
+        :param filename: Name of the file.
+        :param page_id: ID of the page the element was found on.
+        :param element_id: ID of the element in a page.
+        :return: The extracted image.
+        """
+        extracted_image = cls(None, filename, page_id, element_id)
+        extracted_image._crop = (crop, file_format)
+        return extracted_image
+
+    @property
+    def buffer(self) -> BinaryIO:
+        """Encoded image, crops being encoded on first access."""
+        if self._buffer is None:
+            if self._crop is None:
+                raise MindeeError("Extracted image has no content.")
+            crop, file_format = self._crop
+            with crop() as cropped_image:
+                self._buffer = encode_image(cropped_image, file_format)
+            self._crop = None
+        return self._buffer
+
+    @buffer.setter
+    def buffer(self, buffer: BinaryIO) -> None:
+        self._buffer = buffer
+        self._crop = None
+
     def write_to_file(self, output_path: Path | str):
         """
         Saves the document to a file.
 
+        The encoded image is written as it is, without being decoded.
+
         :param output_path: Path to save the file to.
         :raises MindeeError: If an invalid path or filename is provided.
         """
@@ -60,9 +128,11 @@ def write_to_file(self, output_path: Path | str):
             raise MindeeError("Provided path is not a directory.")
         out_file_path = out_path / self.filename
         try:
-            self.buffer.seek(0)
-            image = Image.open(self.buffer)
-            image.save(out_file_path)
+            buffer = self.buffer
+            buffer.seek(0)
+            with open(out_file_path, "wb") as out_file:
+                shutil.copyfileobj(buffer, out_file)
+            buffer.seek(0)
             logger.info("File saved successfully to '%s'.", out_file_path)
         except Exception as e:
             print(e)
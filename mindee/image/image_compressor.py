@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import io
+from collections.abc import Callable
 from typing import Any, BinaryIO
 
 from mindee.dependencies.checkers import PILLOW_AVAILABLE
@@ -12,6 +13,72 @@
 else:
     Image: Any = None  # type: ignore[no-redef] # pylint: disable=invalid-name
 
+MIN_QUALITY = 1
+"""Lowest JPEG quality used when compressing."""
+REDUCING_GAP = 2.0
+"""
+Downscaling is first done by an integer factor, JPEG images being decoded at
+reduced size, down to this many times the requested size.
+"""
+FAST_REDUCING_GAP = 1.0
+"""Reducing gap used in fast mode, leaving the least work to the resampling filter."""
+
+
+def encode_to_target_size(
+    encode: Callable[[int], bytes], target_bytes: int, max_quality: int
+) -> bytes:
+    """
+    Binary-searches the highest JPEG quality fitting in a byte budget.
+
+    Takes about 7 encodes, instead of one per quality step.
+
+    :param encode: Function encoding the image at a given quality.
+    :param target_bytes: Maximum size of the encoded image.
+    :param max_quality: Highest quality to try.
+    :return: The encoded image, at the lowest quality if none fits in the budget.
+    """
+    low, high = MIN_QUALITY, max(max_quality, MIN_QUALITY)
+    best: bytes | None = None
+    smallest = b""
+    while low <= high:
+        quality = (low + high) // 2
+        encoded = encode(quality)
+        if len(encoded) <= target_bytes:
+            best = encoded
+            low = quality + 1
+        else:
+            smallest = encoded
+            high = quality - 1
+    return best if best is not None else smallest
+
+
+def _set_draft_size(
+    img: Image.Image,
+    max_width: int | float,
+    max_height: int | float,
+    reducing_gap: float,
+) -> None:
+    """
+    Have JPEG images decoded at reduced size, when they are to be downscaled.
+
+    ``thumbnail`` only does this from the bounds it is given, which misses it
+    when a single bound is set, so the draft size is computed from the final size.
+
+    :param img: Image, not yet loaded.
+    :param max_width: Maximum bound for the width.
+    :param max_height: Maximum bound for the height.
+    :param reducing_gap: How many times the final size the decoded image must be.
+    """
+    ratio = min(max_width / img.width, max_height / img.height)
+    if ratio < 1:
+        img.draft(
+            img.mode,
+            (
+                max(int(img.width * ratio * reducing_gap), 1),
+                max(int(img.height * ratio * reducing_gap), 1),
+            ),
+        )
+
 
 @requires_pillow
 def compress_image(
@@ -19,27 +86,53 @@ def compress_image(
     quality: int = 85,
     max_width: int | float | None = None,
     max_height: int | float | None = None,
+    target_bytes: int | None = None,
+    resample: Image.Resampling | None = None,
+    fast: bool = False,
 ) -> bytes:
     """
     Compresses an image with the given parameters.
 
     :param image_buffer: Buffer representation of an image, also accepts BinaryIO.
     :param quality: Quality to apply to the image (JPEG compression).
+        When ``target_bytes`` is set, this is the highest quality tried.
     :param max_width: Maximum bound for the width.
     :param max_height: Maximum bound for the height.
+    :param target_bytes: Maximum size of the compressed image, the highest quality
+        fitting in it is used.
+    :param resample: Resampling filter used when resizing,
+        defaults to ``LANCZOS``, or ``BILINEAR`` in fast mode.
+    :param fast: Trades a little size and sharpness for speed: JPEG sources are
+        decoded at the smallest reduced size above the bounds, and the encoder
+        does not optimize its Huffman tables.
     :return:
     """
     if isinstance(image_buffer, bytes):
         image_buffer = io.BytesIO(image_buffer)
+    if resample is None:
+        resample = Image.Resampling.BILINEAR if fast else Image.Resampling.LANCZOS
     with Image.open(image_buffer) as img:
         original_width, original_height = img.size
         max_width = max_width or original_width
         max_height = max_height or original_height
         if max_width or max_height:
-            img.thumbnail((int(max_width), int(max_height)), Image.Resampling.LANCZOS)
+            reducing_gap = FAST_REDUCING_GAP if fast else REDUCING_GAP
+            _set_draft_size(img, max_width, max_height, reducing_gap)
+            img.thumbnail(
+                (int(max_width), int(max_height)), resample, reducing_gap=reducing_gap
+            )
 
-        output_buffer = io.BytesIO()
-        img.save(output_buffer, format="JPEG", quality=quality, optimize=True)
+        def encode(encode_quality: int) -> bytes:
+            output_buffer = io.BytesIO()
+            img.save(
+                output_buffer,
+                format="JPEG",
+                quality=encode_quality,
+                optimize=not fast,
+            )
+            return output_buffer.getvalue()
 
-        compressed_image = output_buffer.getvalue()
+        if target_bytes is not None:
+            return encode_to_target_size(encode, target_bytes, quality)
+        compressed_image = encode(quality)
     return compressed_image
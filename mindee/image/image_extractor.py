@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-import io
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, BinaryIO
 
@@ -8,10 +11,17 @@
 from mindee.dependencies.checkers import PILLOW_AVAILABLE, PYPDFIUM2_AVAILABLE
 from mindee.dependencies.decorators import requires_pillow
 from mindee.error.mindee_error import MindeeError
+from mindee.geometry.perspective import (
+    get_perspective_coefficients,
+    get_quadrilateral_size,
+    order_quadrilateral,
+)
 from mindee.geometry.point import Point
 from mindee.geometry.polygon import Polygon, get_min_max_x, get_min_max_y
-from mindee.image.extracted_image import ExtractedImage
+from mindee.image.extracted_image import ExtractedImage, encode_image
 from mindee.input.local_input_source import LocalInputSource
+from mindee.pdf.pdf_utils import PDFIUM_LOCK, render_page
+from mindee.pdf.render_options import RenderOptions
 
 if PYPDFIUM2_AVAILABLE:
     # pylint: disable=import-error
@@ -27,36 +37,69 @@
     Image: Any = None  # type: ignore[no-redef] # pylint: disable=invalid-name
 
 
+def get_crop_box(
+    polygon: Polygon | list[Point], width: float, height: float
+) -> tuple[int, int, int, int]:
+    """
+    Pixel bounds of a polygon, on an image of the given size.
+
+    :param polygon: Polygon coordinates, relative to the image size.
+    :param width: Width of the image, in pixels.
+    :param height: Height of the image, in pixels.
+    :return: Left, upper, right and lower bounds, in pixels.
+    """
+    min_max_x = get_min_max_x(polygon)
+    min_max_y = get_min_max_y(polygon)
+    return (
+        int(min_max_x.min * width),
+        int(min_max_y.min * height),
+        int(min_max_x.max * width),
+        int(min_max_y.max * height),
+    )
+
+
 @requires_pillow
-@requires_pypdfium2
-def _attach_image_as_new_file(  # type: ignore
-    input_buffer: BinaryIO,
-) -> pdfium.PdfDocument:
+def crop_perspective(
+    image: Image.Image, polygon: Sequence[Point], width: float, height: float
+) -> Image.Image:
     """
-    Attaches an image as a new page in a PdfDocument object.
+    Straightens a skewed quadrilateral region of an image into a rectangle.
 
-    :param input_buffer: Input buffer.
-    :return: A PdfDocument handle.
+    :param image: Image to crop.
+    :param polygon: The 4 corners of the region, relative to the image size.
+    :param width: Width of the image, in pixels.
+    :param height: Height of the image, in pixels.
+    :return: The deskewed region.
     """
-    input_buffer.seek(0)
-    image = Image.open(input_buffer)
-    image.convert("RGB")
-    image_buffer = io.BytesIO()
-    image.save(image_buffer, format="JPEG")
+    quadrilateral = order_quadrilateral(
+        [Point(point.x * width, point.y * height) for point in polygon]
+    )
+    size = get_quadrilateral_size(quadrilateral)
+    return image.transform(
+        size,
+        Image.Transform.PERSPECTIVE,
+        get_perspective_coefficients(quadrilateral, *size),
+        Image.Resampling.BICUBIC,
+    )
 
-    pdf = pdfium.PdfDocument.new()
 
-    image_pdf = pdfium.PdfImage.new(pdf)
-    image_pdf.load_jpeg(image_buffer)
-    width, height = image.width, image.height
-    matrix = pdfium.PdfMatrix().scale(width, height)
-    image_pdf.set_matrix(matrix)
+def _get_crop_function(
+    image: Image.Image,
+    polygon: Polygon | list[Point],
+    perspective: bool,
+) -> Callable[[], Image.Image]:
+    """
+    Function cropping a region of an image.
 
-    page = pdf.new_page(width, height)
-    page.insert_obj(image_pdf)
-    page.gen_content()
-    image.close()
-    return pdf
+    :param image: Image to crop.
+    :param polygon: Polygon coordinates, relative to the image size.
+    :param perspective: Whether to straighten 4-point polygons.
+    :return: The crop function.
+    """
+    width, height = image.size
+    if perspective and len(polygon) == 4:
+        return partial(crop_perspective, image, polygon, width, height)
+    return partial(image.crop, get_crop_box(polygon, width, height))
 
 
 @requires_pillow
@@ -66,43 +109,25 @@ def extract_image_from_polygon(
     width: float,
     height: float,
     file_format: str,
+    perspective: bool = False,
 ) -> BinaryIO:
     """
     Crops the image from the given polygon.
 
     :param page_content: Contents of the page as a Pillow object.
-    :param polygon: Polygon coordinates for the image.
-    :param width: Width of the generated image.
-    :param height: Height of the generated image.
+    :param polygon: Polygon coordinates for the image, relative to the page size.
+    :param width: Width of the page content, in pixels.
+    :param height: Height of the page content, in pixels.
     :param file_format: Format for the generated file.
+    :param perspective: Whether to straighten a skewed 4-point polygon with a
+        perspective transform, instead of cropping to its bounding box.
     :return: A generated image as a buffer.
     """
-    min_max_x = get_min_max_x(polygon)
-    min_max_y = get_min_max_y(polygon)
-    cropped_image = page_content.crop(
-        (
-            int(min_max_x.min * width),
-            int(min_max_y.min * height),
-            int(min_max_x.max * width),
-            int(min_max_y.max * height),
-        )
-    )
-    return _save_image_to_buffer(cropped_image, file_format)
-
-
-@requires_pillow
-def _save_image_to_buffer(image: Image.Image, file_format: str) -> BinaryIO:
-    """
-    Saves an image as a buffer.
-
-    :param image: Pillow wrapper for the image.
-    :param file_format: Format to save the file as.
-    :return: A valid buffer.
-    """
-    buffer = io.BytesIO()
-    image.save(buffer, format=file_format)
-    buffer.seek(0)
-    return buffer
+    if perspective and len(polygon) == 4:
+        cropped_image = crop_perspective(page_content, polygon, width, height)
+    else:
+        cropped_image = page_content.crop(get_crop_box(polygon, width, height))
+    return encode_image(cropped_image, file_format)
 
 
 @requires_pillow
@@ -131,42 +156,165 @@ def get_file_extension(file_format: str):
     return file_format.lower() if file_format != "JPEG" else "jpg"
 
 
+class ImageExtractor:
+    """
+    Extracts regions of the pages of a document as images.
+
+    The document is parsed once, on the first extraction, and each page is
+    rendered at most once, only if regions are extracted from it.
+    Extracted images are only cropped and encoded when their contents are used.
+    """
+
+    _input_source: LocalInputSource
+    _render_options: RenderOptions | None
+    _file_format: str
+    _document: Any
+    _page_images: dict[int, Image.Image]
+
+    @requires_pillow
+    def __init__(
+        self,
+        input_source: LocalInputSource,
+        render_options: RenderOptions | None = None,
+    ) -> None:
+        """
+        Extracts regions of the pages of a document as images.
+
+        :param input_source: Local Input source to extract elements from.
+        :param render_options: Resolution and color of the rendered pages,
+            defaults to 72 DPI in color.
+        """
+        self._input_source = input_source
+        self._render_options = render_options
+        self._file_format = determine_file_format(input_source)
+        self._document = None
+        self._page_images = {}
+
+    def _get_page_image(self, page_id: int) -> Image.Image:
+        """
+        Render a page on first use, then reuse it.
+
+        pdfium is not thread-safe, pages are rendered one at a time.
+
+        :param page_id: id of the page to render.
+        :return: The rendered page.
+        """
+        with PDFIUM_LOCK:
+            if page_id not in self._page_images:
+                if self._document is None:
+                    self._document = _load_pdf_doc(self._input_source)
+                page = self._document[page_id]
+                try:
+                    self._page_images[page_id] = render_page(page, self._render_options)
+                finally:
+                    page.close()
+            return self._page_images[page_id]
+
+    def close(self) -> None:
+        """Release the parsed document and the rendered pages."""
+        with PDFIUM_LOCK:
+            if self._document is not None:
+                self._document.close()
+                self._document = None
+                self._input_source.file_object.seek(0)
+            self._page_images.clear()
+
+    def __enter__(self) -> ImageExtractor:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def extract_page_images(
+        self,
+        page_id: int,
+        polygons: Sequence[Polygon | list[Point]],
+        perspective: bool = False,
+    ) -> list[ExtractedImage]:
+        """
+        Extracts elements from a page based on a list of bounding boxes.
+
+        :param page_id: id of the page to extract from.
+        :param polygons: List of coordinates to pull the elements from.
+        :param perspective: Whether to straighten skewed 4-point polygons with a
+            perspective transform, instead of cropping to their bounding box.
+        :return: List of byte arrays representing the extracted elements.
+        """
+        if not polygons:
+            return []
+        stem = Path(self._input_source.filename).stem
+        page_content = self._get_page_image(page_id)
+        file_extension = get_file_extension(self._file_format)
+
+        return [
+            ExtractedImage.from_crop(
+                _get_crop_function(page_content, polygon, perspective),
+                self._file_format,
+                f"{stem}_page-{(page_id + 1):03d}-item-{(element_id + 1):03d}.{file_extension}",
+                page_id,
+                element_id,
+            )
+            for element_id, polygon in enumerate(polygons)
+        ]
+
+    def extract_images(
+        self,
+        polygons: Mapping[int, Sequence[Polygon | list[Point]]],
+        perspective: bool = False,
+        encode_workers: int | None = None,
+    ) -> list[ExtractedImage]:
+        """
+        Extracts elements from several pages.
+
+        :param polygons: Coordinates to pull the elements from, by page id.
+            Pages without elements are not rendered.
+        :param perspective: Whether to straighten skewed 4-point polygons with a
+            perspective transform, instead of cropping to their bounding box.
+        :param encode_workers: Number of threads cropping and encoding all elements
+            before returning. By default, each element is cropped and encoded in
+            the calling thread, when its contents are first used.
+        :return: The extracted elements, ordered by page then by element.
+        """
+        images = [
+            image
+            for page_id in sorted(polygons)
+            for image in self.extract_page_images(
+                page_id, polygons[page_id], perspective
+            )
+        ]
+        if encode_workers:
+            with ThreadPoolExecutor(max_workers=encode_workers) as executor:
+                # Reading the buffer of an image crops and encodes it.
+                for _ in executor.map(attrgetter("buffer"), images):
+                    pass
+        return images
+
+
 @requires_pillow
 def extract_multiple_images_from_source(
     input_source: LocalInputSource,
     page_id: int,
     polygons: list[Polygon | list[Point]],
+    render_options: RenderOptions | None = None,
+    perspective: bool = False,
 ) -> list[ExtractedImage]:
     """
     Extracts elements from a page based on a list of bounding boxes.
 
+    To extract from several pages, use an ``ImageExtractor`` so that the document
+    is only parsed once.
+
     :param input_source: Local Input source to extract elements from.
     :param page_id: id of the page to extract from.
     :param polygons: List of coordinates to pull the elements from.
+    :param render_options: Resolution and color of the rendered page,
+        defaults to 72 DPI in color.
+    :param perspective: Whether to straighten skewed 4-point polygons with a
+        perspective transform, instead of cropping to their bounding box.
     :return: List of byte arrays representing the extracted elements.
     """
-    stem = Path(input_source.filename).stem
-    page = _load_pdf_doc(input_source).get_page(page_id)
-    page_content = page.render().to_pil()
-    width, height = page.get_size()
-
-    file_format = determine_file_format(input_source)
-    file_extension = get_file_extension(file_format)
-
-    extracted_elements = []
-    for element_id, polygon in enumerate(polygons):
-        image_data = extract_image_from_polygon(
-            page_content, polygon, width, height, file_format
-        )
-        extracted_elements.append(
-            ExtractedImage(
-                image_data,
-                f"{stem}_page-{(page_id + 1):03d}-item-{(element_id + 1):03d}.{file_extension}",
-                page_id,
-                element_id,
-            )
-        )
-    return extracted_elements
+    with ImageExtractor(input_source, render_options) as extractor:
+        return extractor.extract_page_images(page_id, polygons, perspective)
 
 
 @requires_pypdfium2
@@ -174,11 +322,14 @@ def _load_pdf_doc(input_file: LocalInputSource) -> pdfium.PdfDocument:  # type:
     """
     Loads a PDF document from a local input source.
 
+    PDFs are read in place from their file object, images are read from their
+    cached single-page PDF.
+
     :param input_file: Local input.
     :return: A valid PdfDocument handle.
     """
     if input_file.is_pdf():
         input_file.file_object.seek(0)
-        return pdfium.PdfDocument(input_file.file_object.read())
+        return pdfium.PdfDocument(input_file.file_object)
 
-    return _attach_image_as_new_file(input_file.file_object)
+    return pdfium.PdfDocument(input_file.image_as_pdf())
@@ -1,4 +1,5 @@
 from mindee.input.base_64_input import Base64Input
+from mindee.input.bulk_compressor import CompressionResult, compress_inputs
 from mindee.input.bytes_input import BytesInput
 from mindee.input.file_input import FileInput
 from mindee.input.local_input_source import LocalInputSource
@@ -10,10 +11,12 @@
 __all__ = [
     "Base64Input",
     "BytesInput",
+    "CompressionResult",
     "FileInput",
     "LocalInputSource",
     "LocalResponse",
     "PageOptions",
     "PathInput",
     "URLInputSource",
+    "compress_inputs",
 ]
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Collection, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+
+from mindee.image.image_compressor import compress_image
+from mindee.input.bytes_input import BytesInput
+from mindee.input.local_input_source import LocalInputSource
+from mindee.logger import logger
+from mindee.pdf.pdf_compressor import compress_pdf
+
+PENDING_FILES_PER_WORKER = 2
+"""Number of files read ahead for each worker, bounding memory use."""
+
+
+@dataclass
+class CompressionResult:
+    """A compressed input source, with statistics on its compression."""
+
+    filename: str
+    """Name of the file."""
+    input_source: BytesInput | None
+    """The compressed file, ``None`` if it could not be compressed."""
+    original_size: int
+    """Size of the original file, in bytes, 0 if it could not be read."""
+    compressed_size: int
+    """Size of the compressed file, in bytes, 0 if it could not be compressed."""
+    duration: float
+    """Time taken to compress the file, in seconds."""
+    error: Exception | None = None
+    """Exception raised while reading or compressing the file, if any."""
+
+
+@dataclass(frozen=True)
+class _CompressionOptions:
+    quality: int
+    max_width: int | None
+    max_height: int | None
+    target_bytes: int | None
+
+
+def _compress_file(
+    filename: str, data: bytes, is_pdf: bool, options: _CompressionOptions
+) -> CompressionResult:
+    """
+    Compresses a file, in a worker process.
+
+    :param filename: Name of the file.
+    :param data: Contents of the file.
+    :param is_pdf: Whether the file is a PDF.
+    :param options: Compression options.
+    :return: The compressed file, with its statistics.
+    """
+    start = time.perf_counter()
+    if is_pdf:
+        # Workers are already running in parallel, pages are encoded in one thread.
+        compressed = compress_pdf(
+            data, options.quality, max_workers=1, target_bytes=options.target_bytes
+        )
+    else:
+        compressed = compress_image(
+            data,
+            options.quality,
+            options.max_width,
+            options.max_height,
+            options.target_bytes,
+        )
+    return CompressionResult(
+        filename=filename,
+        input_source=BytesInput(compressed, filename),
+        original_size=len(data),
+        compressed_size=len(compressed),
+        duration=time.perf_counter() - start,
+    )
+
+
+def _get_next_future(
+    pending: Collection[Future[CompressionResult]], ordered: bool
+) -> Future[CompressionResult]:
+    """
+    Next compression whose result is yielded.
+
+    :param pending: Pending compressions, in the order of the input sources.
+    :param ordered: Whether to keep the order of the input sources.
+    :return: The first pending compression, or the first one to complete.
+    """
+    if ordered:
+        return next(iter(pending))
+    return wait(pending, return_when=FIRST_COMPLETED).done.pop()
+
+
+def _get_result(
+    future: Future[CompressionResult], filename: str, original_size: int
+) -> CompressionResult:
+    """
+    Result of a compression, holding its exception if it failed.
+
+    :param future: Completed compression of the file.
+    :param filename: Name of the file.
+    :param original_size: Size of the original file, in bytes.
+    :return: The compressed file, or the error.
+    """
+    try:
+        return future.result()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.debug("Could not compress %s: %s", filename, e)
+        return CompressionResult(filename, None, original_size, 0, 0.0, e)
+
+
+def compress_inputs(
+    input_sources: Iterable[LocalInputSource],
+    quality: int = 85,
+    max_width: int | None = None,
+    max_height: int | None = None,
+    target_bytes: int | None = None,
+    max_workers: int | None = None,
+    ordered: bool = True,
+) -> Iterator[CompressionResult]:
+    """
+    Compresses many input sources across a pool of processes.
+
+    Only a few files per worker are read ahead, so that large batches can be
+    compressed without loading every file in memory.
+    The input sources are left unchanged.
+    A file which cannot be read or compressed does not stop the others, its
+    result holds the exception in ``error``.
+
+    :param input_sources: Input sources to compress, images or PDFs.
+    :param quality: Quality of the compression. For images, this is the JPEG quality.
+        For PDFs, this affects image quality within the PDF.
+    :param max_width: Maximum width for image resizing. Ignored for PDFs.
+    :param max_height: Maximum height for image resizing. Ignored for PDFs.
+    :param target_bytes: Size each compressed file should fit in.
+    :param max_workers: Number of worker processes, defaults to the number of CPUs.
+    :param ordered: Whether to yield results in the order of the input sources,
+        rather than as soon as each file is compressed.
+    :return: An iterator over the compressed files and their statistics.
+    """
+    options = _CompressionOptions(quality, max_width, max_height, target_bytes)
+    max_pending = PENDING_FILES_PER_WORKER * (max_workers or os.cpu_count() or 1)
+    sources = iter(input_sources)
+    # Name and original size of the file compressed by each pending future,
+    # in the order of the input sources.
+    pending: dict[Future[CompressionResult], tuple[str, int]] = {}
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+
+    def submit_next() -> bool:
+        input_source = next(sources, None)
+        if input_source is None:
+            return False
+        future: Future[CompressionResult]
+        data = b""
+        try:
+            _, data = input_source.read_contents(close_file=False)
+            future = executor.submit(
+                _compress_file,
+                input_source.filename,
+                data,
+                input_source.is_pdf(),
+                options,
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            future = Future()
+            future.set_exception(e)
+        pending[future] = (input_source.filename, len(data))
+        return True
+
+    try:
+        while len(pending) < max_pending and submit_next():
+            pass
+        while pending:
+            future = _get_next_future(pending, ordered)
+            file_info = pending.pop(future)
+            submit_next()
+            yield _get_result(future, *file_info)
+    finally:
+        executor.shutdown(cancel_futures=True)
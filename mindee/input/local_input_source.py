@@ -2,8 +2,8 @@
 
 import io
 import mimetypes
-import tempfile
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from typing import BinaryIO
 
 from mindee.dependencies import requires_pypdfium2
@@ -11,10 +11,16 @@
 from mindee.error.mimetype_error import MimeTypeError
 from mindee.error.mindee_error import MindeeError, MindeeSourceError
 from mindee.image.image_compressor import compress_image
+from mindee.input.mime_type_sniffer import find_pdf_signature, get_mime_type
 from mindee.input.page_options import KEEP_ONLY, REMOVE, PageOptions
 from mindee.logger import logger
 from mindee.pdf.pdf_compressor import compress_pdf
-from mindee.pdf.pdf_utils import pdf_has_source_text
+from mindee.pdf.pdf_utils import (
+    get_linearized_page_count,
+    image_to_pdf,
+    pdf_has_source_text,
+)
+from mindee.pdf.render_options import RenderOptions
 
 if PYPDFIUM2_AVAILABLE:
     # pylint: disable=import-error
@@ -44,36 +50,69 @@ class LocalInputSource:
     filename: str
     file_mimetype: str
     filepath: str | None
-    page_count: int
+    _page_count: int | None = None
+    _image_pdf: bytes | None = None
 
     def __init__(self) -> None:
         """
         Initialize a LocalInputSource object.
+
+        The document is not parsed, its pages are only counted when ``page_count``
+        is first accessed.
         """
         self._check_mimetype()
-        if self.is_pdf():
-            self.file_object.seek(0)
-            # Some broken (yet fixable) PDFs can cause pdfium to crash on open.
-            if PYPDFIUM2_AVAILABLE:
-                try:
-                    pdf = pdfium.PdfDocument(self.file_object)
-                    self.page_count = len(pdf)
-                except pdfium.PdfiumError as e:
-                    logger.warning(
-                        "Could not open PDF file: %s due to %s", self.filename, e
-                    )
-                    self.page_count = 0
-                self.file_object.seek(0)
-            else:
-                self.page_count = 0
-        else:
-            self.page_count = 1
+        self._page_count = None
+        self._image_pdf = None
         logger.debug(
             "Loaded new input '%s' from %s", self.filename, {type(self).__name__}
         )
 
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the document, counted on first access."""
+        if self._page_count is None:
+            self._page_count = self._count_pages()
+        return self._page_count
+
+    @page_count.setter
+    def page_count(self, page_count: int) -> None:
+        self._page_count = page_count
+
+    def _count_pages(self) -> int:
+        """
+        Count the pages of the document.
+
+        Linearized PDFs are counted from their header, other PDFs are opened with
+        pdfium.
+
+        :return: The number of pages, 0 if the PDF could not be opened.
+        """
+        if not self.is_pdf():
+            return 1
+        page_count = get_linearized_page_count(self.file_object)
+        if page_count is not None:
+            return page_count
+        if not PYPDFIUM2_AVAILABLE:
+            return 0
+        # Some broken (yet fixable) PDFs can cause pdfium to crash on open.
+        try:
+            pdf = pdfium.PdfDocument(self.file_object)
+            page_count = len(pdf)
+            pdf.close()
+        except pdfium.PdfiumError as e:
+            logger.warning("Could not open PDF file: %s due to %s", self.filename, e)
+            page_count = 0
+        self.file_object.seek(0)
+        return page_count
+
     def _check_mimetype(self) -> None:
-        file_mimetype = mimetypes.guess_type(self.filename)[0]
+        """
+        Set the MIME type of the file, detected from its contents when possible.
+
+        The file name is only used when the contents are not recognized,
+        so that wrong or missing extensions are accepted.
+        """
+        file_mimetype = get_mime_type(self.file_object, self.filename)
         if file_mimetype:
             self.file_mimetype = file_mimetype
         else:
@@ -89,7 +128,7 @@ def fix_pdf(self, maximum_offset: int = 500) -> None:
 
         WARNING: this feature alters the data of the enqueued file by removing unnecessary headers.
 
-        Reads the bytes of a PDF file until a proper pdf tag is encountered,
+        Reads the start of a PDF file until a proper pdf tag is encountered,
         or until the maximum offset has been reached.
         If a tag denoting a PDF file is found, deletes all bytes before it.
 
@@ -99,16 +138,10 @@ def fix_pdf(self, maximum_offset: int = 500) -> None:
         if maximum_offset < 0:
             raise MindeeError("Can't set maximum offset for pdf-fixing to less than 0.")
         try:
-            buf = self.file_object.read()
-            self.file_object.seek(0)
-            pos: int = buf.find(b"%PDF-")
+            pos = find_pdf_signature(self.file_object, maximum_offset)
             if pos != -1 and pos < maximum_offset:
                 self.file_object.seek(pos)
-                raw_bytes = self.file_object.read()
-                with tempfile.TemporaryFile() as temp_file:
-                    temp_file.write(raw_bytes)
-                    temp_file.seek(0)
-                    self.file_object = io.BytesIO(temp_file.read())
+                self.file_object = io.BytesIO(self.file_object.read())
             else:
                 if pos < 0:
                     raise MimeTypeError(
@@ -118,6 +151,7 @@ def fix_pdf(self, maximum_offset: int = 500) -> None:
                     f"PDF couldn't be fixed. PDF tag was found at position {pos}."
                 )
             self.file_mimetype = "application/pdf"
+            self._page_count = None
         except MimeTypeError as e:
             raise e
         except Exception as e:
@@ -198,6 +232,20 @@ def merge_pdf_pages(self, page_numbers: set) -> None:
         new_pdf.close()
         pdf.close()
 
+    def image_as_pdf(self) -> bytes:
+        """
+        Single-page PDF holding the image, built on first use then reused.
+
+        JPEG images are embedded without being decoded.
+
+        :return: The PDF as bytes.
+        """
+        if self.is_pdf():
+            raise MindeeSourceError(f"File is already a PDF: {self.filename}")
+        if self._image_pdf is None:
+            self._image_pdf = image_to_pdf(self.file_object)
+        return self._image_pdf
+
     @requires_pypdfium2
     def is_pdf_empty(self) -> bool:
         """
@@ -223,25 +271,52 @@ def read_contents(self, close_file: bool) -> tuple[str, bytes]:
         self.file_object.seek(0)
         data = self.file_object.read()
         if close_file:
-            self.file_object.close()
+            self.close()
         else:
             self.file_object.seek(0)
         return self.filename, data
 
-    def close(self):
+    @contextmanager
+    def open_for_upload(self, close_file: bool) -> Iterator[tuple[str, BinaryIO, str]]:
+        """
+        Give the input file to the HTTP client, without reading it in memory.
+
+        The HTTP client streams the file in chunks while sending the request,
+        and rewinds it before each attempt.
+        The file must stay open until the request is complete.
+
+        :param close_file: whether to close the file once the upload is done
+        :return: a Tuple with the file name, the file object and the MIME type,
+            to use as a multipart file field
+        """
+        logger.debug("Streaming data from: %s", self.filename)
+        self.file_object.seek(0)
+        try:
+            yield self.filename, self.file_object, self.file_mimetype
+        finally:
+            if close_file:
+                self.close()
+            elif not self.file_object.closed:
+                self.file_object.seek(0)
+
+    def close(self) -> None:
         """Allow explicit closing for users not using a context manager."""
         if self.file_object and not self.file_object.closed:
             self.file_object.close()
 
-    def has_source_text(self) -> bool:
+    def has_source_text(self, max_pages: int | None = None) -> bool:
         """
         If the file is a PDF, checks if it has source text.
 
+        The file is read in place, without copying it.
+
+        :param max_pages: Only check this number of pages, at the start of the document.
         :return: True if the file is a PDF and has source text. False otherwise.
         """
         if not self.is_pdf():
             return False
-        return pdf_has_source_text(self.file_object.read())
+        self.file_object.seek(0)
+        return pdf_has_source_text(self.file_object, max_pages)
 
     @requires_pypdfium2
     def compress(
@@ -251,6 +326,9 @@ def compress(
         max_height: int | None = None,
         force_source_text: bool = False,
         disable_source_text: bool = True,
+        max_workers: int | None = None,
+        target_bytes: int | None = None,
+        render_options: RenderOptions | None = None,
     ) -> None:
         """
         Compresses the file object, either as a PDF or an image.
@@ -261,18 +339,29 @@ def compress(
         :param max_height: Maximum height for image resizing. Ignored for PDFs.
         :param force_source_text: For PDFs, whether to force compression even if source text is present.
         :param disable_source_text: For PDFs, whether to disable source text during compression.
+        :param max_workers: For PDFs, maximum number of threads encoding pages.
+        :param target_bytes: Size the compressed file should fit in. The highest
+            quality fitting in it is searched for, ``quality`` being the highest tried.
+        :param render_options: For PDFs, resolution and color of the rendered pages.
         """
         new_file_bytes: bytes
         if self.is_pdf():
             new_file_bytes = compress_pdf(
-                self.file_object, quality, force_source_text, disable_source_text
+                self.file_object,
+                quality,
+                force_source_text,
+                disable_source_text,
+                max_workers,
+                target_bytes,
+                render_options,
             )
         else:
             new_file_bytes = compress_image(
-                self.file_object, quality, max_width, max_height
+                self.file_object, quality, max_width, max_height, target_bytes
             )
 
         self.file_object = io.BytesIO(new_file_bytes)
+        self._image_pdf = None
 
     def __enter__(self):
         """Allows the class to be used as a context manager."""
@@ -280,5 +369,4 @@ def __enter__(self):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Ensures the file is closed when the context block exits."""
-        if self.file_object and not self.file_object.closed:
-            self.file_object.close()
+        self.close()
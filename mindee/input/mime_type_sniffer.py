@@ -0,0 +1,91 @@
+import io
+import mimetypes
+from typing import BinaryIO
+
+SNIFF_SIZE = 4096
+"""Number of bytes read at the start of a file to detect its type."""
+PDF_SIGNATURE = b"%PDF-"
+"""Tag opening a PDF file."""
+PDF_SIGNATURE_MAX_OFFSET = 1024
+"""Furthest offset at which PDF readers accept the PDF tag."""
+
+_SIGNATURES: tuple[tuple[int, bytes, str], ...] = (
+    (0, b"\x89PNG\r\n\x1a\n", "image/png"),
+    (0, b"\xff\xd8\xff", "image/jpeg"),
+    (0, b"II*\x00", "image/tiff"),
+    (0, b"MM\x00*", "image/tiff"),
+    (8, b"WEBP", "image/webp"),
+    *((4, b"ftyp" + brand, "image/heic") for brand in (b"heic", b"heix", b"hevc")),
+    *((4, b"ftyp" + brand, "image/heif") for brand in (b"mif1", b"msf1", b"heif")),
+)
+"""Offset, magic bytes and MIME type of each recognized image format."""
+_HEIF_MIME_TYPES = frozenset({"image/heic", "image/heif"})
+
+
+def _read_header(file_object: BinaryIO, size: int) -> bytes:
+    """
+    Read the start of a file, leaving its position unchanged.
+
+    :param file_object: File to read.
+    :param size: Maximum number of bytes to read.
+    :return: The bytes read, empty if the file cannot be rewound.
+    """
+    try:
+        position = file_object.tell()
+        file_object.seek(0)
+        header = file_object.read(size)
+        file_object.seek(position)
+    except (io.UnsupportedOperation, OSError):
+        return b""
+    return header
+
+
+def sniff_mime_type(file_object: BinaryIO) -> str | None:
+    """
+    Detect the MIME type of a file from its first bytes.
+
+    Only the types accepted by the API are detected.
+
+    :param file_object: File to inspect, its position is left unchanged.
+    :return: The MIME type, ``None`` if it was not recognized.
+    """
+    header = _read_header(file_object, SNIFF_SIZE)
+    for offset, signature, mime_type in _SIGNATURES:
+        if header[offset : offset + len(signature)] == signature:
+            return mime_type
+    if PDF_SIGNATURE in header[: PDF_SIGNATURE_MAX_OFFSET + len(PDF_SIGNATURE)]:
+        return "application/pdf"
+    return None
+
+
+def get_mime_type(file_object: BinaryIO, filename: str) -> str | None:
+    """
+    MIME type of a file, detected from its contents, or else from its name.
+
+    HEIC and HEIF files share the same container, the extension tells them apart
+    when it is one of the two.
+
+    :param file_object: File to inspect, its position is left unchanged.
+    :param filename: Name of the file.
+    :return: The MIME type, ``None`` if it could not be determined.
+    """
+    guessed_mime_type = mimetypes.guess_type(filename)[0]
+    sniffed_mime_type = sniff_mime_type(file_object)
+    if sniffed_mime_type in _HEIF_MIME_TYPES and guessed_mime_type in _HEIF_MIME_TYPES:
+        return guessed_mime_type
+    return sniffed_mime_type or guessed_mime_type
+
+
+def find_pdf_signature(file_object: BinaryIO, maximum_offset: int) -> int:
+    """
+    Find the offset of the PDF tag, reading only the start of the file.
+
+    :param file_object: File to inspect, its position is left unchanged.
+    :param maximum_offset: Offset after which the tag is not searched for,
+        at least ``SNIFF_SIZE`` bytes are searched.
+    :return: The offset of the tag, -1 if it was not found.
+    """
+    header = _read_header(
+        file_object, max(maximum_offset, SNIFF_SIZE) + len(PDF_SIGNATURE)
+    )
+    return header.find(PDF_SIGNATURE)
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import BinaryIO
 
 from mindee.input.local_input_source import LocalInputSource
 
@@ -7,13 +8,63 @@
 class PathInput(LocalInputSource):
     """A local path input."""
 
-    def __init__(self, filepath: Path | str) -> None:
+    _file_object: BinaryIO | None
+    _path: str
+    _lazy: bool
+
+    def __init__(self, filepath: Path | str, lazy: bool = False) -> None:
         """
         Input document from a path.
 
         :param filepath: Path to open
+        :param lazy: Whether to only open the file when it is used.
+            Its type is still checked, then the file is closed until needed.
         """
-        self.file_object = open(filepath, "rb")  # noqa: SIM115 # pylint: disable=consider-using-with
+        self._file_object = None
+        self._lazy = lazy
         self.filename = os.path.basename(Path(filepath))
         self.filepath = str(filepath)
+        self._path = self.filepath
         super().__init__()
+        if lazy:
+            self.close()
+
+    @property
+    def file_object(self) -> BinaryIO:
+        """The file, opened on first access."""
+        if self._file_object is None:
+            self._file_object = open(self._path, "rb")  # noqa: SIM115 # pylint: disable=consider-using-with
+        return self._file_object
+
+    @file_object.setter
+    def file_object(self, file_object: BinaryIO) -> None:
+        self._file_object = file_object
+
+    def _count_pages(self) -> int:
+        """
+        Count the pages of the document.
+
+        A lazy input's file is closed again if it was only opened to count pages.
+
+        :return: The number of pages.
+        """
+        was_open = self._file_object is not None
+        try:
+            return super()._count_pages()
+        finally:
+            if self._lazy and not was_open:
+                self.close()
+
+    def close(self) -> None:
+        """
+        Allow explicit closing for users not using a context manager.
+
+        A lazy input reopens its file when used again, unless its contents were
+        replaced.
+        """
+        if self._file_object is None:
+            return
+        if not self._file_object.closed:
+            self._file_object.close()
+        if self._lazy and getattr(self._file_object, "name", None) == self._path:
+            self._file_object = None
@@ -1,11 +1,27 @@
+from mindee.mindee_http.rate_limiter import (
+    BucketLimit,
+    FileRateLimiter,
+    RateLimiter,
+    TokenBucketRateLimiter,
+)
 from mindee.mindee_http.response_validation import (
     clean_request_json,
     is_valid_async_response,
     is_valid_sync_response,
 )
+from mindee.mindee_http.retry_after import get_retry_after
+from mindee.mindee_http.retry_policy import RetryBudget, RetryMetrics, RetryPolicy
 
 __all__ = [
+    "BucketLimit",
+    "FileRateLimiter",
+    "RateLimiter",
+    "RetryBudget",
+    "RetryMetrics",
+    "RetryPolicy",
+    "TokenBucketRateLimiter",
     "clean_request_json",
+    "get_retry_after",
     "is_valid_async_response",
     "is_valid_sync_response",
 ]
@@ -0,0 +1,78 @@
+import threading
+
+import httpx
+
+from mindee.client_options.http_options import HTTPOptions
+from mindee.logger import logger
+from mindee.mindee_http.rate_limiter import OTHER_BUCKET
+from mindee.mindee_http.retry_policy import IDEMPOTENT_METHODS
+
+
+class HTTPClientMixin:
+    """Mixin holding a pooled HTTP client, created on the first request."""
+
+    http_client: httpx.Client | None
+    """HTTP client for making requests."""
+    http_options: HTTPOptions
+    """Options used when creating the HTTP client."""
+    _http_client_lock = threading.Lock()
+    """Serializes the creation of HTTP clients by concurrent requests."""
+
+    def _get_http_client(self, request_timeout: float) -> httpx.Client:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        Connections are kept alive between requests,
+        so polling does not pay a new handshake on every call.
+
+        :param request_timeout: Timeout to use if the client has to be created.
+        :return: An open HTTP client.
+        """
+        http_client = self.http_client
+        if http_client is not None and not http_client.is_closed:
+            return http_client
+        with self._http_client_lock:
+            # Another thread may have created the client while this one waited.
+            if self.http_client is None or self.http_client.is_closed:
+                logger.debug("Creating pooled HTTP client")
+                self.http_client = httpx.Client(
+                    **self.http_options.get_client_kwargs(request_timeout)
+                )
+            return self.http_client
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        request_timeout: float,
+        bucket: str = OTHER_BUCKET,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Send a request through the shared HTTP client, retrying it when allowed.
+
+        Each attempt waits for the rate limiter, if one is set.
+
+        :param method: HTTP method of the request.
+        :param url: URL of the request.
+        :param request_timeout: Timeout to use if the client has to be created.
+        :param bucket: Rate limiting bucket of the request.
+        :param kwargs: Additional arguments passed to ``httpx.Client.request``.
+        :return: The last response received.
+        """
+        http_client = self._get_http_client(request_timeout)
+        rate_limiter = self.http_options.rate_limiter
+
+        def send() -> httpx.Response:
+            if rate_limiter:
+                rate_limiter.acquire(bucket)
+            return http_client.request(method, url, **kwargs)
+
+        return self.http_options.retry_policy.send(
+            send, idempotent=method in IDEMPOTENT_METHODS
+        )
+
+    def close(self) -> None:
+        """Closes the underlying HTTP client."""
+        if self.http_client and not self.http_client.is_closed:
+            self.http_client.close()
@@ -0,0 +1,222 @@
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from mindee.error.mindee_error import MindeeClientError
+from mindee.logger import logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover, not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+ENQUEUE_BUCKET = "enqueue"
+"""Bucket for requests sending a document."""
+POLLING_BUCKET = "polling"
+"""Bucket for requests polling the status of a job."""
+RESULT_BUCKET = "result"
+"""Bucket for requests fetching the result of a job."""
+OTHER_BUCKET = "other"
+"""Bucket for all other requests."""
+
+
+class BucketLimit:
+    """Rate limit of a single bucket."""
+
+    rate_per_sec: float
+    """Number of requests allowed per second, on average."""
+    burst: int
+    """Number of requests which can be sent at once, after a pause."""
+
+    def __init__(self, rate_per_sec: float, burst: int = 1) -> None:
+        """
+        Rate limit of a single bucket.
+
+        :param rate_per_sec: Number of requests allowed per second, on average.
+        :param burst: Number of requests which can be sent at once, after a pause.
+        """
+        if rate_per_sec <= 0:
+            raise MindeeClientError("Rate limit must be greater than 0.")
+        if burst < 1:
+            raise MindeeClientError("Rate limit burst cannot be less than 1.")
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+
+    def take(self, tokens: float, updated_at: float, now: float) -> tuple[float, float]:
+        """
+        Take a token from the bucket, going into debt if it is empty.
+
+        :param tokens: Tokens in the bucket at ``updated_at``.
+        :param updated_at: Time of the last update of the bucket.
+        :param now: Current time.
+        :return: Tokens left in the bucket, and the time to wait before sending.
+        """
+        elapsed = max(now - updated_at, 0)
+        tokens = min(float(self.burst), tokens + elapsed * self.rate_per_sec) - 1
+        if tokens >= 0:
+            return tokens, 0.0
+        return tokens, -tokens / self.rate_per_sec
+
+
+class RateLimiter(ABC):
+    """
+    Limits the rate of requests sent to the API, per bucket.
+
+    Requests are classified in buckets: enqueueing, job polling, result fetching,
+    and other requests.
+    Buckets without a limit are not rate limited.
+    """
+
+    limits: dict[str, BucketLimit]
+    """Limit of each bucket."""
+    default_limit: BucketLimit | None
+    """Limit of buckets not listed in ``limits``."""
+
+    def __init__(
+        self,
+        limits: dict[str, BucketLimit] | None = None,
+        default_limit: BucketLimit | None = None,
+    ) -> None:
+        """
+        Limits the rate of requests sent to the API, per bucket.
+
+        :param limits: Limit of each bucket.
+        :param default_limit: Limit of buckets not listed in ``limits``.
+        """
+        self.limits = limits or {}
+        self.default_limit = default_limit
+
+    def get_limit(self, bucket: str) -> BucketLimit | None:
+        """
+        Limit of a bucket.
+
+        :param bucket: Name of the bucket.
+        :return: The limit, ``None`` if the bucket is not rate limited.
+        """
+        return self.limits.get(bucket, self.default_limit)
+
+    @abstractmethod
+    def reserve(self, bucket: str) -> float:
+        """
+        Reserve a slot for a request, without waiting.
+
+        :param bucket: Name of the bucket.
+        :return: Time to wait before sending the request, in seconds.
+        """
+
+    def acquire(self, bucket: str) -> None:
+        """
+        Wait until a request can be sent.
+
+        :param bucket: Name of the bucket.
+        """
+        wait_sec = self.reserve(bucket)
+        if wait_sec > 0:
+            logger.debug("Rate limited on '%s', waiting %.2fs", bucket, wait_sec)
+            time.sleep(wait_sec)
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """
+    In-process rate limiter, using a token bucket per bucket name.
+
+    Safe to share between threads and clients.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, BucketLimit] | None = None,
+        default_limit: BucketLimit | None = None,
+    ) -> None:
+        """
+        In-process rate limiter, using a token bucket per bucket name.
+
+        :param limits: Limit of each bucket.
+        :param default_limit: Limit of buckets not listed in ``limits``.
+        """
+        super().__init__(limits, default_limit)
+        self._state: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, bucket: str) -> float:
+        limit = self.get_limit(bucket)
+        if not limit:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated_at = self._state.get(bucket, (float(limit.burst), now))
+            tokens, wait_sec = limit.take(tokens, updated_at, now)
+            self._state[bucket] = (tokens, now)
+        return wait_sec
+
+
+class FileRateLimiter(RateLimiter):
+    """
+    Rate limiter sharing its buckets between processes on the same host.
+
+    The state of the buckets is kept in a small JSON file, locked with ``fcntl``
+    on each reservation.
+    All processes using the same file share the same budget.
+    Only available on POSIX systems.
+    """
+
+    path: Path
+    """Path of the file holding the state of the buckets."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        limits: dict[str, BucketLimit] | None = None,
+        default_limit: BucketLimit | None = None,
+    ) -> None:
+        """
+        Rate limiter sharing its buckets between processes on the same host.
+
+        :param path: Path of the file holding the state of the buckets.
+            It is created if needed.
+        :param limits: Limit of each bucket.
+        :param default_limit: Limit of buckets not listed in ``limits``.
+        """
+        if fcntl is None:
+            raise MindeeClientError(
+                "File-based rate limiting is not available on this platform."
+            )
+        super().__init__(limits, default_limit)
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def reserve(self, bucket: str) -> float:
+        limit = self.get_limit(bucket)
+        if not limit:
+            return 0.0
+        with (
+            self._lock,
+            open(
+                os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600),
+                "r+",
+                encoding="utf-8",
+            ) as state_file,
+        ):
+            fcntl.flock(state_file, fcntl.LOCK_EX)
+            try:
+                try:
+                    state = json.loads(state_file.read() or "{}")
+                except json.JSONDecodeError:
+                    logger.warning(
+                        "Resetting invalid rate limiter state: %s", self.path
+                    )
+                    state = {}
+                now = time.time()
+                tokens, updated_at = state.get(bucket, (float(limit.burst), now))
+                tokens, wait_sec = limit.take(tokens, updated_at, now)
+                state[bucket] = (tokens, now)
+                state_file.seek(0)
+                state_file.truncate()
+                state_file.write(json.dumps(state))
+                state_file.flush()
+            finally:
+                fcntl.flock(state_file, fcntl.LOCK_UN)
+        return wait_sec
@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+
+def get_retry_after(response: httpx.Response) -> float | None:
+    """
+    Read the delay requested by the server in the ``Retry-After`` header.
+
+    Both formats of the header are supported: a number of seconds, or an HTTP date.
+
+    :param response: an httpx response object.
+    :return: Delay in seconds, ``None`` if the header is absent or invalid.
+    """
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
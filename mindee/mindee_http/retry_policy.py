@@ -0,0 +1,355 @@
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from mindee.logger import logger
+from mindee.mindee_http.retry_after import get_retry_after
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+"""HTTP methods which can safely be sent more than once."""
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+"""Status codes for which an idempotent request is retried."""
+CONNECTION_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+"""Errors raised before the request reached the server, always safe to retry."""
+
+
+class RetryMetrics:
+    """Counters and latencies of the requests sent through a retry policy."""
+
+    request_count: int
+    """Number of logical requests, not counting retries."""
+    attempt_count: int
+    """Number of attempts, including retries."""
+    retry_count: int
+    """Number of retries."""
+    retries_by_reason: dict[str, int]
+    """Number of retries, by status code or exception name."""
+    budget_exhausted_count: int
+    """Number of retries refused because the retry budget was spent."""
+    total_latency_sec: float
+    """Total time spent waiting for responses, over all attempts."""
+    total_wait_sec: float
+    """Total time spent sleeping between attempts."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Set all counters back to zero."""
+        with self._lock:
+            self.request_count = 0
+            self.attempt_count = 0
+            self.retry_count = 0
+            self.retries_by_reason = {}
+            self.budget_exhausted_count = 0
+            self.total_latency_sec = 0.0
+            self.total_wait_sec = 0.0
+
+    def record_request(self) -> None:
+        """Record a new logical request."""
+        with self._lock:
+            self.request_count += 1
+
+    def record_attempt(self, latency_sec: float) -> None:
+        """
+        Record a single attempt.
+
+        :param latency_sec: Time taken by the attempt.
+        """
+        with self._lock:
+            self.attempt_count += 1
+            self.total_latency_sec += latency_sec
+
+    def record_retry(self, reason: str, wait_sec: float) -> None:
+        """
+        Record a retry.
+
+        :param reason: Status code or exception name which triggered the retry.
+        :param wait_sec: Time waited before the retry.
+        """
+        with self._lock:
+            self.retry_count += 1
+            self.retries_by_reason[reason] = self.retries_by_reason.get(reason, 0) + 1
+            self.total_wait_sec += wait_sec
+
+    def record_budget_exhausted(self) -> None:
+        """Record a retry refused by the retry budget."""
+        with self._lock:
+            self.budget_exhausted_count += 1
+
+    @property
+    def average_latency_sec(self) -> float:
+        """Average time taken by a single attempt."""
+        with self._lock:
+            if not self.attempt_count:
+                return 0.0
+            return self.total_latency_sec / self.attempt_count
+
+    def __str__(self) -> str:
+        return (
+            f"requests: {self.request_count}, attempts: {self.attempt_count}, "
+            f"retries: {self.retry_count} {self.retries_by_reason}, "
+            f"budget exhausted: {self.budget_exhausted_count}, "
+            f"average latency: {self.average_latency_sec:.3f}s"
+        )
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of the requests sent over a sliding window.
+
+    Prevents retries from piling up on a server which is already struggling.
+    """
+
+    ratio: float
+    """Maximum number of retries per request sent, over the window."""
+    min_retries: int
+    """Retries always allowed over the window, regardless of the ratio."""
+    window_sec: float
+    """Duration of the sliding window."""
+
+    def __init__(
+        self, ratio: float = 0.2, min_retries: int = 10, window_sec: float = 10
+    ) -> None:
+        """
+        Limits retries to a fraction of the requests sent over a sliding window.
+
+        :param ratio: Maximum number of retries per request sent, over the window.
+        :param min_retries: Retries always allowed over the window.
+        :param window_sec: Duration of the sliding window.
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window_sec = window_sec
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        for timestamps in (self._requests, self._retries):
+            while timestamps and timestamps[0] < now - self.window_sec:
+                timestamps.popleft()
+
+    def record_request(self) -> None:
+        """Record a new logical request."""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._requests.append(now)
+
+    def try_spend(self) -> bool:
+        """
+        Spend a retry from the budget.
+
+        :return: ``True`` if the retry is allowed.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            allowed = self.min_retries + self.ratio * len(self._requests)
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+
+class RetryPolicy:
+    """
+    Retries failed requests with an exponential backoff and random jitter.
+
+    Idempotent requests are retried on connection errors and on transient status
+    codes. Other requests, such as enqueueing a document, are only retried when
+    they could not reach the server.
+    The ``Retry-After`` header sent by the server takes precedence over the backoff.
+
+    Subclass and override ``is_retryable`` or ``get_delay`` to customize the policy.
+    """
+
+    max_retries: int
+    """Maximum number of retries for a single request, 0 disables retries."""
+    base_delay_sec: float
+    """Delay before the first retry, doubled on each retry."""
+    max_delay_sec: float
+    """Ceiling for the delay between two attempts."""
+    max_retry_after_sec: float
+    """Longest ``Retry-After`` delay honored, a longer one is not retried."""
+    retryable_status_codes: frozenset[int]
+    """Status codes for which an idempotent request is retried."""
+    budget: RetryBudget | None
+    """Shared limit on the number of retries, if any."""
+    metrics: RetryMetrics
+    """Counters and latencies of the requests sent through this policy."""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay_sec: float = 0.5,
+        max_delay_sec: float = 20,
+        max_retry_after_sec: float = 60,
+        retryable_status_codes: frozenset[int] = RETRYABLE_STATUS_CODES,
+        budget: RetryBudget | None = None,
+    ) -> None:
+        """
+        Retries failed requests with an exponential backoff and random jitter.
+
+        :param max_retries: Maximum number of retries for a single request.
+        :param base_delay_sec: Delay before the first retry, doubled on each retry.
+        :param max_delay_sec: Ceiling for the delay between two attempts.
+        :param max_retry_after_sec: Longest ``Retry-After`` delay honored.
+        :param retryable_status_codes: Status codes for which an idempotent request
+            is retried.
+        :param budget: Shared limit on the number of retries,
+            defaults to 20% of the requests sent over 10 seconds.
+        """
+        self.max_retries = max_retries
+        self.base_delay_sec = base_delay_sec
+        self.max_delay_sec = max_delay_sec
+        self.max_retry_after_sec = max_retry_after_sec
+        self.retryable_status_codes = retryable_status_codes
+        self.budget = budget if budget is not None else RetryBudget()
+        self.metrics = RetryMetrics()
+
+    def is_retryable(
+        self,
+        idempotent: bool,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> bool:
+        """
+        Whether a failed attempt can be retried.
+
+        :param idempotent: Whether the request can safely be sent more than once.
+        :param response: Response of the attempt, if one was received.
+        :param error: Error raised by the attempt, if any.
+        """
+        if error is not None:
+            if isinstance(error, CONNECTION_ERRORS):
+                return True
+            return idempotent and isinstance(error, httpx.TransportError)
+        if response is not None:
+            return idempotent and response.status_code in self.retryable_status_codes
+        return False
+
+    def get_delay(
+        self, retry_number: int, response: httpx.Response | None = None
+    ) -> float | None:
+        """
+        Delay before the next attempt.
+
+        :param retry_number: Number of the upcoming retry, starting at 1.
+        :param response: Response of the failed attempt, if one was received.
+        :return: Delay in seconds, ``None`` to stop retrying.
+        """
+        retry_after = get_retry_after(response) if response is not None else None
+        if retry_after is not None:
+            if retry_after > self.max_retry_after_sec:
+                return None
+            return retry_after
+        ceiling = min(self.max_delay_sec, self.base_delay_sec * 2 ** (retry_number - 1))
+        return random.uniform(0, ceiling)
+
+    def _next_delay(
+        self,
+        retry_number: int,
+        idempotent: bool,
+        response: httpx.Response | None,
+        error: Exception | None,
+    ) -> float | None:
+        """Decide whether to retry a failed attempt, and record the retry."""
+        if retry_number > self.max_retries:
+            return None
+        if not self.is_retryable(idempotent, response, error):
+            return None
+        delay = self.get_delay(retry_number, response)
+        if delay is None:
+            return None
+        if self.budget and not self.budget.try_spend():
+            self.metrics.record_budget_exhausted()
+            logger.debug("Retry budget exhausted, not retrying.")
+            return None
+        if error is not None:
+            reason = type(error).__name__
+        else:
+            reason = str(response.status_code) if response is not None else "unknown"
+        self.metrics.record_retry(reason, delay)
+        logger.debug(
+            "Retrying request (%s/%s) in %.2fs after: %s",
+            retry_number,
+            self.max_retries,
+            delay,
+            reason,
+        )
+        return delay
+
+    def _start_request(self) -> None:
+        self.metrics.record_request()
+        if self.budget:
+            self.budget.record_request()
+
+    def send(
+        self, request: Callable[[], httpx.Response], idempotent: bool
+    ) -> httpx.Response:
+        """
+        Send a request, retrying it according to the policy.
+
+        :param request: Function sending the request.
+        :param idempotent: Whether the request can safely be sent more than once.
+        :return: The last response received.
+        """
+        self._start_request()
+        retry_number = 0
+        while True:
+            retry_number += 1
+            start = time.monotonic()
+            try:
+                response = request()
+            except httpx.TransportError as e:
+                self.metrics.record_attempt(time.monotonic() - start)
+                delay = self._next_delay(retry_number, idempotent, None, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            self.metrics.record_attempt(time.monotonic() - start)
+            delay = self._next_delay(retry_number, idempotent, response, None)
+            if delay is None:
+                return response
+            response.close()
+            time.sleep(delay)
+
+    async def send_async(
+        self, request: Callable[[], Awaitable[httpx.Response]], idempotent: bool
+    ) -> httpx.Response:
+        """
+        Send an asynchronous request, retrying it according to the policy.
+
+        :param request: Function returning the awaitable sending the request.
+        :param idempotent: Whether the request can safely be sent more than once.
+        :return: The last response received.
+        """
+        self._start_request()
+        retry_number = 0
+        while True:
+            retry_number += 1
+            start = time.monotonic()
+            try:
+                response = await request()
+            except httpx.TransportError as e:
+                self.metrics.record_attempt(time.monotonic() - start)
+                delay = self._next_delay(retry_number, idempotent, None, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            self.metrics.record_attempt(time.monotonic() - start)
+            delay = self._next_delay(retry_number, idempotent, response, None)
+            if delay is None:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
@@ -1,15 +1,25 @@
 from mindee.pdf.pdf_char_data import PDFCharData
 from mindee.pdf.pdf_compressor import compress_pdf
+from mindee.pdf.pdf_page_text import PDFCharStyle, PDFPageText, PDFTextRun
 from mindee.pdf.pdf_utils import (
     extract_text_from_pdf,
+    get_linearized_page_count,
     lerp,
     pdf_has_source_text,
+    render_page,
 )
+from mindee.pdf.render_options import RenderOptions
 
 __all__ = [
     "PDFCharData",
+    "PDFCharStyle",
+    "PDFPageText",
+    "PDFTextRun",
+    "RenderOptions",
     "compress_pdf",
     "extract_text_from_pdf",
+    "get_linearized_page_count",
     "lerp",
     "pdf_has_source_text",
+    "render_page",
 ]
@@ -2,19 +2,28 @@
 
 import io
 import logging
-from ctypes import POINTER, c_char_p, c_ushort
-from threading import RLock
+from collections.abc import Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from ctypes import byref, c_char_p, c_float, c_ushort
 from typing import Any, BinaryIO
 
 from mindee.dependencies.checkers import PILLOW_AVAILABLE, PYPDFIUM2_AVAILABLE
 from mindee.dependencies.decorators import requires_pillow, requires_pypdfium2
-from mindee.image.image_compressor import compress_image
+from mindee.image.image_compressor import (
+    MIN_QUALITY,
+    compress_image,
+    encode_to_target_size,
+)
 from mindee.pdf.pdf_char_data import PDFCharData
+from mindee.pdf.pdf_page_text import PDFPageText, PDFTextRun
 from mindee.pdf.pdf_utils import (
+    PDFIUM_LOCK,
     extract_text_from_pdf,
     lerp,
     pdf_has_source_text,
+    render_page,
 )
+from mindee.pdf.render_options import RenderOptions
 
 if PYPDFIUM2_AVAILABLE:
     # pylint: disable=import-error
@@ -31,23 +40,33 @@
     Image: Any = None  # type: ignore[no-redef] # pylint: disable=invalid-name
 
 logger = logging.getLogger(__name__)
-MIN_QUALITY = 1
 
 
 @requires_pypdfium2
-def compress_pdf(
+def compress_pdf(  # pylint: disable=too-many-locals
     pdf_data: BinaryIO | bytes,
     image_quality: int = 85,
     force_source_text_compression: bool = False,
     disable_source_text: bool = True,
+    max_workers: int | None = None,
+    target_bytes: int | None = None,
+    render_options: RenderOptions | None = None,
 ) -> bytes:
     """
     Compresses each page of a provided PDF buffer.
 
+    Pages are rendered once, then encoded in parallel at each quality step.
+
     :param pdf_data: The input PDF as bytes.
     :param image_quality: Compression quality (70-100 for most JPG images).
     :param force_source_text_compression: If true, attempts to re-write detected text.
     :param disable_source_text: If true, doesn't re-apply source text to the output PDF.
+    :param max_workers: Maximum number of threads encoding pages,
+        defaults to the ``ThreadPoolExecutor`` default.
+    :param target_bytes: Size the compressed PDF should fit in. The quality of each
+        page is then binary-searched, with ``image_quality`` as the highest quality.
+    :param render_options: Resolution and color of the rendered pages,
+        defaults to 72 DPI in color.
     :return: Compressed PDF as bytes.
     """
     if not isinstance(pdf_data, bytes):
@@ -76,7 +95,10 @@ def compress_pdf(
         extract_text_from_pdf(pdf_bytes) if not disable_source_text else None
     )
 
-    compressed_pages = _compress_pdf_pages(pdf_bytes, image_quality)
+    rendered_pages, page_sizes = _render_pages(pdf_bytes, render_options)
+    compressed_pages = _compress_pdf_pages(
+        rendered_pages, len(pdf_bytes), image_quality, max_workers, target_bytes
+    )
 
     if not compressed_pages:
         logger.warning(
@@ -85,7 +107,8 @@ def compress_pdf(
         return pdf_bytes
 
     out_pdf = _collect_images_as_pdf(
-        [compressed_page_image[0] for compressed_page_image in compressed_pages]
+        [compressed_page_image[0] for compressed_page_image in compressed_pages],
+        page_sizes,
     )
 
     if not disable_source_text:
@@ -99,29 +122,41 @@ def compress_pdf(
 
 
 def _compress_pdf_pages(
-    pdf_data: bytes,
+    rendered_pages: list[Image.Image],
+    original_size: int,
     image_quality: int,
+    max_workers: int | None = None,
+    target_bytes: int | None = None,
 ) -> list[tuple[bytes, int, int]] | None:
     """
     Compresses PDF pages and returns an array of compressed page buffers.
 
-    :param pdf_data: The input PDF as bytes.
+    :param rendered_pages: Rendered pages of the input PDF.
+    :param original_size: Size of the input PDF.
     :param image_quality: Initial compression quality.
+    :param max_workers: Maximum number of threads encoding pages.
+    :param target_bytes: Size the compressed PDF should fit in, if any.
     :return: List of compressed page buffers, or None if compression fails.
     """
-    original_size = len(pdf_data)
     image_quality_loop = image_quality
 
-    while image_quality_loop >= MIN_QUALITY:
-        compressed_pages = _compress_pages_with_quality(pdf_data, image_quality_loop)
-        total_compressed_size = sum(len(page) for page in compressed_pages)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if target_bytes is not None:
+            return _compress_pages_to_size(
+                rendered_pages, image_quality, target_bytes, original_size, executor
+            )
+        while image_quality_loop >= MIN_QUALITY:
+            compressed_pages = _compress_pages_with_quality(
+                rendered_pages, image_quality_loop, executor
+            )
+            total_compressed_size = sum(len(page[0]) for page in compressed_pages)
 
-        if _is_compression_successful(
-            total_compressed_size, original_size, image_quality
-        ):
-            return compressed_pages
+            if _is_compression_successful(
+                total_compressed_size, original_size, image_quality
+            ):
+                return compressed_pages
 
-        image_quality_loop -= round(lerp(1, 10, image_quality_loop / 100))
+            image_quality_loop -= round(lerp(1, 10, image_quality_loop / 100))
 
     return None
 
@@ -130,62 +165,227 @@ def _compress_pdf_pages(
 def add_text_to_pdf_page(  # type: ignore
     page: pdfium.PdfPage,
     page_id: int,
-    extracted_text: list[list[PDFCharData]] | None,
+    extracted_text: Sequence[PDFPageText | Sequence[PDFCharData]] | None,
 ) -> None:
     """
     Adds text to a PDF page based on the extracted text data.
 
+    Characters are grouped into runs of a single line and style, each written as
+    one invisible text object stretched over the run's bounds.
+
     :param page: The PDFDocument object.
     :param page_id: The ID of the page.
-    :param extracted_text: List of PDFCharData objects containing text and positioning information.
+    :param extracted_text: Characters of each page, with their font and position,
+        as returned by ``extract_text_from_pdf``.
     """
     if not extracted_text or not extracted_text[page_id]:
         return
+    page_text = extracted_text[page_id]
+    if not isinstance(page_text, PDFPageText):
+        page_text = PDFPageText(page_id, page_text)
 
     height = page.get_height()
-    pdfium_lock = RLock()
-
-    with pdfium_lock:
-        for char_data in extracted_text[page_id]:
-            font_name = c_char_p(char_data.font_name.encode("utf-8"))
-            text_handler = pdfium_c.FPDFPageObj_NewTextObj(
-                page.pdf.raw, font_name, char_data.font_size
+    font_names = [
+        c_char_p(style.font_name.encode("utf-8")) for style in page_text.styles
+    ]
+
+    with PDFIUM_LOCK:
+        for run in page_text.iter_runs():
+            text_object = pdfium_c.FPDFPageObj_NewTextObj(
+                page.pdf.raw,
+                font_names[run.style_index],
+                page_text.styles[run.style_index].font_size,
+            )
+            encoded_text = (run.text + "\0").encode("utf-16-le")
+            pdfium_c.FPDFText_SetText(
+                text_object,
+                (c_ushort * (len(encoded_text) // 2)).from_buffer_copy(encoded_text),
             )
-            char_code = ord(char_data.char)
-            char_code_c_char = c_ushort(char_code)
-            char_ptr = POINTER(c_ushort)(char_code_c_char)
-            pdfium_c.FPDFText_SetText(text_handler, char_ptr)
+            pdfium_c.FPDFTextObj_SetTextRenderMode(
+                text_object, pdfium_c.FPDF_TEXTRENDERMODE_INVISIBLE
+            )
+            scale, x_offset, y_offset = _get_run_transform(text_object, run, height)
             pdfium_c.FPDFPageObj_Transform(
-                text_handler, 1, 0, 0, 1, char_data.left, height - char_data.top
+                text_object, scale, 0, 0, 1, x_offset, y_offset
             )
-            pdfium_c.FPDFPage_InsertObject(page.raw, text_handler)
+            pdfium_c.FPDFPage_InsertObject(page.raw, text_object)
         pdfium_c.FPDFPage_GenerateContent(page.raw)
 
 
+def _get_run_transform(
+    text_object, run: PDFTextRun, page_height: float
+) -> tuple[float, float, float]:
+    """
+    Scale and offsets placing a text object over the run it was made from.
+
+    The object is stretched to the width of the run, and its glyph bounds are
+    aligned with the run's, which puts its baseline on the run's baseline.
+
+    :param text_object: The text object, before it is transformed.
+    :param run: The run of characters.
+    :param page_height: Height of the page.
+    :return: The horizontal scale, and the horizontal and vertical offsets.
+    """
+    left, bottom, right, top = c_float(), c_float(), c_float(), c_float()
+    if not pdfium_c.FPDFPageObj_GetBounds(
+        text_object, byref(left), byref(bottom), byref(right), byref(top)
+    ):
+        return 1.0, run.left, page_height - run.bottom
+    object_width = right.value - left.value
+    run_width = run.right - run.left
+    scale = run_width / object_width if object_width > 0 and run_width > 0 else 1.0
+    return (
+        scale,
+        run.left - scale * left.value,
+        page_height - run.bottom - bottom.value,
+    )
+
+
 @requires_pypdfium2
 @requires_pillow
+def _render_pages(
+    pdf_data: bytes, render_options: RenderOptions | None = None
+) -> tuple[list[Image.Image], list[tuple[float, float]]]:
+    """
+    Renders all pages of a PDF, one after the other since pdfium is not thread-safe.
+
+    :param pdf_data: The input PDF as bytes.
+    :param render_options: Resolution and color of the rendered pages.
+    :return: List of rendered pages, and list of page sizes in PDF points.
+    """
+    pdf_document = pdfium.PdfDocument(pdf_data)
+    try:
+        rendered_pages = []
+        page_sizes = []
+        for page in pdf_document:
+            rendered_pages.append(render_page(page, render_options))
+            page_sizes.append(page.get_size())
+        return rendered_pages, page_sizes
+    finally:
+        pdf_document.close()
+
+
 def _compress_pages_with_quality(
-    pdf_data: bytes,
+    rendered_pages: list[Image.Image],
     image_quality: int,
+    executor: Executor,
 ) -> list[tuple[bytes, int, int]]:
     """
     Compresses pages with a specific quality.
 
-    :param pdf_data: The input PDF as bytes.
+    :param rendered_pages: Rendered pages of the input PDF.
     :param image_quality: Compression quality.
+    :param executor: Executor encoding the pages.
     :return: List of compressed page buffers.
     """
-    pdf_document = pdfium.PdfDocument(pdf_data)
-    compressed_pages = []
-    for page in pdf_document:
-        rasterized_page = _rasterize_page(page, image_quality)
-        compressed_image = compress_image(rasterized_page, image_quality)
-        image = Image.open(io.BytesIO(compressed_image))
-        compressed_pages.append((compressed_image, image.size[0], image.size[1]))
+    return list(
+        executor.map(
+            _compress_page, rendered_pages, [image_quality] * len(rendered_pages)
+        )
+    )
+
+
+def _compress_pages_to_size(
+    rendered_pages: list[Image.Image],
+    image_quality: int,
+    target_bytes: int,
+    original_size: int,
+    executor: Executor,
+) -> list[tuple[bytes, int, int]] | None:
+    """
+    Compresses pages so that the resulting PDF fits in a byte budget.
+
+    Pages are first compressed at the highest quality. If the estimated PDF size is
+    over the budget, it is split between pages in proportion to their size, and
+    each page binary-searches its own quality.
 
+    :param rendered_pages: Rendered pages of the input PDF.
+    :param image_quality: Highest compression quality.
+    :param target_bytes: Size the compressed PDF should fit in.
+    :param original_size: Size of the input PDF.
+    :param executor: Executor encoding the pages.
+    :return: List of compressed page buffers, or None if compression fails.
+    """
+    compressed_pages = _compress_pages_with_quality(
+        rendered_pages, image_quality, executor
+    )
+    overhead = 1 + lerp(0.54, 0.18, image_quality / 100)
+    total_compressed_size = sum(len(page[0]) for page in compressed_pages)
+    if total_compressed_size * overhead > target_bytes:
+        budget_ratio = target_bytes / overhead / total_compressed_size
+        compressed_pages = list(
+            executor.map(
+                _compress_page_to_size,
+                rendered_pages,
+                [image_quality - 1] * len(rendered_pages),
+                [int(len(page[0]) * budget_ratio) for page in compressed_pages],
+            )
+        )
+        total_compressed_size = sum(len(page[0]) for page in compressed_pages)
+    if not _is_compression_successful(
+        total_compressed_size, original_size, image_quality
+    ):
+        return None
     return compressed_pages
 
 
+def _encode_page(rendered_page: Image.Image, image_quality: int) -> bytes:
+    """
+    Encodes a single rendered page as a compressed JPEG.
+
+    :param rendered_page: Rendered page.
+    :param image_quality: Compression quality.
+    :return: The compressed page buffer.
+    """
+    rasterized_page = _rasterize_page(rendered_page, image_quality)
+    return compress_image(rasterized_page, image_quality)
+
+
+@requires_pillow
+def _with_image_size(compressed_image: bytes) -> tuple[bytes, int, int]:
+    """
+    Adds the width and height of a compressed page to its buffer.
+
+    :param compressed_image: The compressed page buffer.
+    :return: The compressed page buffer, with its width and height.
+    """
+    with Image.open(io.BytesIO(compressed_image)) as image:
+        return compressed_image, image.size[0], image.size[1]
+
+
+def _compress_page(
+    rendered_page: Image.Image, image_quality: int
+) -> tuple[bytes, int, int]:
+    """
+    Compresses a single rendered page.
+
+    :param rendered_page: Rendered page.
+    :param image_quality: Compression quality.
+    :return: The compressed page buffer, with its width and height.
+    """
+    return _with_image_size(_encode_page(rendered_page, image_quality))
+
+
+def _compress_page_to_size(
+    rendered_page: Image.Image, max_quality: int, target_bytes: int
+) -> tuple[bytes, int, int]:
+    """
+    Compresses a single rendered page at the highest quality fitting in a budget.
+
+    :param rendered_page: Rendered page.
+    :param max_quality: Highest compression quality to try.
+    :param target_bytes: Maximum size of the compressed page.
+    :return: The compressed page buffer, with its width and height.
+    """
+    return _with_image_size(
+        encode_to_target_size(
+            lambda quality: _encode_page(rendered_page, quality),
+            target_bytes,
+            max_quality,
+        )
+    )
+
+
 def _is_compression_successful(
     total_compressed_size: int, original_size: int, image_quality: int
 ) -> bool:
@@ -201,40 +401,47 @@ def _is_compression_successful(
     return total_compressed_size + total_compressed_size * overhead < original_size
 
 
-@requires_pypdfium2
-def _rasterize_page(  # type: ignore
-    page: pdfium.PdfPage,
+@requires_pillow
+def _rasterize_page(
+    rendered_page: Image.Image,
     quality: int = 85,
 ) -> bytes:
     """
-    Rasterizes a PDF page.
+    Rasterizes a rendered PDF page.
 
-    :param page: PdfPage object to rasterize.
+    :param rendered_page: Rendered page to rasterize.
     :param quality: Quality to apply during rasterization.
     :return: Rasterized page as bytes.
     """
-    image = page.render().to_pil()
     buffer = io.BytesIO()
-    image.save(buffer, format="JPEG", quality=quality)
+    rendered_page.save(buffer, format="JPEG", quality=quality)
     return buffer.getvalue()
 
 
 @requires_pypdfium2
-def _collect_images_as_pdf(image_list: list[bytes]) -> pdfium.PdfDocument:  # type: ignore
+def _collect_images_as_pdf(  # type: ignore
+    image_list: list[bytes], page_sizes: list[tuple[float, float]] | None = None
+) -> pdfium.PdfDocument:
     """
     Converts a list of JPEG images into pages in a PdfDocument.
 
     :param image_list: A list of bytes representing JPEG images.
+    :param page_sizes: Size of each page in PDF points, defaults to the size of
+        each image in pixels.
     :return: A PdfDocument handle containing the images as pages.
     """
     out_pdf = pdfium.PdfDocument.new()
 
-    for image_bytes in image_list:
+    for i, image_bytes in enumerate(image_list):
         pdf_image = pdfium.PdfImage.new(out_pdf)
         pdf_image.load_jpeg(io.BytesIO(image_bytes))
 
-        metadata = pdf_image.get_metadata()
-        width, height = metadata.width, metadata.height
+        if page_sizes:
+            width, height = page_sizes[i]
+        else:
+            metadata = pdf_image.get_metadata()
+            width, height = metadata.width, metadata.height
+        pdf_image.set_matrix(pdfium.PdfMatrix().scale(width, height))
         page = out_pdf.new_page(width, height)
         page.insert_obj(pdf_image)
         page.gen_content()
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import ctypes
 import io
+import mmap
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, BinaryIO
 
-from mindee.dependencies.checkers import PILLOW_AVAILABLE, PYPDFIUM2_AVAILABLE
+from mindee.dependencies.checkers import PYPDFIUM2_AVAILABLE
 from mindee.dependencies.decorators import requires_pillow, requires_pypdfium2
 from mindee.error.mindee_error import MindeeError
 from mindee.input.local_input_source import LocalInputSource
+from mindee.input.path_input import PathInput
 from mindee.pdf.extracted_pdf import ExtractedPDF
 from mindee.pdf.extracted_pdfs import ExtractedPDFs
 
@@ -17,51 +21,145 @@
 else:
     pdfium = None  # pylint: disable=invalid-name
 
-if PILLOW_AVAILABLE:
-    # pylint: disable=import-error
-    from PIL import Image
-else:
-    Image: Any = None  # type: ignore[no-redef] # pylint: disable=invalid-name
+
+def chunk_page_indexes(page_count: int, pages_per_chunk: int) -> list[list[int]]:
+    """
+    Split the pages of a document into chunks of consecutive pages.
+
+    :param page_count: Number of pages of the document.
+    :param pages_per_chunk: Maximum number of pages of each chunk.
+    :return: 2D list of page indexes, the last chunk may be shorter.
+    """
+    if pages_per_chunk < 1:
+        raise MindeeError("Chunks must have at least one page.")
+    return [
+        list(range(start, min(start + pages_per_chunk, page_count)))
+        for start in range(0, page_count, pages_per_chunk)
+    ]
+
+
+def _get_unmodified_path(local_input: LocalInputSource) -> str | None:
+    """
+    Path of the file an input source reads from, if its contents were not replaced.
+
+    Page options, page merging, fixing and compression replace ``file_object``
+    with an in-memory file, the file on disk is then out of date.
+
+    :param local_input: Input source to check.
+    :return: The path, or None if the input is not read from its original file.
+    """
+    if not local_input.filepath:
+        return None
+    if getattr(local_input.file_object, "name", None) != local_input.filepath:
+        return None
+    return local_input.filepath
 
 
 class PDFExtractor:
-    """PDF extraction class."""
+    """
+    PDF extraction class.
+
+    The source document is parsed once, on the first extraction, and kept open
+    until the extractor is closed.
+    """
 
     _source_pdf: BinaryIO
     _filename: str
     _page_count: int
+    _source_path: str | None
+    _source_document: Any
+    _source_mmap: mmap.mmap | None
+    _source_view: Any
 
     @requires_pillow
-    def __init__(self, local_input: LocalInputSource):
+    def __init__(self, local_input: LocalInputSource, use_mmap: bool = False):
+        """
+        PDF extraction class.
+
+        :param local_input: Document to extract pages from.
+        :param use_mmap: Whether to memory-map the source file instead of reading it,
+            only used for PDFs read from a path and not modified since.
+        """
         self._filename = local_input.filename
         self._page_count = local_input.page_count
+        self._source_path = None
+        self._source_document = None
+        self._source_mmap = None
+        self._source_view = None
         if local_input.is_pdf():
             self._source_pdf = local_input.file_object
+            if use_mmap:
+                self._source_path = _get_unmodified_path(local_input)
         else:
-            pdf_image = Image.open(local_input.file_object)
-            self._source_pdf = io.BytesIO()
-            pdf_image.save(self._source_pdf, format="PDF")
+            self._source_pdf = io.BytesIO(local_input.image_as_pdf())
 
-    @requires_pypdfium2
-    def extract_single_document(self, page_indexes: list[int]) -> ExtractedPDF:
+    def _get_source_document(self) -> Any:
+        """Parse the source document on first use, then reuse it."""
+        if self._source_document is not None:
+            return self._source_document
+        if self._source_path:
+            with open(self._source_path, "rb") as source_file:
+                # A private mapping is writable, so pdfium can use it without a copy.
+                self._source_mmap = mmap.mmap(
+                    source_file.fileno(), 0, access=mmap.ACCESS_COPY
+                )
+            self._source_view = (ctypes.c_char * len(self._source_mmap)).from_buffer(
+                self._source_mmap
+            )
+            self._source_document = pdfium.PdfDocument(self._source_view)
+        else:
+            self._source_pdf.seek(0)
+            self._source_document = pdfium.PdfDocument(self._source_pdf)
+        return self._source_document
+
+    def close(self) -> None:
+        """Release the parsed source document, and its memory map if any."""
+        if self._source_document is not None:
+            self._source_document.close()
+            self._source_document = None
+        self._source_view = None
+        if self._source_mmap is not None:
+            self._source_mmap.close()
+            self._source_mmap = None
+
+    def __enter__(self) -> PDFExtractor:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        """Release the parsed source document when the extractor is garbage collected."""
+        if getattr(self, "_source_document", None) is not None:
+            self.close()
+
+    def _build_document(self, page_indexes: list[int]) -> Any:
         """
-        Create a new PDF from pages and save it into a buffer.
+        Create a new PDF from pages of the source document.
 
         :param page_indexes: List of pages number to use for merging in the original PDF.
-        :return: The buffer containing the new PDF.
+        :return: The new PdfDocument, to be closed by the caller.
         """
         if not page_indexes or len(page_indexes) == 0:
             raise MindeeError("Empty indexes aren't allowed for extraction.")
         for page_index in page_indexes:
-            if page_index > self._page_count:
+            if not 0 <= page_index < self._page_count:
                 raise MindeeError(f"Index {page_index} is out of range.")
 
-        self._source_pdf.seek(0)
         new_pdf = pdfium.PdfDocument.new()
-        pdf = pdfium.PdfDocument(self._source_pdf)
-        new_pdf.import_pages(pdf, page_indexes)
+        new_pdf.import_pages(self._get_source_document(), page_indexes)
+        return new_pdf
+
+    @requires_pypdfium2
+    def extract_single_document(self, page_indexes: list[int]) -> ExtractedPDF:
+        """
+        Create a new PDF from pages and save it into a buffer.
+
+        :param page_indexes: List of pages number to use for merging in the original PDF.
+        :return: The buffer containing the new PDF.
+        """
         bytes_io = io.BytesIO()
-        new_pdf.save(bytes_io)
+        self.write_single_document(page_indexes, bytes_io)
 
         first_page = page_indexes[0]
         last_page = page_indexes[len(page_indexes) - 1]
@@ -71,6 +169,63 @@ def extract_single_document(self, page_indexes: list[int]) -> ExtractedPDF:
             page_indexes=page_indexes,
         )
 
+    @requires_pypdfium2
+    def write_single_document(
+        self, page_indexes: list[int], output: Path | str | BinaryIO
+    ) -> None:
+        """
+        Create a new PDF from pages and write it straight to a file or a stream.
+
+        :param page_indexes: List of pages number to use for merging in the original PDF.
+        :param output: Path of the file to write, or writable binary stream.
+        """
+        new_pdf = self._build_document(page_indexes)
+        try:
+            new_pdf.save(output)
+        finally:
+            new_pdf.close()
+
+    @requires_pypdfium2
+    def split_to_files(
+        self, output_dir: Path | str, pages_per_chunk: int
+    ) -> Iterator[PathInput]:
+        """
+        Split the source document into chunks of consecutive pages, written to files.
+
+        Chunks are written one at a time, and returned as inputs which only open
+        their file when used, so that memory use does not depend on the size of
+        the document.
+
+        :param output_dir: Directory the chunks are written to.
+        :param pages_per_chunk: Maximum number of pages of each chunk.
+        :return: An iterator over the written chunks.
+        """
+        out_dir = Path(output_dir)
+        if not out_dir.resolve().is_dir():
+            raise MindeeError("Provided path is not a directory.")
+        for chunk_indexes in chunk_page_indexes(self._page_count, pages_per_chunk):
+            out_path = out_dir / self._make_filename(
+                chunk_indexes[0], chunk_indexes[-1]
+            )
+            self.write_single_document(chunk_indexes, out_path)
+            yield PathInput(out_path, lazy=True)
+
+    @requires_pypdfium2
+    def iter_documents(self, page_indexes: list[list[int]]) -> Iterator[ExtractedPDF]:
+        """
+        Extract the sub-documents from the main pdf, one at a time.
+
+        Each PDF is built when requested, so that only the current one needs to be
+        kept in memory.
+
+        :param page_indexes: 2D list of numbers, representing page indexes.
+        :return: An iterator over the created PDFs.
+        """
+        if len(page_indexes) < 1:
+            raise MindeeError("No indexes provided.")
+        for page_index_elem in page_indexes:
+            yield self.extract_single_document(page_index_elem)
+
     @requires_pypdfium2
     def extract_multiple_documents(
         self, page_indexes: list[list[int]]
@@ -81,12 +236,7 @@ def extract_multiple_documents(
         :param page_indexes: 2D list of numbers, representing page indexes.
         :return: A list of created PDFS.
         """
-        if len(page_indexes) < 1:
-            raise MindeeError("No indexes provided.")
-        extracted_pdfs: list[ExtractedPDF] = []
-        for page_index_elem in page_indexes:
-            extracted_pdfs.append(self.extract_single_document(page_index_elem))
-        return ExtractedPDFs(extracted_pdfs)
+        return ExtractedPDFs(self.iter_documents(page_indexes))
 
     def _make_filename(self, first_page: int, last_page: int) -> str:
         stem = Path(self._filename).stem
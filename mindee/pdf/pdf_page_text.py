@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import overload
+
+from mindee.pdf.pdf_char_data import PDFCharData
+
+
+@dataclass(frozen=True)
+class PDFCharStyle:
+    """Font and colors of a character, shared by all characters of a text run."""
+
+    font_name: str
+    """The font name."""
+    font_size: float
+    """The font size in pt."""
+    font_weight: int
+    """The font weight."""
+    font_flags: int
+    """The font flags."""
+    font_stroke_color: tuple[int, int, int, int]
+    """RGBA representation of the font's stroke color."""
+    font_fill_color: tuple[int, int, int, int]
+    """RGBA representation of the font's fill color."""
+
+
+@dataclass(frozen=True)
+class PDFTextRun:
+    """Consecutive characters of a line sharing the same style."""
+
+    text: str
+    """Characters of the run, without leading or trailing whitespace."""
+    style_index: int
+    """Index of the style of the run in the page's ``styles``."""
+    left: int
+    """Left bound of the run."""
+    right: int
+    """Right bound of the run."""
+    top: int
+    """Top bound of the run."""
+    bottom: int
+    """Bottom bound of the run."""
+
+
+class PDFPageText(Sequence[PDFCharData]):
+    """
+    Characters of a PDF page, stored column by column.
+
+    Code points and bounds are kept in compact arrays, and styles in a table
+    where each distinct style is stored once.
+    Indexing or iterating yields ``PDFCharData`` objects, created on the fly.
+    """
+
+    page_id: int
+    """ID of the page the characters were found on."""
+    codepoints: array
+    """Unicode code point of each character."""
+    lefts: array
+    """Left bound of each character."""
+    rights: array
+    """Right bound of each character."""
+    tops: array
+    """Top bound of each character."""
+    bottoms: array
+    """Bottom bound of each character."""
+    style_indexes: array
+    """Index of the style of each character in ``styles``."""
+    styles: list[PDFCharStyle]
+    """Distinct styles of the page."""
+
+    def __init__(self, page_id: int, chars: Iterable[PDFCharData] = ()) -> None:
+        """
+        Characters of a PDF page, stored column by column.
+
+        :param page_id: ID of the page the characters were found on.
+        :param chars: Characters to store.
+        """
+        self.page_id = page_id
+        self.codepoints = array("I")
+        self.lefts = array("i")
+        self.rights = array("i")
+        self.tops = array("i")
+        self.bottoms = array("i")
+        self.style_indexes = array("I")
+        self.styles = []
+        self._style_ids: dict[PDFCharStyle, int] = {}
+        for char in chars:
+            self.append_char_data(char)
+
+    def append(
+        self, codepoint: int, box: tuple[int, int, int, int], style: PDFCharStyle
+    ) -> None:
+        """
+        Add a character.
+
+        :param codepoint: Unicode code point of the character.
+        :param box: Left, right, top and bottom bounds of the character.
+        :param style: Font and colors of the character.
+        """
+        style_index = self._style_ids.get(style)
+        if style_index is None:
+            style_index = len(self.styles)
+            self._style_ids[style] = style_index
+            self.styles.append(style)
+        self.codepoints.append(codepoint)
+        self.lefts.append(box[0])
+        self.rights.append(box[1])
+        self.tops.append(box[2])
+        self.bottoms.append(box[3])
+        self.style_indexes.append(style_index)
+
+    def append_char_data(self, char: PDFCharData) -> None:
+        """
+        Add a character, from its data object.
+
+        :param char: Data of the character.
+        """
+        self.append(
+            ord(char.char),
+            (char.left, char.right, char.top, char.bottom),
+            PDFCharStyle(
+                font_name=char.font_name,
+                font_size=char.font_size,
+                font_weight=char.font_weight,
+                font_flags=char.font_flags,
+                font_stroke_color=tuple(char.font_stroke_color),  # type: ignore[arg-type]
+                font_fill_color=tuple(char.font_fill_color),  # type: ignore[arg-type]
+            ),
+        )
+
+    @property
+    def text(self) -> str:
+        """All characters of the page, as a string."""
+        return "".join(map(chr, self.codepoints))
+
+    def iter_runs(self) -> Iterator[PDFTextRun]:
+        """
+        Group characters into runs of a single line and style.
+
+        A run ends on a line break, or before a character with another style,
+        placed before the previous one, not on the same line, or separated from
+        the previous one by a gap wider than about one character, as between
+        columns or table cells.
+        Characters are on the same line when at least half of the height of the
+        shorter one overlaps the other vertically, since the bounds of tall and
+        short glyphs of a line differ.
+        Whitespace takes the style of the run it is in, and whitespace-only runs
+        are skipped.
+
+        :return: The runs, in reading order.
+        """
+        start: int | None = None
+        end = 0
+        run_chars: list[str] = []
+        run_length = 0
+        for index, codepoint in enumerate(self.codepoints):
+            char = chr(codepoint)
+            if char.isspace():
+                if char in "\r\n" and start is not None:
+                    yield self._make_run(run_chars[:run_length], start, end)
+                    start = None
+                elif start is not None:
+                    run_chars.append(char)
+                continue
+            if start is not None and not self._continues_run(end, index):
+                yield self._make_run(run_chars[:run_length], start, end)
+                start = None
+            if start is None:
+                start = index
+                run_chars = []
+            run_chars.append(char)
+            run_length = len(run_chars)
+            end = index
+        if start is not None:
+            yield self._make_run(run_chars[:run_length], start, end)
+
+    def _continues_run(self, previous: int, index: int) -> bool:
+        return (
+            self.style_indexes[index] == self.style_indexes[previous]
+            and self.lefts[index] >= self.lefts[previous]
+            and self._is_on_same_line(previous, index)
+            and self._is_close_after(previous, index)
+        )
+
+    def _is_close_after(self, previous: int, index: int) -> bool:
+        # Glyph boxes are tight, so the width of a character is approximated by
+        # the largest side of either glyph, and at least half the font size.
+        char_width = max(
+            self.styles[self.style_indexes[index]].font_size / 2,
+            self.rights[index] - self.lefts[index],
+            self.rights[previous] - self.lefts[previous],
+            self.bottoms[index] - self.tops[index],
+            self.bottoms[previous] - self.tops[previous],
+        )
+        return self.lefts[index] - self.rights[previous] <= char_width
+
+    def _is_on_same_line(self, previous: int, index: int) -> bool:
+        overlap = min(self.bottoms[index], self.bottoms[previous]) - max(
+            self.tops[index], self.tops[previous]
+        )
+        shortest = min(
+            self.bottoms[index] - self.tops[index],
+            self.bottoms[previous] - self.tops[previous],
+        )
+        return overlap >= shortest / 2
+
+    def _make_run(self, chars: list[str], start: int, end: int) -> PDFTextRun:
+        return PDFTextRun(
+            text="".join(chars),
+            style_index=self.style_indexes[start],
+            left=self.lefts[start],
+            right=max(self.rights[start : end + 1]),
+            top=min(self.tops[start : end + 1]),
+            bottom=max(self.bottoms[start : end + 1]),
+        )
+
+    def _char_data(self, index: int) -> PDFCharData:
+        style = self.styles[self.style_indexes[index]]
+        return PDFCharData(
+            char=chr(self.codepoints[index]),
+            left=self.lefts[index],
+            right=self.rights[index],
+            top=self.tops[index],
+            bottom=self.bottoms[index],
+            font_name=style.font_name,
+            font_size=style.font_size,
+            font_weight=style.font_weight,
+            font_flags=style.font_flags,
+            font_stroke_color=style.font_stroke_color,
+            font_fill_color=style.font_fill_color,
+            page_id=self.page_id,
+        )
+
+    def __len__(self) -> int:
+        return len(self.codepoints)
+
+    @overload
+    def __getitem__(self, index: int) -> PDFCharData: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[PDFCharData]: ...
+
+    def __getitem__(self, index: int | slice) -> PDFCharData | list[PDFCharData]:
+        if isinstance(index, slice):
+            return [self._char_data(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Character index out of range.")
+        return self._char_data(index)
+
+    def __iter__(self) -> Iterator[PDFCharData]:
+        for index in range(len(self)):
+            yield self._char_data(index)
+
+    def __add__(self, other: Iterable[PDFCharData]) -> list[PDFCharData]:
+        return [*self, *other]
+
+    def __radd__(self, other: Iterable[PDFCharData]) -> list[PDFCharData]:
+        return [*other, *self]
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import ctypes
+import io
+import re
 from ctypes import byref, c_double, c_int, create_string_buffer
 from threading import RLock
-from typing import Any
+from typing import Any, BinaryIO
 
-from mindee.dependencies.checkers import PYPDFIUM2_AVAILABLE
-from mindee.dependencies.decorators import requires_pypdfium2
-from mindee.pdf.pdf_char_data import PDFCharData
+from mindee.dependencies.checkers import PILLOW_AVAILABLE, PYPDFIUM2_AVAILABLE
+from mindee.dependencies.decorators import requires_pillow, requires_pypdfium2
+from mindee.error.mindee_error import MindeeError
+from mindee.pdf.pdf_page_text import PDFCharStyle, PDFPageText
+from mindee.pdf.render_options import RenderOptions
 
 if PYPDFIUM2_AVAILABLE:
     # pylint: disable=import-error
@@ -17,242 +21,363 @@
     pdfium: Any = None  # type: ignore[no-redef] # pylint: disable=invalid-name
     pdfium_c: Any = None  # type: ignore[no-redef] # pylint: disable=invalid-name
 
+if PILLOW_AVAILABLE:
+    # pylint: disable=import-error
+    from PIL import Image
+else:
+    Image: Any = None  # type: ignore[no-redef] # pylint: disable=invalid-name
 
 FALLBACK_FONT = "Helvetica"
+JPEG_PASSTHROUGH_MODES = ("RGB", "L", "CMYK")
+"""Modes of the JPEG images embedded in PDFs as they are, without decoding them."""
+FONT_NAME_BUFFER_LENGTH = 128
+"""Initial size of the buffer receiving font names."""
+_LINE_BREAKS = (ord("\n"), ord("\r"))
+PDFIUM_LOCK = RLock()
+"""pdfium is not thread-safe, text extraction holds this lock for each page."""
+
+LINEARIZATION_HEADER_SIZE = 1024
+"""Number of bytes read at the start of a PDF to find its linearization dictionary."""
+_LINEARIZATION_DICT = re.compile(rb"<<\s*/Linearized\s[^>]*>>")
+_LINEARIZED_LENGTH = re.compile(rb"/L\s+(\d+)")
+_LINEARIZED_PAGE_COUNT = re.compile(rb"/N\s+(\d+)")
+
+
+def get_linearized_page_count(file_object: BinaryIO) -> int | None:
+    """
+    Read the page count of a linearized PDF, without parsing the document.
+
+    Linearized ("fast web view") PDFs start with a dictionary holding their length
+    and page count.
+    The page count is only trusted when the length matches the file, as an
+    incremental update invalidates the dictionary.
+
+    :param file_object: PDF file, its position is left at the start.
+    :return: The number of pages, ``None`` if the PDF is not linearized.
+    """
+    file_object.seek(0)
+    header = file_object.read(LINEARIZATION_HEADER_SIZE)
+    file_size = file_object.seek(0, io.SEEK_END)
+    file_object.seek(0)
+    linearization_dict = _LINEARIZATION_DICT.search(header)
+    if not linearization_dict:
+        return None
+    length = _LINEARIZED_LENGTH.search(linearization_dict.group())
+    page_count = _LINEARIZED_PAGE_COUNT.search(linearization_dict.group())
+    if not length or not page_count or int(length.group(1)) != file_size:
+        return None
+    return int(page_count.group(1))
+
+
+@requires_pypdfium2
+def render_page(page: Any, render_options: RenderOptions | None = None) -> Any:
+    """
+    Renders a PDF page to a Pillow image.
+
+    :param page: PdfPage object to render.
+    :param render_options: Resolution and color options, defaults to 72 DPI in color.
+    :return: The rendered page, as a Pillow image.
+    """
+    if render_options is None:
+        return page.render().to_pil()
+    width, height = page.get_size()
+    return page.render(
+        scale=render_options.get_scale(width, height),
+        grayscale=render_options.grayscale,
+    ).to_pil()
 
 
+@requires_pillow
 @requires_pypdfium2
-def pdf_has_source_text(pdf_bytes: bytes) -> bool:
+def image_to_pdf(image_buffer: BinaryIO) -> bytes:
     """
-    Checks if the provided PDF bytes contain source text.
+    Creates a single-page PDF holding an image, one point per pixel.
 
-    :param pdf_bytes: Raw bytes representation of a PDF file
+    JPEG images are embedded as they are, other images are converted to JPEG.
+
+    :param image_buffer: The image file, its position is left at the start.
+    :return: The PDF as bytes.
+    """
+    image_buffer.seek(0)
+    with Image.open(image_buffer) as image:
+        width, height = image.size
+        if image.format == "JPEG" and image.mode in JPEG_PASSTHROUGH_MODES:
+            jpeg_buffer = image_buffer
+        else:
+            jpeg_buffer = io.BytesIO()
+            if image.mode in ("RGB", "L"):
+                image.save(jpeg_buffer, format="JPEG")
+            else:
+                with image.convert("RGB") as rgb_image:
+                    rgb_image.save(jpeg_buffer, format="JPEG")
+    jpeg_buffer.seek(0)
+
+    pdf = pdfium.PdfDocument.new()
+    try:
+        pdf_image = pdfium.PdfImage.new(pdf)
+        pdf_image.load_jpeg(jpeg_buffer, inline=True, autoclose=False)
+        pdf_image.set_matrix(pdfium.PdfMatrix().scale(width, height))
+        page = pdf.new_page(width, height)
+        page.insert_obj(pdf_image)
+        page.gen_content()
+        page.close()
+        pdf_buffer = io.BytesIO()
+        pdf.save(pdf_buffer)
+    finally:
+        pdf.close()
+        image_buffer.seek(0)
+    return pdf_buffer.getvalue()
+
+
+@requires_pypdfium2
+def pdf_has_source_text(  # type: ignore
+    pdf_data: bytes | BinaryIO | pdfium.PdfDocument, max_pages: int | None = None
+) -> bool:
+    """
+    Checks if the provided PDF contains source text.
+
+    Pages are checked in order, stopping at the first one holding a character
+    other than whitespace.
+
+    :param pdf_data: Raw bytes of a PDF file, a PDF file object, or an open
+        ``PdfDocument`` which is left open. File objects are read in place,
+        and their position is left unchanged.
+    :param max_pages: Only check this number of pages, at the start of the document.
     :return: True if source text is found, False otherwise.
     """
-    pdf = pdfium.PdfDocument(pdf_bytes)
+    if max_pages is not None and max_pages < 1:
+        raise MindeeError("At least one page must be checked for source text.")
+    if isinstance(pdf_data, pdfium.PdfDocument):
+        return _document_has_source_text(pdf_data, max_pages)
 
+    position = pdf_data.tell() if not isinstance(pdf_data, bytes) else 0
+    pdf = pdfium.PdfDocument(pdf_data)
     try:
-        return any(
-            len(page.get_textpage().get_text_bounded().strip()) > 0 for page in pdf
-        )
+        return _document_has_source_text(pdf, max_pages)
     finally:
-        if hasattr(pdf, "close"):
-            pdf.close()
+        pdf.close()
+        if not isinstance(pdf_data, bytes):
+            pdf_data.seek(position)
+
+
+def _document_has_source_text(pdf, max_pages: int | None) -> bool:
+    """
+    Checks if the first pages of an open PDF contain source text.
+
+    :param pdf: The PdfDocument to check.
+    :param max_pages: Number of pages to check, all pages if ``None``.
+    :return: True if source text is found, False otherwise.
+    """
+    page_count = len(pdf) if max_pages is None else min(len(pdf), max_pages)
+    for page_id in range(page_count):
+        page = pdf[page_id]
+        try:
+            if _page_has_source_text(page):
+                return True
+        finally:
+            page.close()
+    return False
+
+
+def _page_has_source_text(page) -> bool:
+    """
+    Checks if a page holds a character other than whitespace.
+
+    Characters are counted first, so that pages without text are not read.
+
+    :param page: The PDF page to check.
+    :return: True if source text is found, False otherwise.
+    """
+    with PDFIUM_LOCK:
+        text_handler = pdfium_c.FPDFText_LoadPage(page.raw)
+        try:
+            return any(
+                not chr(pdfium_c.FPDFText_GetUnicode(text_handler, i)).isspace()
+                for i in range(pdfium_c.FPDFText_CountChars(text_handler))
+            )
+        finally:
+            pdfium_c.FPDFText_ClosePage(text_handler)
 
 
 @requires_pypdfium2
-def extract_text_from_pdf(pdf_bytes: bytes) -> list[list[PDFCharData]]:
+def extract_text_from_pdf(pdf_bytes: bytes) -> list[PDFPageText]:
     """
     Extracts the raw text from a given PDF's bytes along with font data.
 
     :param pdf_bytes: Raw bytes representation of a PDF file.
-    :return: A list of info regarding each read character.
+    :return: The characters of each page, iterating over a page yields ``PDFCharData``.
     """
-    pdfium_lock = RLock()
     pdf = pdfium.PdfDocument(pdf_bytes)
-    char_data_list: list[list[PDFCharData]] = []
-
-    for i, page in enumerate(pdf):
-        char_data_list.append(_process_page(page, i, pdfium_lock))
-
-    return char_data_list
+    try:
+        return [_process_page(page, i) for i, page in enumerate(pdf)]
+    finally:
+        pdf.close()
 
 
 @requires_pypdfium2
-def _process_page(page, page_id: int, pdfium_lock: RLock) -> list[PDFCharData]:
+def _process_page(page, page_id: int) -> PDFPageText:
     """
     Processes a single page of the PDF.
 
+    The pdfium lock is taken once for the whole page.
+
     :param page: The PDF page to process.
     :param page_id: ID of the page.
-    :param pdfium_lock: Lock for thread-safe operations.
+    :return: Characters of the page.
     """
-    char_data_list: list[PDFCharData] = []
     internal_height = page.get_height()
     internal_width = page.get_width()
 
-    with pdfium_lock:
+    with PDFIUM_LOCK:
+        rotation = _get_page_rotation(page)
         text_handler = pdfium_c.FPDFText_LoadPage(page.raw)
-        count_chars = pdfium_c.FPDFText_CountChars(text_handler)
-
-    for i in range(count_chars):
-        concatenated_chars = _process_char(
-            i, text_handler, page, pdfium_lock, internal_height, internal_width, page_id
-        )
-        for concatenated_char in concatenated_chars:
-            char_data_list.append(concatenated_char)
-
-    with pdfium_lock:
-        pdfium_c.FPDFText_ClosePage(text_handler)
-    return char_data_list
+        try:
+            return _process_text_page(
+                text_handler, rotation, internal_height, internal_width, page_id
+            )
+        finally:
+            pdfium_c.FPDFText_ClosePage(text_handler)
 
 
-@requires_pypdfium2
-def _process_char(
-    i: int,
+def _process_text_page(
     text_handler,
-    page,
-    pdfium_lock: RLock,
+    rotation: int,
     internal_height: float,
     internal_width: float,
     page_id: int,
-) -> list[PDFCharData]:
+) -> PDFPageText:
     """
-    Processes a single character from the PDF.
+    Reads all characters of a loaded text page.
 
-    :param i: The index of the character.
     :param text_handler: The text handler for the current page.
-    :param page: The current page being processed.
-    :param pdfium_lock: Lock for thread-safe operations.
+    :param rotation: The page rotation in degrees.
     :param internal_height: The height of the page.
     :param internal_width: The width of the page.
-    :param page_id: ID of the page the character was found on.
-    :return: List of character data for a page.
-    """
-    char_info = _get_char_info(i, text_handler, pdfium_lock)
-    if not char_info:
-        return []
-    char_box = _get_char_box(i, text_handler, pdfium_lock)
-    rotation = _get_page_rotation(page, pdfium_lock)
-
-    adjusted_box = _adjust_char_box(char_box, rotation, internal_height, internal_width)
-    char_data_list: list[PDFCharData] = []
-    for c in char_info["char"] or " ":
-        if c in (
-            "\n",
-            "\r",
-        ):  # Removes duplicated carriage returns in the PDF due to weird extraction.
-            # IDK how to make this better, and neither does Claude, GPT4 nor GPT-o1, so I'm leaving this weird check.
-            next_char_info = _get_char_info(i + 1, text_handler, pdfium_lock)
-            if not next_char_info or next_char_info["char"] in ("\n", "\r"):
-                continue
-
-        char_data_list.append(
-            PDFCharData(
-                char=c,
-                left=int(adjusted_box[0]),
-                right=int(adjusted_box[1]),
-                top=int(adjusted_box[2]),
-                bottom=int(adjusted_box[3]),
-                font_name=char_info["font_name"],
-                font_size=char_info["font_size"],
-                font_weight=char_info["font_weight"],
-                font_stroke_color=char_info["font_stroke_color"],
-                font_fill_color=char_info["font_fill_color"],
-                font_flags=char_info["font_flags"],
-                page_id=page_id,
-            )
-        )
-    return char_data_list
-
-
-@requires_pypdfium2
-def _get_char_info(i: int, text_handler, pdfium_lock: RLock) -> dict:
-    """
-    Retrieves information about a specific character.
-
-    :param i: The index of the character.
-    :param text_handler: The text handler for the current page.
-    :param pdfium_lock: Lock for thread-safe operations.
-    :return: A dictionary containing character information.
+    :param page_id: ID of the page.
+    :return: Characters of the page.
     """
-    stroke = (ctypes.c_uint(), ctypes.c_uint(), ctypes.c_uint(), ctypes.c_uint())
-    fill = (ctypes.c_uint(), ctypes.c_uint(), ctypes.c_uint(), ctypes.c_uint())
-
-    with pdfium_lock:
-        unicode_char = pdfium_c.FPDFText_GetUnicode(text_handler, i)
-        if unicode_char == 0xFF:
-            return {}
-        char = chr(unicode_char)
-        font_name = _get_font_name(text_handler, i)
-        font_flags = _get_font_flags(text_handler, i)
-        font_size = pdfium_c.FPDFText_GetFontSize(text_handler, i)
-        font_weight = pdfium_c.FPDFText_GetFontWeight(text_handler, i)
-        _ = pdfium_c.FPDFText_GetStrokeColor(
-            text_handler, i, stroke[0], stroke[1], stroke[2], stroke[3]
+    count_chars = pdfium_c.FPDFText_CountChars(text_handler)
+    unicode_chars = [
+        pdfium_c.FPDFText_GetUnicode(text_handler, i) for i in range(count_chars)
+    ]
+    # Out of range characters are read as 0 by pdfium.
+    unicode_chars.append(0)
+    style_cache: dict[int, PDFCharStyle] = {}
+    name_buffer = create_string_buffer(FONT_NAME_BUFFER_LENGTH)
+    # Left, right, bottom and top of the current character.
+    char_box = (c_double(0), c_double(0), c_double(0), c_double(0))
+
+    page_text = PDFPageText(page_id)
+    for i in range(count_chars):
+        if unicode_chars[i] == 0xFF:
+            continue
+        # Removes duplicated carriage returns in the PDF due to weird extraction.
+        if unicode_chars[i] in _LINE_BREAKS and (
+            unicode_chars[i + 1] == 0xFF or unicode_chars[i + 1] in _LINE_BREAKS
+        ):
+            continue
+
+        style = _get_char_style(text_handler, i, style_cache, name_buffer)
+        pdfium_c.FPDFText_GetCharBox(text_handler, i, *map(byref, char_box))
+        adjusted_box = _adjust_char_box(
+            (
+                char_box[0].value,
+                char_box[1].value,
+                char_box[2].value,
+                char_box[3].value,
+            ),
+            rotation,
+            internal_height,
+            internal_width,
         )
-        _ = pdfium_c.FPDFText_GetFillColor(
-            text_handler, i, fill[0], fill[1], fill[2], fill[3]
+        page_text.append(
+            unicode_chars[i],
+            (
+                int(adjusted_box[0]),
+                int(adjusted_box[1]),
+                int(adjusted_box[2]),
+                int(adjusted_box[3]),
+            ),
+            style,
         )
-
-    return {
-        "char": char,
-        "font_name": font_name,
-        "font_flags": font_flags,
-        "font_size": font_size,
-        "font_weight": font_weight,
-        "font_stroke_color": stroke,
-        "font_fill_color": fill,
-    }
+    return page_text
 
 
-@requires_pypdfium2
-def _get_font_name(text_handler, i: int) -> str:
+def _get_char_style(
+    text_handler,
+    i: int,
+    style_cache: dict[int, PDFCharStyle],
+    name_buffer: ctypes.Array,
+) -> PDFCharStyle:
     """
-    Retrieves the font name for a specific character.
+    Retrieves the font and color of a character, read once per text object.
 
     :param text_handler: The text handler for the current page.
     :param i: The index of the character.
-    :return: The font name as a string.
+    :param style_cache: Styles already read, by text object address.
+    :param name_buffer: Buffer receiving font names.
+    :return: The style of the character.
     """
-    buffer_length = 128
-    font_name_buffer = create_string_buffer(buffer_length)
-    flags = c_int(0)
-    actual_length = pdfium_c.FPDFText_GetFontInfo(
-        text_handler, i, font_name_buffer, buffer_length, byref(flags)
-    )
-    return (
-        font_name_buffer.value.decode("utf-8") if actual_length > 0 else FALLBACK_FONT
-    )
-
-
-@requires_pypdfium2
-def _get_font_flags(text_handler, i: int) -> int:
+    text_object = pdfium_c.FPDFText_GetTextObject(text_handler, i)
+    # Characters generated by pdfium, such as line breaks, have no text object.
+    address = ctypes.cast(text_object, ctypes.c_void_p).value if text_object else None
+    if address is not None and address in style_cache:
+        return style_cache[address]
+    style = _read_char_style(text_handler, i, name_buffer)
+    if address is not None:
+        style_cache[address] = style
+    return style
+
+
+def _read_char_style(text_handler, i: int, name_buffer: ctypes.Array) -> PDFCharStyle:
     """
-    Retrieves the font flags for a specific character.
+    Reads the font and color of a character.
 
     :param text_handler: The text handler for the current page.
     :param i: The index of the character.
-    :return: The font flags as an integer.
+    :param name_buffer: Buffer receiving the font name.
+    :return: The style of the character.
     """
     flags = c_int(0)
-    pdfium_c.FPDFText_GetFontInfo(text_handler, i, None, 0, byref(flags))
-    return flags.value
-
-
-@requires_pypdfium2
-def _get_char_box(
-    i: int, text_handler, pdfium_lock: RLock
-) -> tuple[float, float, float, float]:
-    """
-    Retrieves the bounding box for a specific character.
-
-    :param i: The index of the character.
-    :param text_handler: The text handler for the current page.
-    :param pdfium_lock: Lock for thread-safe operations.
-    :return: A tuple containing left, right, bottom, and top coordinates.
-    """
-    left, right, bottom, top = (c_double(0), c_double(0), c_double(0), c_double(0))
-    with pdfium_lock:
-        pdfium_c.FPDFText_GetCharBox(
-            text_handler, i, byref(left), byref(right), byref(bottom), byref(top)
+    name_length = pdfium_c.FPDFText_GetFontInfo(
+        text_handler, i, name_buffer, len(name_buffer), byref(flags)
+    )
+    if name_length > len(name_buffer):
+        name_buffer = create_string_buffer(name_length)
+        pdfium_c.FPDFText_GetFontInfo(
+            text_handler, i, name_buffer, name_length, byref(flags)
         )
-    return left.value, right.value, bottom.value, top.value
+    font_name = name_buffer.value.decode("utf-8") if name_length > 0 else FALLBACK_FONT
 
+    stroke = (ctypes.c_uint(), ctypes.c_uint(), ctypes.c_uint(), ctypes.c_uint())
+    fill = (ctypes.c_uint(), ctypes.c_uint(), ctypes.c_uint(), ctypes.c_uint())
+    pdfium_c.FPDFText_GetStrokeColor(
+        text_handler, i, stroke[0], stroke[1], stroke[2], stroke[3]
+    )
+    pdfium_c.FPDFText_GetFillColor(text_handler, i, fill[0], fill[1], fill[2], fill[3])
+    return PDFCharStyle(
+        font_name=font_name,
+        font_size=pdfium_c.FPDFText_GetFontSize(text_handler, i),
+        font_weight=pdfium_c.FPDFText_GetFontWeight(text_handler, i),
+        font_flags=flags.value,
+        font_stroke_color=(
+            stroke[0].value,
+            stroke[1].value,
+            stroke[2].value,
+            stroke[3].value,
+        ),
+        font_fill_color=(fill[0].value, fill[1].value, fill[2].value, fill[3].value),
+    )
 
-@requires_pypdfium2
-def _get_page_rotation(page, pdfium_lock: RLock) -> int:
+
+def _get_page_rotation(page) -> int:
     """
     Retrieves the rotation value for a specific page.
 
     :param page: The page to get the rotation for.
-    :param pdfium_lock: Lock for thread-safe operations.
     :return: The rotation value in degrees.
     """
-    with pdfium_lock:
-        return {0: 0, 1: 90, 2: 180, 3: 270}.get(
-            pdfium_c.FPDFPage_GetRotation(page.raw), 0
-        )
+    return {0: 0, 1: 90, 2: 180, 3: 270}.get(pdfium_c.FPDFPage_GetRotation(page.raw), 0)
 
 
 def _adjust_char_box(
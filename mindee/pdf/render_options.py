@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import math
+
+from mindee.error.mindee_error import MindeeError
+
+POINTS_PER_INCH = 72
+"""Number of PDF points in an inch, a scale of 1 renders at 72 DPI."""
+
+
+class RenderOptions:
+    """Resolution and color options used when rendering PDF pages to images."""
+
+    scale: float | None
+    """Number of pixels per PDF point."""
+    dpi: float | None
+    """Resolution of the rendered image, in dots per inch."""
+    max_pixels: int | None
+    """Maximum number of pixels of a rendered page, larger pages are scaled down."""
+    grayscale: bool
+    """Whether to render pages in shades of gray."""
+
+    def __init__(
+        self,
+        scale: float | None = None,
+        dpi: float | None = None,
+        max_pixels: int | None = None,
+        grayscale: bool = False,
+    ) -> None:
+        """
+        Resolution and color options used when rendering PDF pages to images.
+
+        :param scale: Number of pixels per PDF point, cannot be set with ``dpi``.
+            Defaults to 1, i.e. 72 DPI.
+        :param dpi: Resolution of the rendered image, cannot be set with ``scale``.
+        :param max_pixels: Maximum number of pixels of a rendered page,
+            larger pages are scaled down.
+        :param grayscale: Whether to render pages in shades of gray,
+            which is faster and gives smaller images.
+        """
+        if scale is not None and dpi is not None:
+            raise MindeeError("Only one of scale and dpi can be set.")
+        if (scale is not None and scale <= 0) or (dpi is not None and dpi <= 0):
+            raise MindeeError("Render scale and dpi must be greater than 0.")
+        if max_pixels is not None and max_pixels < 1:
+            raise MindeeError("Maximum number of pixels must be at least 1.")
+        self.scale = scale
+        self.dpi = dpi
+        self.max_pixels = max_pixels
+        self.grayscale = grayscale
+
+    def get_scale(self, width: float, height: float) -> float:
+        """
+        Scale to render a page with.
+
+        :param width: Width of the page, in PDF points.
+        :param height: Height of the page, in PDF points.
+        :return: Number of pixels per PDF point.
+        """
+        if self.dpi is not None:
+            scale = self.dpi / POINTS_PER_INCH
+        else:
+            scale = self.scale or 1.0
+        if self.max_pixels is not None and width > 0 and height > 0:
+            pixel_count = width * height * scale * scale
+            if pixel_count > self.max_pixels:
+                scale *= math.sqrt(self.max_pixels / pixel_count)
+        return scale
@@ -3,6 +3,8 @@
 import httpx
 
 from mindee.client_mixin import ClientMixin
+from mindee.client_options.http_options import HTTPOptions
+from mindee.client_options.polling_options import PollingOptions
 from mindee.error.mindee_error import MindeeClientError, MindeeError
 from mindee.error.mindee_http_error import handle_error
 from mindee.input.local_input_source import LocalInputSource
@@ -10,11 +12,13 @@
 from mindee.input.page_options import PageOptions
 from mindee.input.url_input_source import URLInputSource
 from mindee.logger import logger
+from mindee.mindee_http.http_client_mixin import HTTPClientMixin
 from mindee.mindee_http.response_validation import (
     clean_request_json,
     is_valid_async_response,
     is_valid_sync_response,
 )
+from mindee.mindee_http.retry_after import get_retry_after
 from mindee.parsing.common.string_dict import StringDict
 from mindee.v1.client_options.predict_options import AsyncPredictOptions, PredictOptions
 from mindee.v1.client_options.workflow_options import WorkflowOptions
@@ -53,7 +57,7 @@ def _clean_account_name(account_name: str) -> str:
     return account_name
 
 
-class Client(ClientMixin):
+class Client(HTTPClientMixin, ClientMixin):
     """
     Mindee API Client.
 
@@ -62,20 +66,25 @@ class Client(ClientMixin):
 
     api_key: str
     """API key for all endpoints."""
-    http_client: httpx.Client | None
-    """HTTP client for making requests."""
 
     def __init__(
-        self, api_key: str = "", http_client: httpx.Client | None = None
+        self,
+        api_key: str = "",
+        http_client: httpx.Client | None = None,
+        http_options: HTTPOptions | None = None,
     ) -> None:
         """
         Mindee API Client.
 
         :param api_key: Your API key for all endpoints
         :param http_client: HTTP client for making requests.
+            If not set, a pooled client is created and shared by all endpoints.
+        :param http_options: Options for the pooled HTTP client,
+            ignored when ``http_client`` is set.
         """
         self.api_key = api_key
         self.http_client = http_client
+        self.http_options = http_options or HTTPOptions()
 
     def parse(
         self,
@@ -310,6 +319,7 @@ def enqueue_and_parse(  # pylint: disable=too-many-locals
         full_text: bool = False,
         workflow_id: str | None = None,
         rag: bool = False,
+        polling_options: PollingOptions | None = None,
     ) -> AsyncPredictResponse:
         """
         Enqueues to an asynchronous endpoint and automatically polls for a response.
@@ -352,10 +362,26 @@ def enqueue_and_parse(  # pylint: disable=too-many-locals
 
         :param rag: If set, will enable Retrieval-Augmented Generation.
             Only works if a valid ``workflow_id`` is set.
+
+        :param polling_options: Polling options, including the polling strategy.
+            If set, ``initial_delay_sec``, ``delay_sec`` and ``max_retries`` are ignored.
         """
-        self._validate_async_params(initial_delay_sec, delay_sec, max_retries)
+        if not polling_options:
+            polling_options = PollingOptions(initial_delay_sec, delay_sec, max_retries)
+        self._validate_async_params(
+            polling_options.initial_delay_sec,
+            polling_options.delay_sec,
+            polling_options.max_retries,
+        )
         if not endpoint:
             endpoint = self._initialize_ots_endpoint(product_class=product_class)
+        model_id = f"{endpoint.owner}/{endpoint.url_name}/v{endpoint.version}"
+        page_count = (
+            input_source.page_count
+            if isinstance(input_source, LocalInputSource)
+            and polling_options.strategy.uses_page_count
+            else None
+        )
         queue_result = self.enqueue(
             product_class,
             input_source,
@@ -371,10 +397,10 @@ def enqueue_and_parse(  # pylint: disable=too-many-locals
         logger.debug(
             "Successfully enqueued document with job id: %s", queue_result.job.id
         )
-        sleep(initial_delay_sec)
+        sleep(polling_options.get_initial_delay(model_id, page_count))
         retry_counter = 1
         poll_results = self.parse_queued(product_class, queue_result.job.id, endpoint)
-        while retry_counter < max_retries:
+        while retry_counter < polling_options.max_retries:
             if poll_results.job.status == "completed":
                 break
             if poll_results.job.status == "failed":
@@ -382,8 +408,10 @@ def enqueue_and_parse(  # pylint: disable=too-many-locals
             logger.debug(
                 "Polling server for product result with job id: %s", queue_result.job.id
             )
+            sleep(
+                polling_options.get_delay(retry_counter, poll_results.retry_after_sec)
+            )
             retry_counter += 1
-            sleep(delay_sec)
             poll_results = self.parse_queued(
                 product_class, queue_result.job.id, endpoint
             )
@@ -392,6 +420,10 @@ def enqueue_and_parse(  # pylint: disable=too-many-locals
             raise MindeeError(
                 f"Couldn't retrieve document after {retry_counter} tries."
             )
+        if poll_results.job.available_at:
+            polling_options.strategy.record_duration(
+                model_id, page_count, poll_results.job.millisecs_taken / 1000
+            )
 
         return poll_results
 
@@ -506,7 +538,9 @@ def _get_queued_document(
                 clean_queue_response,
             )
 
-        return AsyncPredictResponse(product_class, queue_response.json())
+        async_response = AsyncPredictResponse(product_class, queue_response.json())
+        async_response.retry_after_sec = get_retry_after(queue_response)
+        return async_response
 
     def _send_to_workflow(
         self,
@@ -530,9 +564,11 @@ def _send_to_workflow(
         if input_source is None:
             raise MindeeClientError("No input document provided")
 
+        workflow_settings = WorkflowSettings(
+            api_key=self.api_key, workflow_id=workflow_id
+        )
         workflow_endpoint = WorkflowEndpoint(
-            WorkflowSettings(api_key=self.api_key, workflow_id=workflow_id),
-            self.http_client,
+            workflow_settings, http_options=self.http_options, http_client_owner=self
         )
 
         response = workflow_endpoint.workflow_execution_post(input_source, options)
@@ -566,10 +602,20 @@ def _build_endpoint(
         )
         if account_name and len(account_name) > 0 and account_name != "mindee":
             return CustomEndpoint(
-                endpoint_name, account_name, version, api_settings, self.http_client
+                endpoint_name,
+                account_name,
+                version,
+                api_settings,
+                http_options=self.http_options,
+                http_client_owner=self,
             )
         return Endpoint(
-            endpoint_name, account_name, version, api_settings, self.http_client
+            endpoint_name,
+            account_name,
+            version,
+            api_settings,
+            http_options=self.http_options,
+            http_client_owner=self,
         )
 
     def create_endpoint(
@@ -598,11 +644,6 @@ def create_endpoint(
             version = "1"
         return self._build_endpoint(endpoint_name, account_name, version)
 
-    def close(self):
-        """Close the HTTP client."""
-        if self.http_client and not self.http_client.is_closed:
-            self.http_client.close()
-
     def __enter__(self):
         return self
 
@@ -611,6 +652,6 @@ def __exit__(self, exc_type, exc_val, exc_tb):
 
     def __del__(self):
         """Ensure the HTTP client is closed when the object is garbage collected."""
-        if self.http_client and self.http_client and not self.http_client.is_closed:
-            logger.info("Force-closing unclosed Mindee Client (V1) %s.", str(self))
+        if self.http_client and not self.http_client.is_closed:
+            logger.debug("Force-closing unclosed Mindee Client (V1) %s.", str(self))
             self.close()
@@ -1,24 +1,50 @@
 import httpx
 
+from mindee.client_options.http_options import HTTPOptions
+from mindee.mindee_http.http_client_mixin import HTTPClientMixin
 from mindee.v1.mindee_http.base_settings import BaseSettings
 
 
-class BaseEndpoint:
+class BaseEndpoint(HTTPClientMixin):
     """Base endpoint class for the Mindee API."""
 
     settings: BaseSettings
     """Settings relating to all endpoints."""
-    http_client: httpx.Client | None
-    """HTTP client for making requests."""
+    http_client_owner: HTTPClientMixin | None
+    """Object holding the pooled HTTP client shared with other endpoints."""
 
     def __init__(
-        self, settings: BaseSettings, http_client: httpx.Client | None = None
+        self,
+        settings: BaseSettings,
+        http_client: httpx.Client | None = None,
+        http_options: HTTPOptions | None = None,
+        http_client_owner: HTTPClientMixin | None = None,
     ) -> None:
         """
         Base API endpoint class for all endpoints.
 
         :param settings: Settings relating to all endpoints.
         :param http_client: HTTP client for making requests.
+            If not set, a pooled client is created on the first request.
+        :param http_options: Options for the pooled HTTP client,
+            ignored when ``http_client`` is set.
+        :param http_client_owner: Object whose pooled HTTP client is used when
+            ``http_client`` is not set, created on its first request.
         """
         self.settings = settings
         self.http_client = http_client
+        self.http_options = http_options or HTTPOptions()
+        self.http_client_owner = http_client_owner
+
+    def _get_http_client(self, request_timeout: float) -> httpx.Client:
+        """
+        Get the HTTP client, from the owner of the shared client if any.
+
+        :param request_timeout: Timeout to use if the client has to be created.
+        :return: An open HTTP client.
+        """
+        if self.http_client is None and self.http_client_owner is not None:
+            return self.http_client_owner._get_http_client(  # pylint: disable=protected-access
+                request_timeout
+            )
+        return super()._get_http_client(request_timeout)
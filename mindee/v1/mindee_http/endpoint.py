@@ -1,9 +1,12 @@
-from collections.abc import Callable
+from contextlib import ExitStack
 
 import httpx
 
+from mindee.client_options.http_options import HTTPOptions
 from mindee.input.local_input_source import LocalInputSource
 from mindee.input.url_input_source import URLInputSource
+from mindee.mindee_http.http_client_mixin import HTTPClientMixin
+from mindee.mindee_http.rate_limiter import ENQUEUE_BUCKET, POLLING_BUCKET
 from mindee.parsing.common.string_dict import StringDict
 from mindee.v1.mindee_http.base_endpoint import BaseEndpoint
 from mindee.v1.mindee_http.mindee_api import MindeeAPI
@@ -21,6 +24,8 @@ def __init__(
         version: str,
         settings: MindeeAPI,
         http_client: httpx.Client | None = None,
+        http_options: HTTPOptions | None = None,
+        http_client_owner: HTTPClientMixin | None = None,
     ) -> None:
         """
         Generic API endpoint for a product.
@@ -30,8 +35,12 @@ def __init__(
         :param version: interface version
         :param settings: settings for the API
         :param http_client: HTTP client for making requests.
+        :param http_options: Options for the pooled HTTP client,
+            ignored when ``http_client`` is set.
+        :param http_client_owner: Object whose pooled HTTP client is used when
+            ``http_client`` is not set.
         """
-        super().__init__(settings, http_client)
+        super().__init__(settings, http_client, http_options, http_client_owner)
         self.owner = owner
         self.url_name = url_name
         self.version = version
@@ -123,23 +132,25 @@ def _custom_request(
         else:
             url = f"{self.settings.url_root}/{route}"
 
-        if isinstance(input_source, URLInputSource):
-            data["document"] = input_source.url
-        else:
-            post_kwargs["files"] = {"document": input_source.read_contents(close_file)}
-        post_caller: Callable
-        if self.http_client is None or self.http_client.is_closed:
-            post_caller = httpx.post
-            post_kwargs["timeout"] = self.settings.request_timeout
-        else:
-            post_caller = self.http_client.post
-        return post_caller(
-            url,
-            headers=self.settings.base_headers,
-            data=data,
-            params=params,
-            **post_kwargs,
-        )
+        with ExitStack() as stack:
+            if isinstance(input_source, URLInputSource):
+                data["document"] = input_source.url
+            else:
+                post_kwargs["files"] = {
+                    "document": stack.enter_context(
+                        input_source.open_for_upload(close_file)
+                    )
+                }
+            return self._request(
+                "POST",
+                url,
+                self.settings.request_timeout,
+                bucket=ENQUEUE_BUCKET,
+                headers=self.settings.base_headers,
+                data=data,
+                params=params,
+                **post_kwargs,
+            )
 
     def document_queue_req_get(self, queue_id: str) -> httpx.Response:
         """
@@ -148,14 +159,11 @@ def document_queue_req_get(self, queue_id: str) -> httpx.Response:
         :param queue_id: queue_id received from the API
         """
         get_kwargs: StringDict = {"follow_redirects": True}
-        get_caller: Callable
-        if self.http_client is None or self.http_client.is_closed:
-            get_caller = httpx.get
-            get_kwargs["timeout"] = self.settings.request_timeout
-        else:
-            get_caller = self.http_client.get
-        return get_caller(
-            url=f"{self.settings.url_root}/documents/queue/{queue_id}",
+        return self._request(
+            "GET",
+            f"{self.settings.url_root}/documents/queue/{queue_id}",
+            self.settings.request_timeout,
+            bucket=POLLING_BUCKET,
             headers=self.settings.base_headers,
             **get_kwargs,
         )
@@ -163,14 +171,12 @@ def document_queue_req_get(self, queue_id: str) -> httpx.Response:
     def openapi_get_req(self) -> httpx.Response:
         """Get the OpenAPI specification of the product."""
         url = f"{self.settings.url_root}/openapi.json"
-        get_kwargs: StringDict = {}
-        get_caller: Callable
-        if self.http_client is None or self.http_client.is_closed:
-            get_caller = httpx.get
-            get_kwargs["timeout"] = self.settings.request_timeout
-        else:
-            get_caller = self.http_client.get
-        return get_caller(url, headers=self.settings.base_headers, **get_kwargs)
+        return self._request(
+            "GET",
+            url,
+            self.settings.request_timeout,
+            headers=self.settings.base_headers,
+        )
 
     def document_feedback_req_put(
         self, document_id: str, feedback: StringDict
@@ -182,14 +188,10 @@ def document_feedback_req_put(
         :param feedback: Feedback object to send.
         """
         put_kwargs: StringDict = {"follow_redirects": True}
-        put_caller: Callable
-        if self.http_client is None or self.http_client.is_closed:
-            put_caller = httpx.put
-            put_kwargs["timeout"] = self.settings.request_timeout
-        else:
-            put_caller = self.http_client.put
-        return put_caller(
-            url=f"{self.settings.url_root}/documents/{document_id}/feedback",
+        return self._request(
+            "PUT",
+            f"{self.settings.url_root}/documents/{document_id}/feedback",
+            self.settings.request_timeout,
             headers=self.settings.base_headers,
             data=feedback,
             **put_kwargs,
@@ -210,19 +212,17 @@ def training_req_post(
         :param close_file: Whether to `close()` the file after parsing it.
         """
         post_kwargs: StringDict = {"follow_redirects": True}
-        post_caller: Callable
-        if self.http_client is None or self.http_client.is_closed:
-            post_caller = httpx.post
-            post_kwargs["timeout"] = self.settings.request_timeout
-        else:
-            post_caller = self.http_client.post
-        return post_caller(
-            url=f"{self.settings.url_root}/predict",
-            headers=self.settings.base_headers,
-            files={"document": input_source.read_contents(close_file)},
-            params={"training": True, "with_candidates": True},
-            **post_kwargs,
-        )
+        with input_source.open_for_upload(close_file) as document:
+            return self._request(
+                "POST",
+                f"{self.settings.url_root}/predict",
+                self.settings.request_timeout,
+                bucket=ENQUEUE_BUCKET,
+                headers=self.settings.base_headers,
+                files={"document": document},
+                params={"training": True, "with_candidates": True},
+                **post_kwargs,
+            )
 
     def training_async_req_post(
         self, input_source: LocalInputSource, close_file: bool = True
@@ -235,19 +235,17 @@ def training_async_req_post(
         :param close_file: Whether to `close()` the file after parsing it.
         """
         post_kwargs: StringDict = {"follow_redirects": True}
-        post_caller: Callable
-        if self.http_client is None or self.http_client.is_closed:
-            post_caller = httpx.post
-            post_kwargs["timeout"] = self.settings.request_timeout
-        else:
-            post_caller = self.http_client.post
-        return post_caller(
-            url=f"{self.settings.url_root}/predict",
-            headers=self.settings.base_headers,
-            files={"document": input_source.read_contents(close_file)},
-            params={"training": True, "async": True},
-            **post_kwargs,
-        )
+        with input_source.open_for_upload(close_file) as document:
+            return self._request(
+                "POST",
+                f"{self.settings.url_root}/predict",
+                self.settings.request_timeout,
+                bucket=ENQUEUE_BUCKET,
+                headers=self.settings.base_headers,
+                files={"document": document},
+                params={"training": True, "async": True},
+                **post_kwargs,
+            )
 
     def document_req_del(self, document_id: str) -> httpx.Response:
         """
@@ -257,14 +255,10 @@ def document_req_del(self, document_id: str) -> httpx.Response:
         """
 
         delete_kwargs: StringDict = {"follow_redirects": True}
-        delete_caller: Callable
-        if self.http_client is None or self.http_client.is_closed:
-            delete_caller = httpx.delete
-            delete_kwargs["timeout"] = self.settings.request_timeout
-        else:
-            delete_caller = self.http_client.delete
-        return delete_caller(
-            url=f"{self.settings.url_root}/documents/{document_id}",
+        return self._request(
+            "DELETE",
+            f"{self.settings.url_root}/documents/{document_id}",
+            self.settings.request_timeout,
             headers=self.settings.base_headers,
             **delete_kwargs,
         )
@@ -276,14 +270,10 @@ def documents_req_get(self, page_id: int = 1) -> httpx.Response:
         :param page_id: Page number
         """
         get_kwargs: StringDict = {"follow_redirects": True}
-        get_caller: Callable
-        if self.http_client is None or self.http_client.is_closed:
-            get_caller = httpx.get
-            get_kwargs["timeout"] = self.settings.request_timeout
-        else:
-            get_caller = self.http_client.get
-        return get_caller(
-            url=f"{self.settings.url_root}/documents",
+        return self._request(
+            "GET",
+            f"{self.settings.url_root}/documents",
+            self.settings.request_timeout,
             headers=self.settings.base_headers,
             params={
                 "page": page_id,
@@ -300,14 +290,10 @@ def document_req_get(self, document_id: str) -> httpx.Response:
         get_kwargs: StringDict = {
             "follow_redirects": True,
         }
-        get_caller: Callable
-        if self.http_client is None or self.http_client.is_closed:
-            get_caller = httpx.get
-            get_kwargs["timeout"] = self.settings.request_timeout
-        else:
-            get_caller = self.http_client.get
-        return get_caller(
-            url=f"{self.settings.url_root}/documents/{document_id}",
+        return self._request(
+            "GET",
+            f"{self.settings.url_root}/documents/{document_id}",
+            self.settings.request_timeout,
             headers=self.settings.base_headers,
             params={
                 "include_annotations": True,
@@ -330,14 +316,10 @@ def annotations_req_post(
         post_kwargs: StringDict = {
             "follow_redirects": True,
         }
-        post_caller: Callable
-        if self.http_client is None or self.http_client.is_closed:
-            post_caller = httpx.post
-            post_kwargs["timeout"] = self.settings.request_timeout
-        else:
-            post_caller = self.http_client.post
-        return post_caller(
-            url=f"{self.settings.url_root}/documents/{document_id}/annotations",
+        return self._request(
+            "POST",
+            f"{self.settings.url_root}/documents/{document_id}/annotations",
+            self.settings.request_timeout,
             headers=self.settings.base_headers,
             json=annotations,
             **post_kwargs,
@@ -354,14 +336,10 @@ def annotations_req_put(
         :return: httpx response
         """
         put_kwargs: StringDict = {"follow_redirects": True}
-        put_caller: Callable
-        if self.http_client is None or self.http_client.is_closed:
-            put_caller = httpx.put
-            put_kwargs["timeout"] = self.settings.request_timeout
-        else:
-            put_caller = self.http_client.put
-        return put_caller(
-            url=f"{self.settings.url_root}/documents/{document_id}/annotations",
+        return self._request(
+            "PUT",
+            f"{self.settings.url_root}/documents/{document_id}/annotations",
+            self.settings.request_timeout,
             headers=self.settings.base_headers,
             json=annotations,
             **put_kwargs,
@@ -375,14 +353,10 @@ def annotations_req_del(self, document_id: str) -> httpx.Response:
         :return: httpx response
         """
         delete_kwargs: StringDict = {"follow_redirects": True}
-        delete_caller: Callable
-        if self.http_client is None or self.http_client.is_closed:
-            delete_caller = httpx.delete
-            delete_kwargs["timeout"] = self.settings.request_timeout
-        else:
-            delete_caller = self.http_client.delete
-        return delete_caller(
-            url=f"{self.settings.url_root}/documents/{document_id}/annotations",
+        return self._request(
+            "DELETE",
+            f"{self.settings.url_root}/documents/{document_id}/annotations",
+            self.settings.request_timeout,
             headers=self.settings.base_headers,
             **delete_kwargs,
         )
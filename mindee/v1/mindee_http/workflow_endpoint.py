@@ -1,10 +1,12 @@
-from collections.abc import Callable
+from contextlib import ExitStack
 
 import httpx
 
+from mindee.client_options.http_options import HTTPOptions
 from mindee.input.local_input_source import LocalInputSource
 from mindee.input.url_input_source import URLInputSource
-from mindee.parsing.common.string_dict import StringDict
+from mindee.mindee_http.http_client_mixin import HTTPClientMixin
+from mindee.mindee_http.rate_limiter import ENQUEUE_BUCKET
 from mindee.v1.client_options.workflow_options import WorkflowOptions
 from mindee.v1.mindee_http.base_endpoint import BaseEndpoint
 from mindee.v1.mindee_http.workflow_settings import WorkflowSettings
@@ -17,14 +19,23 @@ class WorkflowEndpoint(BaseEndpoint):
     """Settings object."""
 
     def __init__(
-        self, settings: WorkflowSettings, http_client: httpx.Client | None = None
+        self,
+        settings: WorkflowSettings,
+        http_client: httpx.Client | None = None,
+        http_options: HTTPOptions | None = None,
+        http_client_owner: HTTPClientMixin | None = None,
     ) -> None:
         """
         Workflow Endpoint.
 
         :param settings: Settings object.
+        :param http_client: HTTP client for making requests.
+        :param http_options: Options for the pooled HTTP client,
+            ignored when ``http_client`` is set.
+        :param http_client_owner: Object whose pooled HTTP client is used when
+            ``http_client`` is not set.
         """
-        super().__init__(settings, http_client)
+        super().__init__(settings, http_client, http_options, http_client_owner)
 
     def workflow_execution_post(
         self,
@@ -53,23 +64,21 @@ def workflow_execution_post(
             params["full_text_ocr"] = "true"
         if options.rag:
             params["rag"] = "true"
-        post_kwargs: StringDict = {}
         files = None
-        if isinstance(input_source, URLInputSource):
-            data["document"] = input_source.url
-        else:
-            files = {"document": input_source.read_contents(True)}
-        post_caller: Callable
-        if self.http_client is None or self.http_client.is_closed:
-            post_caller = httpx.post
-            post_kwargs["timeout"] = self.settings.request_timeout
-        else:
-            post_caller = self.http_client.post
-        return post_caller(
-            self.settings.url_root,
-            headers=self.settings.base_headers,
-            data=data,
-            params=params,
-            files=files,
-            **post_kwargs,
-        )
+        with ExitStack() as stack:
+            if isinstance(input_source, URLInputSource):
+                data["document"] = input_source.url
+            else:
+                files = {
+                    "document": stack.enter_context(input_source.open_for_upload(True))
+                }
+            return self._request(
+                "POST",
+                self.settings.url_root,
+                self.settings.request_timeout,
+                bucket=ENQUEUE_BUCKET,
+                headers=self.settings.base_headers,
+                data=data,
+                params=params,
+                files=files,
+            )
@@ -16,6 +16,8 @@ class AsyncPredictResponse(Generic[TypeInference], ApiResponse):
     job: Job
     """Job object link to the prediction. As long as it isn't complete, the prediction doesn't exist."""
     document: Document | None = None
+    retry_after_sec: float | None = None
+    """Delay requested by the server before the next polling attempt, if any."""
 
     def __init__(
         self, inference_type: type[TypeInference], raw_response: StringDict
@@ -1,33 +1,35 @@
 from mindee.error.mindee_error import MindeeError
 from mindee.image.extracted_image import ExtractedImage
-from mindee.image.image_extractor import extract_multiple_images_from_source
+from mindee.image.image_extractor import ImageExtractor
 from mindee.input.local_input_source import LocalInputSource
 from mindee.v1.parsing.common.inference import Inference
 
 
 def extract_receipts(
-    input_source: LocalInputSource, inference: Inference
+    input_source: LocalInputSource, inference: Inference, perspective: bool = False
 ) -> list[ExtractedImage]:
     """
     Extracts individual receipts from multi-receipts documents.
 
     :param input_source: Local Input Source to extract sub-receipts from.
     :param inference: Results of the inference.
+    :param perspective: Whether to straighten skewed receipts from their
+        quadrangle with a perspective transform, instead of cropping to their
+        bounding box.
     :return: Individual extracted receipts as an array of ExtractedMultiReceiptsImage.
     """
-    images: list[ExtractedImage] = []
     if not inference.prediction.receipts:
         raise MindeeError(
             "No possible receipts candidates found for MultiReceipts extraction."
         )
-    for page_id in range(input_source.page_count):
-        receipt_positions = [
-            receipt.bounding_box
+    receipt_positions = {
+        page_id: [
+            receipt.quadrangle
+            if perspective and receipt.quadrangle
+            else receipt.bounding_box
             for receipt in inference.pages[page_id].prediction.receipts
         ]
-        images.extend(
-            extract_multiple_images_from_source(
-                input_source, page_id, receipt_positions
-            )
-        )
-    return images
+        for page_id in range(input_source.page_count)
+    }
+    with ImageExtractor(input_source) as extractor:
+        return extractor.extract_images(receipt_positions, perspective)
@@ -1,9 +1,11 @@
+from mindee.v2.async_client import AsyncClient
 from mindee.v2.client import Client
 from mindee.v2.file_operations.crop import (
     extract_multiple_crops,
     extract_single_crop,
 )
 from mindee.v2.file_operations.split import extract_multiple_splits
+from mindee.v2.polling.job_tracker import JobTracker
 from mindee.v2.product.classification.classification_response import (
     ClassificationResponse,
 )
@@ -22,6 +24,7 @@
 from mindee.v2.product.split.split_response import SplitResponse
 
 __all__ = [
+    "AsyncClient",
     "ClassificationParameters",
     "ClassificationResponse",
     "Client",
@@ -29,6 +32,7 @@
     "CropResponse",
     "ExtractionParameters",
     "ExtractionResponse",
+    "JobTracker",
     "OCRParameters",
     "OCRResponse",
     "SplitParameters",
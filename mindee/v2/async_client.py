@@ -0,0 +1,176 @@
+import asyncio
+
+import httpx
+
+from mindee.client_mixin import ClientMixin
+from mindee.client_options.http_options import HTTPOptions
+from mindee.error.mindee_error import MindeeError
+from mindee.input import URLInputSource
+from mindee.input.local_input_source import LocalInputSource
+from mindee.logger import logger
+from mindee.v2.client import TypeBaseResponse
+from mindee.v2.client_options.base_parameters import BaseParameters
+from mindee.v2.mindee_http.async_mindee_api_v2 import AsyncMindeeAPIV2
+from mindee.v2.parsing.job.job_response import JobResponse
+from mindee.v2.parsing.search.search_response import SearchResponse
+from mindee.v2.polling.polling_helpers import (
+    get_page_count,
+    get_polling_options,
+    get_processed_result_url,
+    record_job_duration,
+)
+
+
+class AsyncClient(ClientMixin):
+    """
+    Mindee API Client, using ``asyncio``.
+
+    All requests go through a single shared ``httpx.AsyncClient``,
+    so many jobs can be in flight on the same event loop.
+
+    See: https://docs.mindee.com/
+    """
+
+    api_key: str | None
+    mindee_api: AsyncMindeeAPIV2
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        http_options: HTTPOptions | None = None,
+    ) -> None:
+        """
+        Mindee API Client, using ``asyncio``.
+
+        :param api_key: Your API key for all endpoints
+        :param http_client: Asynchronous HTTP client for making requests.
+            If not set, a pooled client is created on the first request.
+        :param http_options: Options for the pooled HTTP client,
+            ignored when ``http_client`` is set.
+        """
+        self.api_key = api_key
+        self.mindee_api = AsyncMindeeAPIV2(api_key, http_client, http_options)
+
+    async def enqueue(
+        self,
+        input_source: LocalInputSource | URLInputSource,
+        params: BaseParameters,
+    ) -> JobResponse:
+        """
+        Enqueues a document to a given model.
+
+        :param input_source: The document/source file to use. Can be local or remote.
+        :param params: Parameters to set when sending a file.
+
+        :return: A valid job response.
+        """
+        logger.debug("Enqueuing inference using model: %s", params.model_id)
+        return await self.mindee_api.enqueue(input_source, params)
+
+    async def get_job(self, job_id: str) -> JobResponse:
+        """
+        Get the status of an inference that was previously enqueued.
+
+        Can be used for polling.
+
+        :param job_id: UUID of the job to retrieve.
+        :return: A job response.
+        """
+        logger.debug("Fetching job: %s", job_id)
+        return await self.mindee_api.get_job(job_id)
+
+    async def get_result(
+        self,
+        response_type: type[TypeBaseResponse],
+        inference_id: str,
+    ) -> TypeBaseResponse:
+        """
+        Get the result of an inference that was previously enqueued.
+
+        The inference will only be available after it has finished processing.
+
+        :param response_type: Class of the product to instantiate.
+        :param inference_id: UUID of the inference to retrieve.
+        :return: An inference response.
+        """
+        logger.debug("Fetching result: %s", inference_id)
+        return await self.mindee_api.get_result(response_type, inference_id)
+
+    async def get_result_from_url(
+        self, response_type: type[TypeBaseResponse], url: str
+    ) -> TypeBaseResponse:
+        """
+        Get the result of an inference that was previously enqueued by its URL.
+
+        :param response_type: Type of the response to return.
+        :param url: URL of the inference to retrieve.
+        :return: The result of the inference.
+        """
+        return await self.mindee_api.get_result_by_url(response_type, url)
+
+    async def enqueue_and_get_result(
+        self,
+        response_type: type[TypeBaseResponse],
+        input_source: LocalInputSource | URLInputSource,
+        params: BaseParameters,
+    ) -> TypeBaseResponse:
+        """
+        Enqueues to an asynchronous endpoint and automatically polls for a response.
+
+        Waiting between polling attempts does not block the event loop.
+
+        :param response_type: The product class to use for the response object.
+        :param input_source: The document/source file to use. Can be local or remote.
+        :param params: Parameters to set when sending a file.
+
+        :return: A valid inference response.
+        """
+        polling_options = get_polling_options(params)
+        page_count = get_page_count(input_source, polling_options)
+        enqueue_response = await self.enqueue(input_source, params)
+        logger.debug(
+            "Successfully enqueued document with job ID: %s", enqueue_response.job.id
+        )
+        await asyncio.sleep(
+            polling_options.get_initial_delay(params.model_id, page_count)
+        )
+        try_counter = 0
+        while try_counter < polling_options.max_retries:
+            job_response = await self.get_job(enqueue_response.job.id)
+            result_url = get_processed_result_url(job_response)
+            if result_url:
+                record_job_duration(polling_options, job_response, page_count)
+                result = await self.get_result_from_url(response_type, result_url)
+                assert isinstance(result, response_type), (
+                    f'Invalid response type "{type(result)}"'
+                )
+                return result
+            try_counter += 1
+            await asyncio.sleep(
+                polling_options.get_delay(try_counter, job_response.retry_after_sec)
+            )
+
+        raise MindeeError(f"Couldn't retrieve document after {try_counter + 1} tries.")
+
+    async def search_models(
+        self, name: str | None = None, model_type: str | None = None
+    ) -> SearchResponse:
+        """
+        Get a list of models matching the provided name and type.
+
+        :param name: Name of the model to filter by.
+        :param model_type: Type of the model to filter by.
+        :return: A list of models matching the provided criteria.
+        """
+        return await self.mindee_api.get_models(name, model_type)
+
+    async def close(self) -> None:
+        """Closes the underlying HTTP client."""
+        await self.mindee_api.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,3 @@
+from mindee.v2.batch.batch_result import BatchResult
+
+__all__ = ["BatchResult"]
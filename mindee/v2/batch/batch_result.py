@@ -0,0 +1,43 @@
+from typing import Generic, TypeVar
+
+from mindee.input.local_input_source import LocalInputSource
+from mindee.input.url_input_source import URLInputSource
+from mindee.v2.client_options.base_parameters import BaseParameters
+
+TypeBatchValue = TypeVar("TypeBatchValue")
+
+
+class BatchResult(Generic[TypeBatchValue]):
+    """Outcome of a single item of a batch operation."""
+
+    index: int
+    """Position of the item in the iterable given to the batch operation."""
+    input_source: LocalInputSource | URLInputSource
+    """The document/source file that was sent."""
+    params: BaseParameters
+    """Parameters used when sending the file."""
+    result: TypeBatchValue | None
+    """Value returned for the item, ``None`` if it failed."""
+    error: Exception | None
+    """Exception raised while processing the item, ``None`` if it succeeded."""
+
+    def __init__(
+        self,
+        index: int,
+        input_source: LocalInputSource | URLInputSource,
+        params: BaseParameters,
+    ) -> None:
+        self.index = index
+        self.input_source = input_source
+        self.params = params
+        self.result = None
+        self.error = None
+
+    @property
+    def is_success(self) -> bool:
+        """Whether the item was processed without error."""
+        return self.error is None
+
+    def __str__(self) -> str:
+        status = "success" if self.is_success else f"error: {self.error}"
+        return f"Batch item {self.index} ({status})"
@@ -1,22 +1,33 @@
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from time import sleep
 from typing import TypeVar
 
 import httpx
 
 from mindee.client_mixin import ClientMixin
-from mindee.client_options.polling_options import PollingOptions
-from mindee.error.mindee_error import MindeeError
+from mindee.client_options.http_options import HTTPOptions
+from mindee.error.mindee_error import MindeeClientError, MindeeError
 from mindee.input import URLInputSource
 from mindee.input.local_input_source import LocalInputSource
 from mindee.logger import logger
-from mindee.parsing.common.common_response import CommonStatus
+from mindee.v2.batch.batch_result import BatchResult, TypeBatchValue
 from mindee.v2.client_options.base_parameters import BaseParameters
 from mindee.v2.mindee_http.mindee_api_v2 import MindeeAPIV2
 from mindee.v2.parsing.inference.base_response import BaseResponse
 from mindee.v2.parsing.job.job_response import JobResponse
 from mindee.v2.parsing.search.search_response import SearchResponse
+from mindee.v2.polling.job_tracker import DEFAULT_POLLING_WORKERS, JobTracker
+from mindee.v2.polling.polling_helpers import (
+    get_page_count,
+    get_polling_options,
+    get_processed_result_url,
+    record_job_duration,
+)
 
 TypeBaseResponse = TypeVar("TypeBaseResponse", bound=BaseResponse)
+BatchItem = tuple[LocalInputSource | URLInputSource, BaseParameters]
+DEFAULT_MAX_IN_FLIGHT = 8
 
 
 class Client(ClientMixin):
@@ -30,15 +41,22 @@ class Client(ClientMixin):
     mindee_api: MindeeAPIV2
 
     def __init__(
-        self, api_key: str | None = None, http_client: httpx.Client | None = None
+        self,
+        api_key: str | None = None,
+        http_client: httpx.Client | None = None,
+        http_options: HTTPOptions | None = None,
     ) -> None:
         """
         Mindee API Client.
 
         :param api_key: Your API key for all endpoints
+        :param http_client: HTTP client for making requests.
+            If not set, a pooled client is created on the first request.
+        :param http_options: Options for the pooled HTTP client,
+            ignored when ``http_client`` is set.
         """
         self.api_key = api_key
-        self.mindee_api = MindeeAPIV2(api_key, http_client)
+        self.mindee_api = MindeeAPIV2(api_key, http_client, http_options)
 
     def enqueue(
         self,
@@ -114,39 +132,85 @@ def enqueue_and_get_result(
 
         :return: A valid inference response.
         """
-        if not params.polling_options:
-            params.polling_options = PollingOptions()
-        self._validate_async_params(
-            params.polling_options.initial_delay_sec,
-            params.polling_options.delay_sec,
-            params.polling_options.max_retries,
-        )
+        polling_options = get_polling_options(params)
+        page_count = get_page_count(input_source, polling_options)
         enqueue_response = self.enqueue(input_source, params)
         logger.debug(
             "Successfully enqueued document with job ID: %s", enqueue_response.job.id
         )
-        sleep(params.polling_options.initial_delay_sec)
+        sleep(polling_options.get_initial_delay(params.model_id, page_count))
         try_counter = 0
-        while try_counter < params.polling_options.max_retries:
+        while try_counter < polling_options.max_retries:
             job_response = self.get_job(enqueue_response.job.id)
             assert isinstance(job_response, JobResponse)
-            if job_response.job.status == CommonStatus.FAILED.value:
-                if job_response.job.error:
-                    detail = job_response.job.error.detail
-                else:
-                    detail = "No error detail available."
-                raise MindeeError(
-                    f"Parsing failed for job {job_response.job.id}: {detail}"
-                )
-            if (
-                job_response.job.status == CommonStatus.PROCESSED.value
-                and job_response.job.result_url
-            ):
-                logger.debug(
-                    "Job ID %s completed processing at: %s",
-                    job_response.job.id,
-                    job_response.job.completed_at,
+            result_url = get_processed_result_url(job_response)
+            if result_url:
+                record_job_duration(polling_options, job_response, page_count)
+                result = self.get_result_from_url(response_type, result_url)
+                assert isinstance(result, response_type), (
+                    f'Invalid response type "{type(result)}"'
                 )
+                return result
+            try_counter += 1
+            sleep(polling_options.get_delay(try_counter, job_response.retry_after_sec))
+
+        raise MindeeError(f"Couldn't retrieve document after {try_counter + 1} tries.")
+
+    def enqueue_many(
+        self,
+        items: Iterable[BatchItem],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> Iterator[BatchResult[JobResponse]]:
+        """
+        Enqueues many documents, keeping a bounded number of requests in flight.
+
+        Errors are captured on each result instead of aborting the batch.
+
+        :param items: Iterable of ``(input_source, params)`` pairs.
+            It is consumed lazily, as slots become available.
+        :param max_in_flight: Maximum number of documents being sent at once.
+        :return: An iterator of results, in completion order.
+        """
+        return self._run_many(self.enqueue, items, max_in_flight)
+
+    def process_many(
+        self,
+        response_type: type[TypeBaseResponse],
+        items: Iterable[BatchItem],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_polling_workers: int = DEFAULT_POLLING_WORKERS,
+    ) -> Iterator[BatchResult[TypeBaseResponse]]:
+        """
+        Enqueues many documents and polls for their results.
+
+        Each document goes through enqueue, polling and result retrieval
+        independently, with at most ``max_in_flight`` documents being handled at once.
+        All jobs are polled by a single ``JobTracker``.
+        Errors are captured on each result instead of aborting the batch.
+
+        :param response_type: The product class to use for the response objects.
+        :param items: Iterable of ``(input_source, params)`` pairs.
+            It is consumed lazily, as slots become available.
+        :param max_in_flight: Maximum number of documents being handled at once.
+        :param max_polling_workers: Maximum number of polling requests sent at once.
+        :return: An iterator of results, in completion order.
+        """
+        with JobTracker(self, max_workers=max_polling_workers) as tracker:
+
+            def process(
+                input_source: LocalInputSource | URLInputSource,
+                params: BaseParameters,
+            ) -> TypeBaseResponse:
+                polling_options = get_polling_options(params)
+                page_count = get_page_count(input_source, polling_options)
+                enqueue_response = self.enqueue(input_source, params)
+                job_response = tracker.register(
+                    enqueue_response.job.id,
+                    polling_options,
+                    model_id=params.model_id,
+                    page_count=page_count,
+                ).result()
+                assert job_response.job.result_url
                 result = self.get_result_from_url(
                     response_type, job_response.job.result_url
                 )
@@ -154,10 +218,52 @@ def enqueue_and_get_result(
                     f'Invalid response type "{type(result)}"'
                 )
                 return result
-            try_counter += 1
-            sleep(params.polling_options.delay_sec)
 
-        raise MindeeError(f"Couldn't retrieve document after {try_counter + 1} tries.")
+            yield from self._run_many(process, items, max_in_flight)
+
+    @staticmethod
+    def _run_many(
+        func: Callable[
+            [LocalInputSource | URLInputSource, BaseParameters], TypeBatchValue
+        ],
+        items: Iterable[BatchItem],
+        max_in_flight: int,
+    ) -> Iterator[BatchResult[TypeBatchValue]]:
+        """
+        Run a function on each item of a batch, using a bounded pool of threads.
+
+        :param func: Function to call on each ``(input_source, params)`` pair.
+        :param items: Iterable of ``(input_source, params)`` pairs.
+        :param max_in_flight: Maximum number of concurrent calls.
+        :return: An iterator of results, in completion order.
+        """
+        if max_in_flight < 1:
+            raise MindeeClientError("Cannot set max_in_flight to less than 1.")
+        items_iterator = enumerate(items)
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            pending: dict[Future, BatchResult[TypeBatchValue]] = {}
+
+            def submit_next() -> None:
+                next_item = next(items_iterator, None)
+                if next_item is None:
+                    return
+                index, (input_source, params) = next_item
+                future = executor.submit(func, input_source, params)
+                pending[future] = BatchResult(index, input_source, params)
+
+            for _ in range(max_in_flight):
+                submit_next()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch_result = pending.pop(future)
+                    try:
+                        batch_result.result = future.result()
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        logger.debug("Batch item %s failed: %s", batch_result.index, e)
+                        batch_result.error = e
+                    submit_next()
+                    yield batch_result
 
     def search_models(
         self, name: str | None = None, model_type: str | None = None
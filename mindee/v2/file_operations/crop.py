@@ -2,51 +2,63 @@
 from mindee.geometry import Point, Polygon
 from mindee.image.extracted_image import ExtractedImage
 from mindee.image.extracted_images import ExtractedImages
-from mindee.image.image_extractor import extract_multiple_images_from_source
+from mindee.image.image_extractor import ImageExtractor
 from mindee.input.local_input_source import LocalInputSource
+from mindee.pdf.render_options import RenderOptions
 from mindee.v2.parsing.inference.field import FieldLocation
 from mindee.v2.product.crop.crop_item import CropItem
 
 
 def extract_single_crop(
-    input_source: LocalInputSource, crop: FieldLocation
+    input_source: LocalInputSource,
+    crop: FieldLocation,
+    render_options: RenderOptions | None = None,
+    perspective: bool = False,
 ) -> ExtractedImage:
     """
     Extracts a single crop as complete PDFs from the document.
 
     :param input_source: Local Input Source to extract sub-receipts from.
     :param crop: Crop to extract.
+    :param render_options: Resolution and color of the rendered page.
+    :param perspective: Whether to straighten a skewed crop with a perspective
+        transform, instead of cropping to its bounding box.
     :return: ExtractedImage.
     """
 
-    polygons: list[Polygon | list[Point]] = [crop.polygon]
-    return extract_multiple_images_from_source(input_source, crop.page, polygons)[0]
+    with ImageExtractor(input_source, render_options) as extractor:
+        return extractor.extract_page_images(crop.page, [crop.polygon], perspective)[0]
 
 
 def extract_multiple_crops(
-    input_source: LocalInputSource, crops: list[CropItem]
+    input_source: LocalInputSource,
+    crops: list[CropItem],
+    render_options: RenderOptions | None = None,
+    perspective: bool = False,
+    encode_workers: int | None = None,
 ) -> ExtractedImages:
     """
     Extracts individual receipts from multi-receipts documents.
 
+    The document is parsed once, and only pages holding crops are rendered.
+    Unless ``encode_workers`` is set, each crop is encoded one at a time,
+    when its buffer is first read.
+
     :param input_source: Local Input Source to extract sub-receipts from.
     :param crops: List of crops.
+    :param render_options: Resolution and color of the rendered pages.
+    :param perspective: Whether to straighten skewed crops with a perspective
+        transform, instead of cropping to their bounding box.
+    :param encode_workers: Number of threads encoding all crops in parallel
+        before returning.
     :return: Individual extracted receipts as an array of ExtractedImage.
     """
-    images: list[ExtractedImage] = []
     if not crops:
         raise MindeeError("No possible candidates found for Crop extraction.")
-    polygons: list[list[Polygon | list[Point]]] = [
-        [] for _ in range(input_source.page_count)
-    ]
+    polygons: dict[int, list[Polygon | list[Point]]] = {}
     for crop in crops:
-        polygons[crop.location.page].append(crop.location.polygon)
-    for i, polygon in enumerate(polygons):
-        images.extend(
-            extract_multiple_images_from_source(
-                input_source,
-                i,
-                polygon,
-            )
+        polygons.setdefault(crop.location.page, []).append(crop.location.polygon)
+    with ImageExtractor(input_source, render_options) as extractor:
+        return ExtractedImages(
+            extractor.extract_images(polygons, perspective, encode_workers)
         )
-    return ExtractedImages(images)
@@ -15,8 +15,8 @@ def extract_single_split(
     :param split: List of pages to keep.
     :return: Extracted PDF
     """
-    pdf_extractor = PDFExtractor(input_source)
-    return pdf_extractor.extract_single_document(_range_to_indexes(split))
+    with PDFExtractor(input_source) as pdf_extractor:
+        return pdf_extractor.extract_single_document(_range_to_indexes(split))
 
 
 def extract_multiple_splits(
@@ -30,13 +30,13 @@ def extract_multiple_splits(
     :param splits: List of sub-lists of pages to keep.
     :return: A list of extracted invoices.
     """
-    pdf_extractor = PDFExtractor(input_source)
     page_groups = []
     for split in splits:
         page_groups.append(_range_to_indexes(split))
     if len(splits) < 1:
         raise MindeeError("No indexes provided.")
-    return pdf_extractor.extract_multiple_documents(page_groups)
+    with PDFExtractor(input_source) as pdf_extractor:
+        return pdf_extractor.extract_multiple_documents(page_groups)
 
 
 def _range_to_indexes(split: list[int]) -> list[int]:
@@ -0,0 +1,240 @@
+import asyncio
+
+import httpx
+
+from mindee.client_options.http_options import HTTPOptions
+from mindee.input.local_input_source import LocalInputSource
+from mindee.input.url_input_source import URLInputSource
+from mindee.logger import logger
+from mindee.mindee_http.rate_limiter import (
+    ENQUEUE_BUCKET,
+    OTHER_BUCKET,
+    POLLING_BUCKET,
+    RESULT_BUCKET,
+)
+from mindee.mindee_http.retry_policy import IDEMPOTENT_METHODS
+from mindee.v2.client_options.base_parameters import BaseParameters
+from mindee.v2.mindee_http.mindee_api_v2 import BaseMindeeAPIV2, ResponseT
+from mindee.v2.parsing.job.job_response import JobResponse
+from mindee.v2.parsing.search.search_response import SearchResponse
+
+
+class AsyncMindeeAPIV2(BaseMindeeAPIV2):
+    """Settings class relating to asynchronous API V2 requests."""
+
+    http_client: httpx.AsyncClient | None
+    """Asynchronous HTTP client for making requests, shared by all calls."""
+    http_options: HTTPOptions
+    """Options used when creating the HTTP client."""
+
+    def __init__(
+        self,
+        api_key: str | None,
+        http_client: httpx.AsyncClient | None = None,
+        http_options: HTTPOptions | None = None,
+    ):
+        super().__init__(api_key)
+        self.http_client = http_client
+        self.http_options = http_options or HTTPOptions()
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        :return: An open asynchronous HTTP client.
+        """
+        if self.http_client is None or self.http_client.is_closed:
+            self.http_client = httpx.AsyncClient(
+                **self.http_options.get_client_kwargs(self.request_timeout)
+            )
+        return self.http_client
+
+    async def _request(
+        self, method: str, url: str, bucket: str = OTHER_BUCKET, **kwargs
+    ) -> httpx.Response:
+        """
+        Send a request through the shared HTTP client, retrying it when allowed.
+
+        Each attempt waits for the rate limiter, if one is set,
+        without blocking the event loop.
+        Reservations run in a worker thread, since a ``FileRateLimiter`` locks and
+        reads its state file.
+
+        :param method: HTTP method of the request.
+        :param url: URL of the request.
+        :param bucket: Rate limiting bucket of the request.
+        :param kwargs: Additional arguments passed to ``httpx.AsyncClient.request``.
+        :return: The last response received.
+        """
+        http_client = self._get_http_client()
+        rate_limiter = self.http_options.rate_limiter
+
+        async def send() -> httpx.Response:
+            if rate_limiter:
+                wait_sec = await asyncio.to_thread(rate_limiter.reserve, bucket)
+                if wait_sec > 0:
+                    await asyncio.sleep(wait_sec)
+            return await http_client.request(method, url, **kwargs)
+
+        return await self.http_options.retry_policy.send_async(
+            send, idempotent=method in IDEMPOTENT_METHODS
+        )
+
+    async def req_post_inference_enqueue(
+        self,
+        input_source: LocalInputSource | URLInputSource,
+        params: BaseParameters,
+        slug: str,
+    ) -> httpx.Response:
+        """
+        Make a request to POST a document for enqueue on the V2 API.
+
+        :param input_source: Input object.
+        :param params: Options for the enqueueing of the document.
+        :param slug: Slug to use for the enqueueing, defaults to 'inferences'.
+        :return: httpx response.
+        """
+        with self._get_enqueue_kwargs(input_source, params) as post_kwargs:
+            return await self._request(
+                "POST",
+                f"{self.url_root}/v2/{slug}/enqueue",
+                bucket=ENQUEUE_BUCKET,
+                headers=self.base_headers,
+                **post_kwargs,
+            )
+
+    async def req_get_job(self, job_id: str) -> httpx.Response:
+        """
+        Sends a request matching a given job_id.
+
+        :param job_id: Job ID, returned by the enqueue request.
+        :return: Response object from the request.
+        """
+        return await self._request(
+            "GET",
+            f"{self.url_root}/v2/jobs/{job_id}",
+            bucket=POLLING_BUCKET,
+            headers=self.base_headers,
+            follow_redirects=False,
+        )
+
+    async def req_get_inference_by_url(self, url: str) -> httpx.Response:
+        """
+        Sends a request matching a given inference URL.
+
+        :param url: URL to use for the request.
+        :return: Response object from the request.
+        """
+        return await self._request(
+            "GET",
+            url,
+            bucket=RESULT_BUCKET,
+            headers=self.base_headers,
+            follow_redirects=False,
+        )
+
+    async def req_get_inference(self, inference_id: str, slug: str) -> httpx.Response:
+        """
+        Sends a request matching a given inference_id.
+
+        :param inference_id: Inference ID, returned by the job request.
+        :param slug: Slug of the inference.
+        :return: Response object from the request.
+        """
+        return await self._request(
+            "GET",
+            f"{self.url_root}/v2/{slug}/{inference_id}",
+            bucket=RESULT_BUCKET,
+            headers=self.base_headers,
+            follow_redirects=False,
+        )
+
+    async def req_get_search_models(
+        self, name: str | None, model_type: str | None
+    ) -> httpx.Response:
+        """
+        Searches for a list of models matching criteria.
+
+        :param name: Name pattern to search for.
+        :param model_type: Type of model to search for (exact match).
+        :return: Response object containing search results.
+        """
+        return await self._request(
+            "GET",
+            f"{self.url_root}/v2/search/models",
+            headers=self.base_headers,
+            params=self._get_search_models_params(name, model_type),
+            follow_redirects=False,
+        )
+
+    async def enqueue(
+        self, input_source: LocalInputSource | URLInputSource, params: BaseParameters
+    ) -> JobResponse:
+        """
+        Enqueues a document to a given model.
+
+        :param input_source: Input object.
+        :param params: Parameters
+        :return: A valid job response.
+        """
+        response = await self.req_post_inference_enqueue(
+            input_source=input_source, params=params, slug=params.get_enqueue_slug()
+        )
+        return self._parse_enqueue_response(response)
+
+    async def get_job(self, job_id: str) -> JobResponse:
+        """
+        Get the status of an inference that was previously enqueued.
+
+        :param job_id: UUID of the job to retrieve.
+        :return: A job response.
+        """
+        response = await self.req_get_job(job_id)
+        return self._parse_job_response(response)
+
+    async def get_result(
+        self, response_type: type[ResponseT], inference_id: str
+    ) -> ResponseT:
+        """
+        Get the result of an inference that was previously enqueued.
+
+        :param response_type: Type of the response to return.
+        :param inference_id: UUID of the inference to retrieve.
+        :return: The result of the inference.
+        """
+        response = await self.req_get_inference(
+            inference_id, response_type.get_result_slug()
+        )
+        return self._parse_result_response(response_type, response)
+
+    async def get_result_by_url(
+        self, response_type: type[ResponseT], url: str
+    ) -> ResponseT:
+        """
+        Get the result of an inference that was previously enqueued by its URL.
+
+        :param response_type: Type of the response to return.
+        :param url: URL of the inference to retrieve.
+        :return: The result of the inference.
+        """
+        response = await self.req_get_inference_by_url(url)
+        return self._parse_result_response(response_type, response)
+
+    async def get_models(
+        self, name: str | None, model_type: str | None
+    ) -> SearchResponse:
+        """
+        Get a list of models matching the provided name and type.
+
+        :param name: Name of the model to filter by.
+        :param model_type: Type of the model to filter by.
+        :return: A list of models matching the provided criteria.
+        """
+        logger.debug("Fetching models matching: name=%s and type=%s", name, model_type)
+        response = await self.req_get_search_models(name, model_type)
+        return self._parse_search_response(response)
+
+    async def close(self) -> None:
+        """Closes the underlying HTTP client."""
+        if self.http_client and not self.http_client.is_closed:
+            await self.http_client.aclose()
@@ -1,12 +1,21 @@
 import os
-from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
 from typing import TypeVar
 
 import httpx
 
+from mindee.client_options.http_options import HTTPOptions
 from mindee.input.local_input_source import LocalInputSource
 from mindee.input.url_input_source import URLInputSource
 from mindee.logger import logger
+from mindee.mindee_http.http_client_mixin import HTTPClientMixin
+from mindee.mindee_http.rate_limiter import (
+    ENQUEUE_BUCKET,
+    POLLING_BUCKET,
+    RESULT_BUCKET,
+)
+from mindee.mindee_http.retry_after import get_retry_after
 from mindee.mindee_http.settings_mixin import SettingsMixin
 from mindee.parsing.common.string_dict import StringDict
 from mindee.v1.mindee_http.base_settings import USER_AGENT
@@ -36,18 +45,16 @@
 ResponseT = TypeVar("ResponseT", bound=BaseResponse)
 
 
-class MindeeAPIV2(SettingsMixin):
-    """Settings class relating to API V2 requests."""
+class BaseMindeeAPIV2(SettingsMixin):
+    """Settings common to the synchronous and asynchronous API V2 clients."""
 
     url_root: str
     """Root of the URL to use for polling."""
     api_key: str | None
     """API Key for the client."""
-    http_client: httpx.Client | None
-    """HTTP client for making requests."""
     request_timeout: float
 
-    def __init__(self, api_key: str | None, http_client: httpx.Client | None = None):
+    def __init__(self, api_key: str | None):
         self.api_key = (
             api_key
             if api_key
@@ -63,7 +70,6 @@ def __init__(self, api_key: str | None, http_client: httpx.Client | None = None)
                 f"'{API_KEY_V2_ENV_NAME}' environment variable."
             )
         self.url_root = f"{self.base_url.rstrip('/')}"
-        self.http_client = http_client
         self.request_timeout = float(
             os.environ.get(REQUEST_TIMEOUT_ENV_NAME, TIMEOUT_DEFAULT)
         )
@@ -88,6 +94,98 @@ def set_from_env(self) -> None:
                 func(env_val)
                 logger.debug("Value was set from env: %s", name)
 
+    @contextmanager
+    def _get_enqueue_kwargs(
+        self,
+        input_source: LocalInputSource | URLInputSource,
+        params: BaseParameters,
+    ) -> Iterator[StringDict]:
+        """
+        Build the body of an enqueue request.
+
+        Local files are streamed, they stay open until the context is exited.
+
+        :param input_source: Input object.
+        :param params: Options for the enqueueing of the document.
+        :return: Keyword arguments to pass to the HTTP client.
+        """
+        data = params.get_form_data()
+        post_kwargs: StringDict = {}
+        with ExitStack() as stack:
+            if isinstance(input_source, LocalInputSource):
+                post_kwargs["files"] = {
+                    "file": stack.enter_context(
+                        input_source.open_for_upload(params.close_file)
+                    )
+                }
+            elif isinstance(input_source, URLInputSource):
+                data["url"] = input_source.url
+            post_kwargs["data"] = data
+            yield post_kwargs
+
+    @staticmethod
+    def _get_search_models_params(
+        name: str | None, model_type: str | None
+    ) -> dict[str, str]:
+        params = {}
+        if name:
+            params["name"] = name
+        if model_type:
+            params["model_type"] = model_type
+        return params
+
+    @staticmethod
+    def _response_json(response: httpx.Response) -> StringDict:
+        try:
+            return response.json()
+        except httpx.DecodingError as e:
+            raise MindeeHTTPUnknownErrorV2(
+                f"HTTP {response.status_code} response is not valid JSON: "
+                f"{response.text}"
+            ) from e
+
+    def _parse_job_response(self, response: httpx.Response) -> JobResponse:
+        dict_response = self._response_json(response)
+        if not is_valid_get_response(response):
+            handle_error_v2(dict_response)
+        job_response = JobResponse(dict_response)
+        job_response.retry_after_sec = get_retry_after(response)
+        return job_response
+
+    def _parse_enqueue_response(self, response: httpx.Response) -> JobResponse:
+        dict_response = self._response_json(response)
+        if not is_valid_post_response(response):
+            handle_error_v2(dict_response)
+        return JobResponse(dict_response)
+
+    def _parse_result_response(
+        self, response_type: type[ResponseT], response: httpx.Response
+    ) -> ResponseT:
+        dict_response = self._response_json(response)
+        if not is_valid_get_response(response):
+            handle_error_v2(dict_response)
+        return response_type(dict_response)
+
+    def _parse_search_response(self, response: httpx.Response) -> SearchResponse:
+        dict_response = self._response_json(response)
+        if not is_valid_get_response(response):
+            handle_error_v2(dict_response)
+        return SearchResponse(dict_response)
+
+
+class MindeeAPIV2(HTTPClientMixin, BaseMindeeAPIV2):
+    """Settings class relating to API V2 requests."""
+
+    def __init__(
+        self,
+        api_key: str | None,
+        http_client: httpx.Client | None = None,
+        http_options: HTTPOptions | None = None,
+    ):
+        super().__init__(api_key)
+        self.http_client = http_client
+        self.http_options = http_options or HTTPOptions()
+
     def req_post_inference_enqueue(
         self,
         input_source: LocalInputSource | URLInputSource,
@@ -102,28 +200,16 @@ def req_post_inference_enqueue(
         :param slug: Slug to use for the enqueueing, defaults to 'inferences'.
         :return: httpx response.
         """
-        data = params.get_form_data()
         url = f"{self.url_root}/v2/{slug}/enqueue"
-        post_kwargs: StringDict = {}
-        if isinstance(input_source, LocalInputSource):
-            post_kwargs["files"] = {
-                "file": input_source.read_contents(params.close_file)
-            }
-        elif isinstance(input_source, URLInputSource):
-            data["url"] = input_source.url
-
-        post_caller: Callable
-        if self.http_client is None or self.http_client.is_closed:
-            post_caller = httpx.post
-            post_kwargs["timeout"] = self.request_timeout
-        else:
-            post_caller = self.http_client.post
-        return post_caller(
-            url,
-            headers=self.base_headers,
-            data=data,
-            **post_kwargs,
-        )
+        with self._get_enqueue_kwargs(input_source, params) as post_kwargs:
+            return self._request(
+                "POST",
+                url,
+                self.request_timeout,
+                bucket=ENQUEUE_BUCKET,
+                headers=self.base_headers,
+                **post_kwargs,
+            )
 
     def req_get_job(self, job_id: str) -> httpx.Response:
         """
@@ -131,18 +217,13 @@ def req_get_job(self, job_id: str) -> httpx.Response:
 
         :param job_id: Job ID, returned by the enqueue request.
         """
-        get_caller: Callable
-        get_kwargs: StringDict = {}
-        if self.http_client is None or self.http_client.is_closed:
-            get_caller = httpx.get
-            get_kwargs["timeout"] = self.request_timeout
-        else:
-            get_caller = self.http_client.get
-        return get_caller(
-            url=f"{self.url_root}/v2/jobs/{job_id}",
+        return self._request(
+            "GET",
+            f"{self.url_root}/v2/jobs/{job_id}",
+            self.request_timeout,
+            bucket=POLLING_BUCKET,
             headers=self.base_headers,
             follow_redirects=False,
-            **get_kwargs,
         )
 
     def req_get_inference_by_url(self, url: str) -> httpx.Response:
@@ -153,18 +234,13 @@ def req_get_inference_by_url(self, url: str) -> httpx.Response:
         :param url: URL to use for the request.
         :return: Response object from the request.
         """
-        get_caller: Callable
-        get_kwargs: StringDict = {}
-        if self.http_client is None or self.http_client.is_closed:
-            get_caller = httpx.get
-            get_kwargs["timeout"] = self.request_timeout
-        else:
-            get_caller = self.http_client.get
-        return get_caller(
-            url=url,
+        return self._request(
+            "GET",
+            url,
+            self.request_timeout,
+            bucket=RESULT_BUCKET,
             headers=self.base_headers,
             follow_redirects=False,
-            **get_kwargs,
         )
 
     def req_get_inference(self, inference_id: str, slug: str) -> httpx.Response:
@@ -174,18 +250,13 @@ def req_get_inference(self, inference_id: str, slug: str) -> httpx.Response:
         :param inference_id: Inference ID, returned by the job request.
         :param slug: Slug of the inference, defaults to nothing.
         """
-        get_caller: Callable
-        get_kwargs: StringDict = {}
-        if self.http_client is None or self.http_client.is_closed:
-            get_caller = httpx.get
-            get_kwargs["timeout"] = self.request_timeout
-        else:
-            get_caller = self.http_client.get
-        return get_caller(
-            url=f"{self.url_root}/v2/{slug}/{inference_id}",
+        return self._request(
+            "GET",
+            f"{self.url_root}/v2/{slug}/{inference_id}",
+            self.request_timeout,
+            bucket=RESULT_BUCKET,
             headers=self.base_headers,
             follow_redirects=False,
-            **get_kwargs,
         )
 
     def req_get_search_models(
@@ -197,24 +268,13 @@ def req_get_search_models(
         :param model_type: Type of model to search for (exact match).
         :return: Response object containing search results.
         """
-        get_caller: Callable
-        get_kwargs: StringDict = {}
-        if self.http_client is None or self.http_client.is_closed:
-            get_caller = httpx.get
-            get_kwargs["timeout"] = self.request_timeout
-        else:
-            get_caller = self.http_client.get
-        params = {}
-        if name:
-            params["name"] = name
-        if model_type:
-            params["model_type"] = model_type
-        return get_caller(
-            url=f"{self.url_root}/v2/search/models",
+        return self._request(
+            "GET",
+            f"{self.url_root}/v2/search/models",
+            self.request_timeout,
             headers=self.base_headers,
-            params=params,
+            params=self._get_search_models_params(name, model_type),
             follow_redirects=False,
-            **get_kwargs,
         )
 
     def enqueue(
@@ -229,11 +289,7 @@ def enqueue(
         response = self.req_post_inference_enqueue(
             input_source=input_source, params=params, slug=params.get_enqueue_slug()
         )
-        dict_response = self._response_json(response)
-
-        if not is_valid_post_response(response):
-            handle_error_v2(dict_response)
-        return JobResponse(dict_response)
+        return self._parse_enqueue_response(response)
 
     def get_job(self, job_id: str) -> JobResponse:
         """
@@ -245,10 +301,7 @@ def get_job(self, job_id: str) -> JobResponse:
         :return: A job response.
         """
         response = self.req_get_job(job_id)
-        dict_response = self._response_json(response)
-        if not is_valid_get_response(response):
-            handle_error_v2(dict_response)
-        return JobResponse(dict_response)
+        return self._parse_job_response(response)
 
     def get_result(self, response_type: type[ResponseT], inference_id: str):
         """
@@ -259,10 +312,7 @@ def get_result(self, response_type: type[ResponseT], inference_id: str):
         :return: The result of the inference.
         """
         response = self.req_get_inference(inference_id, response_type.get_result_slug())
-        dict_response = self._response_json(response)
-        if not is_valid_get_response(response):
-            handle_error_v2(dict_response)
-        return response_type(dict_response)
+        return self._parse_result_response(response_type, response)
 
     def get_result_by_url(self, response_type: type[ResponseT], url: str):
         """
@@ -273,10 +323,7 @@ def get_result_by_url(self, response_type: type[ResponseT], url: str):
         :return: The result of the inference.
         """
         response = self.req_get_inference_by_url(url)
-        dict_response = self._response_json(response)
-        if not is_valid_get_response(response):
-            handle_error_v2(dict_response)
-        return response_type(dict_response)
+        return self._parse_result_response(response_type, response)
 
     def get_models(self, name: str | None, model_type: str | None):
         """
@@ -288,28 +335,10 @@ def get_models(self, name: str | None, model_type: str | None):
         """
         logger.debug("Fetching models matching: name=%s and type=%s", name, model_type)
         response = self.req_get_search_models(name, model_type)
-        dict_response = self._response_json(response)
-        if not is_valid_get_response(response):
-            handle_error_v2(dict_response)
-        return SearchResponse(dict_response)
-
-    @staticmethod
-    def _response_json(response: httpx.Response) -> StringDict:
-        try:
-            return response.json()
-        except httpx.DecodingError as e:
-            raise MindeeHTTPUnknownErrorV2(
-                f"HTTP {response.status_code} response is not valid JSON: "
-                f"{response.text}"
-            ) from e
-
-    def close(self) -> None:
-        """Closes the underlying HTTP client."""
-        if self.http_client and not self.http_client.is_closed:
-            self.http_client.close()
+        return self._parse_search_response(response)
 
     def __enter__(self):
-        self.http_client = httpx.Client()
+        self._get_http_client(self.request_timeout)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -319,7 +348,7 @@ def delete_http_client(self):
         """Delete the underlying HTTP client."""
         httpx_client = getattr(self, "http_client", None)
         if httpx_client and not self.http_client.is_closed:
-            logger.info("Force-closing unclosed Mindee Client (V2) %s.", str(self))
+            logger.debug("Force-closing unclosed Mindee Client (V2) %s.", str(self))
             self.close()
 
     def __del__(self):
@@ -8,6 +8,8 @@ class JobResponse(CommonResponse):
 
     job: Job
     """Job for the polling."""
+    retry_after_sec: float | None = None
+    """Delay requested by the server before the next polling attempt, if any."""
 
     def __init__(self, raw_response: StringDict) -> None:
         super().__init__(raw_response)
@@ -0,0 +1,3 @@
+from mindee.v2.polling.job_tracker import JobTracker
+
+__all__ = ["JobTracker"]
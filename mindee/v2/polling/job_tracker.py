@@ -0,0 +1,246 @@
+import contextlib
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from mindee.client_options.polling_options import PollingOptions
+from mindee.error.mindee_error import MindeeClientError, MindeeError
+from mindee.logger import logger
+from mindee.v2.parsing.job.job_response import JobResponse
+from mindee.v2.polling.polling_helpers import (
+    get_processed_result_url,
+    record_job_duration,
+    validate_polling_options,
+)
+
+if TYPE_CHECKING:
+    from mindee.v2.client import Client
+
+DEFAULT_POLLING_WORKERS = 4
+
+
+class _TrackedJob:
+    """State of a job registered on a tracker."""
+
+    job_id: str
+    polling_options: PollingOptions
+    page_count: int | None
+    expected_finish: float
+    future: "Future[JobResponse]"
+    try_counter: int
+
+    def __init__(
+        self,
+        job_id: str,
+        polling_options: PollingOptions,
+        page_count: int | None,
+        expected_finish: float,
+    ) -> None:
+        self.job_id = job_id
+        self.polling_options = polling_options
+        self.page_count = page_count
+        self.expected_finish = expected_finish
+        self.future = Future()
+        self.try_counter = 0
+
+
+class JobTracker:
+    """
+    Polls many V2 jobs from a single scheduler.
+
+    Jobs are kept in a priority queue keyed by their next due time, then by their
+    expected finish time.
+    A single scheduler thread hands due jobs over to a small, fixed pool of polling
+    workers, so the number of threads does not grow with the number of jobs.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        polling_options: PollingOptions | None = None,
+        max_workers: int = DEFAULT_POLLING_WORKERS,
+    ) -> None:
+        """
+        Polls many V2 jobs from a single scheduler.
+
+        :param client: V2 client used to poll the jobs.
+        :param polling_options: Default polling options for registered jobs.
+        :param max_workers: Maximum number of polling requests sent at once.
+        """
+        if max_workers < 1:
+            raise MindeeClientError("Cannot set polling workers to less than 1.")
+        self._client = client
+        self._polling_options = polling_options or PollingOptions()
+        self._max_workers = max_workers
+        self._queue: list[tuple[float, float, int, _TrackedJob]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._executor: ThreadPoolExecutor | None = None
+        self._scheduler: threading.Thread | None = None
+        self._closed = False
+
+    def register(
+        self,
+        job_id: str,
+        polling_options: PollingOptions | None = None,
+        expected_duration_sec: float | None = None,
+        callback: Callable[["Future[JobResponse]"], None] | None = None,
+        model_id: str | None = None,
+        page_count: int | None = None,
+    ) -> "Future[JobResponse]":
+        """
+        Start tracking a job.
+
+        :param job_id: UUID of the job to track.
+        :param polling_options: Polling options for this job,
+            defaults to the tracker's options.
+        :param expected_duration_sec: Expected processing time of the job, if known.
+            The first poll is not sent before this delay has elapsed.
+        :param callback: Function called with the future once the job is done.
+        :param model_id: ID of the model processing the document,
+            passed on to the polling strategy.
+        :param page_count: Number of pages in the document,
+            passed on to the polling strategy.
+        :return: A future resolving to the job response once the job is processed.
+            It raises a ``MindeeError`` if the job failed or was not processed in time.
+        """
+        options = polling_options or self._polling_options
+        validate_polling_options(options)
+        now = time.monotonic()
+        expected_finish = now + (expected_duration_sec or 0)
+        tracked_job = _TrackedJob(job_id, options, page_count, expected_finish)
+        if callback:
+            tracked_job.future.add_done_callback(callback)
+        with self._condition:
+            if self._closed:
+                raise MindeeClientError("Cannot register a job on a closed tracker.")
+            self._start()
+            self._schedule(
+                tracked_job,
+                max(
+                    now + options.get_initial_delay(model_id, page_count),
+                    expected_finish,
+                ),
+            )
+        logger.debug("Tracking job: %s", job_id)
+        return tracked_job.future
+
+    @property
+    def pending_count(self) -> int:
+        """Number of jobs currently waiting for their next poll."""
+        with self._condition:
+            return len(self._queue)
+
+    def close(self) -> None:
+        """Stop the scheduler. Jobs still being tracked are cancelled."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            remaining = [entry[-1] for entry in self._queue]
+            self._queue.clear()
+            self._condition.notify_all()
+        for tracked_job in remaining:
+            tracked_job.future.cancel()
+        if self._scheduler:
+            self._scheduler.join()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _start(self) -> None:
+        """Start the scheduler thread and polling workers on first use."""
+        if self._scheduler:
+            return
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="mindee-job-poll"
+        )
+        self._scheduler = threading.Thread(
+            target=self._run, name="mindee-job-tracker", daemon=True
+        )
+        self._scheduler.start()
+
+    def _schedule(self, tracked_job: _TrackedJob, due_time: float) -> None:
+        """Add a job to the queue. Must be called while holding the condition."""
+        heapq.heappush(
+            self._queue,
+            (due_time, tracked_job.expected_finish, next(self._sequence), tracked_job),
+        )
+        self._condition.notify()
+
+    def _run(self) -> None:
+        """Scheduler loop: wait for the next due job and hand it to a worker."""
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._queue:
+                        wait_time = self._queue[0][0] - time.monotonic()
+                        if wait_time <= 0:
+                            break
+                        self._condition.wait(wait_time)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+                tracked_job = heapq.heappop(self._queue)[-1]
+            assert self._executor is not None
+            self._executor.submit(self._poll, tracked_job)
+
+    def _poll(self, tracked_job: _TrackedJob) -> None:
+        """Poll a single job, then either resolve it or schedule its next poll."""
+        if tracked_job.future.cancelled():
+            return
+        try:
+            job_response = self._client.get_job(tracked_job.job_id)
+            if get_processed_result_url(job_response):
+                record_job_duration(
+                    tracked_job.polling_options, job_response, tracked_job.page_count
+                )
+                self._resolve(tracked_job, result=job_response)
+                return
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._resolve(tracked_job, error=e)
+            return
+        tracked_job.try_counter += 1
+        if tracked_job.try_counter >= tracked_job.polling_options.max_retries:
+            self._resolve(
+                tracked_job,
+                error=MindeeError(
+                    f"Couldn't retrieve document after "
+                    f"{tracked_job.try_counter + 1} tries."
+                ),
+            )
+            return
+        with self._condition:
+            if self._closed:
+                tracked_job.future.cancel()
+                return
+            self._schedule(
+                tracked_job,
+                time.monotonic()
+                + tracked_job.polling_options.get_delay(
+                    tracked_job.try_counter, job_response.retry_after_sec
+                ),
+            )
+
+    @staticmethod
+    def _resolve(
+        tracked_job: _TrackedJob,
+        result: JobResponse | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """Set the outcome of a job, unless its future was cancelled meanwhile."""
+        with contextlib.suppress(InvalidStateError):
+            if error:
+                tracked_job.future.set_exception(error)
+            else:
+                tracked_job.future.set_result(result)  # type: ignore[arg-type]
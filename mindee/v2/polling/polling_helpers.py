@@ -0,0 +1,102 @@
+from mindee.client_mixin import ClientMixin
+from mindee.client_options.polling_options import PollingOptions
+from mindee.error.mindee_error import MindeeError
+from mindee.input.local_input_source import LocalInputSource
+from mindee.input.url_input_source import URLInputSource
+from mindee.logger import logger
+from mindee.parsing.common.common_response import CommonStatus
+from mindee.v2.client_options.base_parameters import BaseParameters
+from mindee.v2.parsing.job.job_response import JobResponse
+
+
+def validate_polling_options(polling_options: PollingOptions) -> None:
+    """
+    Check that polling options are within the allowed bounds.
+
+    :param polling_options: Options to check.
+    :raises MindeeClientError: If any value is out of bounds.
+    """
+    ClientMixin._validate_async_params(  # pylint: disable=protected-access
+        polling_options.initial_delay_sec,
+        polling_options.delay_sec,
+        polling_options.max_retries,
+    )
+
+
+def get_polling_options(params: BaseParameters) -> PollingOptions:
+    """
+    Set default polling options on the parameters if needed, and validate them.
+
+    :param params: Parameters to set when sending a file.
+    :return: The polling options to use.
+    """
+    if not params.polling_options:
+        params.polling_options = PollingOptions()
+    validate_polling_options(params.polling_options)
+    return params.polling_options
+
+
+def get_processed_result_url(job_response: JobResponse) -> str | None:
+    """
+    Check the status of a polled job.
+
+    :param job_response: Job response returned by a polling request.
+    :return: URL of the result once the job is processed, ``None`` while it is running.
+    :raises MindeeError: If the job failed.
+    """
+    if job_response.job.status == CommonStatus.FAILED.value:
+        if job_response.job.error:
+            detail = job_response.job.error.detail
+        else:
+            detail = "No error detail available."
+        raise MindeeError(f"Parsing failed for job {job_response.job.id}: {detail}")
+    if (
+        job_response.job.status == CommonStatus.PROCESSED.value
+        and job_response.job.result_url
+    ):
+        logger.debug(
+            "Job ID %s completed processing at: %s",
+            job_response.job.id,
+            job_response.job.completed_at,
+        )
+        return job_response.job.result_url
+    return None
+
+
+def get_page_count(
+    input_source: LocalInputSource | URLInputSource, polling_options: PollingOptions
+) -> int | None:
+    """
+    Number of pages of a document, used to estimate its processing time.
+
+    Pages are only counted when the polling strategy uses them.
+
+    :param input_source: The document/source file to use. Can be local or remote.
+    :param polling_options: Options used to poll the document.
+    :return: The number of pages, ``None`` for remote documents or when not needed.
+    """
+    if not polling_options.strategy.uses_page_count:
+        return None
+    if isinstance(input_source, LocalInputSource):
+        return input_source.page_count
+    return None
+
+
+def record_job_duration(
+    polling_options: PollingOptions,
+    job_response: JobResponse,
+    page_count: int | None,
+) -> None:
+    """
+    Feed the processing time of a finished job back to the polling strategy.
+
+    :param polling_options: Polling options used for the job.
+    :param job_response: Job response of the processed job.
+    :param page_count: Number of pages in the document, if known.
+    """
+    job = job_response.job
+    if not job.completed_at:
+        return
+    polling_options.strategy.record_duration(
+        job.model_id, page_count, (job.completed_at - job.created_at).total_seconds()
+    )
@@ -1,5 +1,5 @@
 from mindee.image.extracted_image import ExtractedImage
-from mindee.image.image_extractor import extract_multiple_images_from_source
+from mindee.image.image_extractor import ImageExtractor
 from mindee.input.local_input_source import LocalInputSource
 from mindee.parsing.common.string_dict import StringDict
 from mindee.v2.parsing.inference.field import FieldLocation
@@ -30,14 +30,17 @@ def __str__(self) -> str:
         return f"* :Location: {self.location}\n  :Object Type: {self.object_type}"
 
     def extract_from_input_source(
-        self, input_source: LocalInputSource
+        self, input_source: LocalInputSource, perspective: bool = False
     ) -> ExtractedImage:
         """
         Apply the split range inference to a file and return a single extracted PDF.
 
         :param input_source: Local file to apply the inference to
+        :param perspective: Whether to straighten a skewed crop with a perspective
+            transform, instead of cropping to its bounding box.
         :return: Extracted PDF
         """
-        return extract_multiple_images_from_source(
-            input_source, self.location.page, [self.location.polygon]
-        )[0]
+        with ImageExtractor(input_source) as extractor:
+            return extractor.extract_page_images(
+                self.location.page, [self.location.polygon], perspective
+            )[0]
@@ -21,11 +21,13 @@ def __str__(self) -> str:
         return out_str
 
     def extract_from_input_source(
-        self, input_source: LocalInputSource
+        self, input_source: LocalInputSource, perspective: bool = False
     ) -> ExtractedImages:
         """
         Apply all the crops to a file and return a single extracted PDF.
 
         :param input_source: Input file
+        :param perspective: Whether to straighten skewed crops with a perspective
+            transform, instead of cropping to their bounding box.
         """
-        return extract_multiple_crops(input_source, self.crops)
+        return extract_multiple_crops(input_source, self.crops, perspective=perspective)
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import ctypes
+import io
 import operator
 import os
 from functools import reduce
 
 import pytest
 
+from mindee.error.mindee_error import MindeeError
 from mindee.image.image_compressor import compress_image
-from mindee.input import PathInput
+from mindee.input import BytesInput, PathInput, compress_inputs
+from mindee.pdf import pdf_compressor
+from mindee.pdf.pdf_char_data import PDFCharData
 from mindee.pdf.pdf_compressor import compress_pdf
-from mindee.pdf.pdf_utils import extract_text_from_pdf
+from mindee.pdf.pdf_page_text import PDFPageText
+from mindee.pdf.pdf_utils import extract_text_from_pdf, pdf_has_source_text
+from mindee.pdf.render_options import RenderOptions
 from tests.utils import (
     FILE_TYPES_DIR,
     OUTPUT_DIR,
@@ -23,6 +30,32 @@
 RECEIPT_PATH = FILE_TYPES_DIR / "receipt.jpg"
 
 
+def _make_chars(
+    text: str,
+    top: int = 50,
+    font_name: str = "Helvetica",
+    left: int = 20,
+    page_id: int = 0,
+) -> list[PDFCharData]:
+    return [
+        PDFCharData(
+            char=char,
+            left=left + 10 * i,
+            right=left + 8 + 10 * i,
+            top=top,
+            bottom=top + 12,
+            font_name=font_name,
+            font_size=12,
+            font_weight=400,
+            font_flags=0,
+            font_stroke_color=(0, 0, 0, 255),
+            font_fill_color=(0, 0, 0, 255),
+            page_id=page_id,
+        )
+        for i, char in enumerate(text)
+    ]
+
+
 def test_image_quality_compress_from_input_source():
     receipt_input = PathInput(RECEIPT_PATH)
     receipt_input.compress(40)
@@ -129,6 +162,29 @@ def test_pdf_input_has_text():
     assert not has_no_source_text_since_its_image_input.has_source_text()
 
 
+def test_pdf_has_source_text_checks_requested_pages():
+    pdfium = pytest.importorskip("pypdfium2")
+    pdf = pdfium.PdfDocument.new()
+    pdf.new_page(300, 400)
+    page = pdf.new_page(300, 400)
+    pdf_compressor.add_text_to_pdf_page(
+        page,
+        1,
+        [[], _make_chars("A", page_id=1)],
+    )
+    pdf_buffer = io.BytesIO()
+    pdf.save(pdf_buffer)
+    pdf_buffer.seek(3)
+
+    assert pdf_has_source_text(pdf_buffer)
+    assert pdf_buffer.tell() == 3
+    assert not pdf_has_source_text(pdf_buffer.getvalue(), max_pages=1)
+    assert pdf_has_source_text(pdf)
+    assert len(pdf) == 2
+    with pytest.raises(MindeeError):
+        pdf_has_source_text(pdf, max_pages=0)
+
+
 def test_pdf_compress_from_input_source():
     pdf_resize_input = PathInput(
         V1_DATA_DIR / "products" / "invoice_splitter" / "default_sample.pdf"
@@ -207,6 +263,337 @@ def test_pdf_compress_with_text_does_not_compress():
     assert compressed_with_text == initial_with_text.file_object.read()
 
 
+def test_pdf_compress_renders_pages_once(monkeypatch):
+    pdfium = pytest.importorskip("pypdfium2")
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(3):
+        pdf.new_page(200, 300)
+    pdf_buffer = io.BytesIO()
+    pdf.save(pdf_buffer)
+    pdf.close()
+
+    render_calls = []
+    render_pages = pdf_compressor._render_pages
+    monkeypatch.setattr(
+        pdf_compressor,
+        "_render_pages",
+        lambda *args: render_calls.append(1) or render_pages(*args),
+    )
+    # Force two lower quality steps.
+    attempts = iter([False, False, True])
+    monkeypatch.setattr(
+        pdf_compressor, "_is_compression_successful", lambda *_: next(attempts)
+    )
+
+    compressed = compress_pdf(pdf_buffer.getvalue(), 85, max_workers=2)
+
+    assert len(render_calls) == 1
+    assert len(pdfium.PdfDocument(compressed)) == 3
+
+
+def test_pdf_compress_lowers_quality_until_smaller(monkeypatch):
+    noise = Image.effect_noise((400, 500), 64).convert("RGB")
+    qualities = []
+    compress_pages_with_quality = pdf_compressor._compress_pages_with_quality
+    monkeypatch.setattr(
+        pdf_compressor,
+        "_compress_pages_with_quality",
+        lambda pages, quality, executor: (
+            qualities.append(quality)
+            or compress_pages_with_quality(pages, quality, executor)
+        ),
+    )
+    first_pass_size = len(pdf_compressor._encode_page(noise, 85))
+
+    # The first pass is too big once the PDF overhead is added.
+    compressed_pages = pdf_compressor._compress_pdf_pages([noise], first_pass_size, 85)
+
+    assert compressed_pages is not None
+    assert len(qualities) > 1
+    assert qualities == sorted(qualities, reverse=True)
+    assert len(compressed_pages[0][0]) < first_pass_size
+
+
+def test_compress_to_target_size():
+    noise = Image.effect_noise((800, 1000), 64).convert("RGB")
+    png_buffer = io.BytesIO()
+    noise.save(png_buffer, format="PNG")
+
+    small = compress_image(png_buffer.getvalue(), 90, target_bytes=50_000)
+    large = compress_image(png_buffer.getvalue(), 90, target_bytes=200_000)
+    assert len(small) <= 50_000
+    assert 50_000 < len(large) <= 200_000
+
+    pdf_buffer = io.BytesIO()
+    noise.save(pdf_buffer, format="PDF", save_all=True, append_images=[noise])
+    compressed_pdf = compress_pdf(pdf_buffer.getvalue(), 90, target_bytes=300_000)
+    assert len(compressed_pdf) <= 300_000
+
+
+def test_compress_image_decodes_jpeg_at_reduced_size(monkeypatch):
+    jpeg_plugin = pytest.importorskip("PIL.JpegImagePlugin")
+    photo = Image.effect_noise((1600, 1200), 64).convert("RGB")
+    jpeg_buffer = io.BytesIO()
+    photo.save(jpeg_buffer, format="JPEG")
+
+    decoded_sizes = []
+    original_draft = jpeg_plugin.JpegImageFile.draft
+
+    def recording_draft(self, *args, **kwargs):
+        result = original_draft(self, *args, **kwargs)
+        if result is not None:
+            decoded_sizes.append(self.size)
+        return result
+
+    monkeypatch.setattr(jpeg_plugin.JpegImageFile, "draft", recording_draft)
+
+    default = compress_image(jpeg_buffer.getvalue(), 80, 200)
+    fast = compress_image(
+        jpeg_buffer.getvalue(), 80, 200, resample=Image.Resampling.NEAREST, fast=True
+    )
+
+    assert decoded_sizes == [(400, 300), (200, 150)]
+    for compressed in (default, fast):
+        with Image.open(io.BytesIO(compressed)) as image:
+            assert image.size == (200, 150)
+
+
+def test_compress_inputs_in_worker_processes():
+    input_sources = []
+    for i, size in enumerate((300, 200, 400)):
+        png_buffer = io.BytesIO()
+        Image.effect_noise((size, size), 64).convert("RGB").save(png_buffer, "PNG")
+        input_sources.append(BytesInput(png_buffer.getvalue(), f"photo_{i}.png"))
+
+    results = list(compress_inputs(input_sources, 50, max_width=100, max_workers=2))
+
+    assert [result.input_source.filename for result in results] == [
+        "photo_0.png",
+        "photo_1.png",
+        "photo_2.png",
+    ]
+    for result, input_source in zip(results, input_sources, strict=True):
+        assert result.original_size == len(input_source.file_object.getvalue())
+        assert result.compressed_size < result.original_size
+        assert result.input_source.file_mimetype == "image/jpeg"
+        assert result.duration > 0
+        with Image.open(result.input_source.file_object) as image:
+            assert image.width == 100
+
+    unordered = compress_inputs(input_sources, 50, max_workers=2, ordered=False)
+    assert sorted(result.input_source.filename for result in unordered) == [
+        "photo_0.png",
+        "photo_1.png",
+        "photo_2.png",
+    ]
+
+
+def test_compress_inputs_reports_failed_files():
+    input_sources = []
+    for i in range(3):
+        png_buffer = io.BytesIO()
+        Image.effect_noise((200, 200), 64).convert("RGB").save(png_buffer, "PNG")
+        input_sources.append(BytesInput(png_buffer.getvalue(), f"photo_{i}.png"))
+    truncated_png = input_sources[1].file_object.getvalue()[:100]
+    input_sources[1] = BytesInput(truncated_png, "truncated.png")
+
+    results = list(compress_inputs(input_sources, 50, max_workers=2))
+
+    assert [result.filename for result in results] == [
+        "photo_0.png",
+        "truncated.png",
+        "photo_2.png",
+    ]
+    assert results[1].input_source is None
+    assert results[1].original_size == len(truncated_png)
+    assert results[1].error is not None
+    assert all(result.error is None for result in (results[0], results[2]))
+    assert all(result.input_source for result in (results[0], results[2]))
+
+
+def test_pdf_compress_with_render_options():
+    pdfium = pytest.importorskip("pypdfium2")
+    noise = Image.effect_noise((400, 500), 64).convert("RGB")
+    pdf_buffer = io.BytesIO()
+    noise.save(pdf_buffer, format="PDF")
+
+    compressed_pdf = compress_pdf(
+        pdf_buffer.getvalue(), 85, render_options=RenderOptions(dpi=36)
+    )
+
+    page = pdfium.PdfDocument(compressed_pdf)[0]
+    assert page.get_size() == (400, 500)
+    assert page.render().to_pil().getbbox() is not None
+    pdf_image = next(page.get_objects())
+    assert pdf_image.get_bounds() == (0, 0, 400, 500)
+    assert pdf_image.get_metadata().width == 200
+
+
+def test_extract_text_reads_styles_per_text_object():
+    pdfium = pytest.importorskip("pypdfium2")
+    pdf = pdfium.PdfDocument.new()
+    page = pdf.new_page(300, 400)
+    written_chars = _make_chars("Hi") + _make_chars("Yo", top=100, font_name="Courier")
+    pdf_compressor.add_text_to_pdf_page(page, 0, [written_chars])
+    pdf_buffer = io.BytesIO()
+    pdf.save(pdf_buffer)
+
+    # pdfium inserts whitespace between distant characters and between lines.
+    extracted = [
+        char
+        for char in extract_text_from_pdf(pdf_buffer.getvalue())[0]
+        if not char.char.isspace()
+    ]
+
+    assert [char.char for char in extracted] == ["H", "i", "Y", "o"]
+    assert [char.font_name for char in extracted] == [
+        "Helvetica",
+        "Helvetica",
+        "Courier",
+        "Courier",
+    ]
+    # Each line is written as one text object, stretched over the source boxes.
+    assert [char.left for char in extracted[::2]] == pytest.approx([20, 20], abs=2)
+    assert all(20 <= char.left <= char.right <= 39 for char in extracted)
+    assert all(isinstance(value, int) for value in extracted[0].font_fill_color)
+
+
+def test_add_text_writes_one_invisible_object_per_run():
+    pdfium = pytest.importorskip("pypdfium2")
+    pdfium_c = pytest.importorskip("pypdfium2.raw")
+    written_chars = (
+        _make_chars("ab cd")
+        + _make_chars("ef", font_name="Courier")
+        + _make_chars("gh\n", top=100)
+    )
+    page_text = PDFPageText(0, written_chars)
+
+    runs = list(page_text.iter_runs())
+
+    assert [run.text for run in runs] == ["ab cd", "ef", "gh"]
+    assert (runs[0].left, runs[0].right, runs[0].top) == (20, 68, 50)
+
+    pdf = pdfium.PdfDocument.new()
+    page = pdf.new_page(300, 400)
+    pdf_compressor.add_text_to_pdf_page(page, 0, [page_text])
+    text_objects = list(page.get_objects())
+
+    assert len(text_objects) == 3
+    assert all(
+        pdfium_c.FPDFTextObj_GetTextRenderMode(text_object.raw)
+        == pdfium_c.FPDF_TEXTRENDERMODE_INVISIBLE
+        for text_object in text_objects
+    )
+    assert page.render().to_pil().convert("L").getextrema() == (255, 255)
+
+
+def _make_text_pdf(lines: list[str]) -> bytes:
+    pdfium = pytest.importorskip("pypdfium2")
+    pdfium_c = pytest.importorskip("pypdfium2.raw")
+    pdf = pdfium.PdfDocument.new()
+    page = pdf.new_page(300, 400)
+    font = pdfium_c.FPDFText_LoadStandardFont(pdf.raw, b"Helvetica")
+    for line_index, line in enumerate(lines):
+        text_object = pdfium_c.FPDFPageObj_CreateTextObj(pdf.raw, font, 14)
+        encoded_text = (line + "\0").encode("utf-16-le")
+        pdfium_c.FPDFText_SetText(
+            text_object,
+            (ctypes.c_ushort * (len(encoded_text) // 2)).from_buffer_copy(encoded_text),
+        )
+        pdfium_c.FPDFPageObj_Transform(
+            text_object, 1, 0, 0, 1, 30, 317 - 30 * line_index
+        )
+        pdfium_c.FPDFPage_InsertObject(page.raw, text_object)
+    pdfium_c.FPDFPage_GenerateContent(page.raw)
+    pdf_buffer = io.BytesIO()
+    pdf.save(pdf_buffer)
+    return pdf_buffer.getvalue()
+
+
+def test_add_text_groups_real_font_lines_into_runs():
+    pdfium = pytest.importorskip("pypdfium2")
+    # Narrow glyphs and punctuation stay in the run of their line.
+    lines = ["Hello world foo", "Quick brown jumps", "gyp Tall qj", "a i j l . , ! lil"]
+    pdf_data = _make_text_pdf(lines)
+    source_text = extract_text_from_pdf(pdf_data)[0]
+
+    # Tall and short glyphs of a line have different tops.
+    assert len(set(source_text.tops)) > len(lines)
+    assert [run.text for run in source_text.iter_runs()] == lines
+
+    # Text is added to a blank page, as compress_pdf does over the rendered page.
+    pdf = pdfium.PdfDocument.new()
+    page = pdf.new_page(300, 400)
+    pdf_compressor.add_text_to_pdf_page(page, 0, [source_text])
+    assert len(list(page.get_objects())) == len(lines)
+    pdf_buffer = io.BytesIO()
+    pdf.save(pdf_buffer)
+
+    rewritten_text = extract_text_from_pdf(pdf_buffer.getvalue())[0]
+    source_chars = [char for char in source_text if not char.char.isspace()]
+    rewritten_chars = [char for char in rewritten_text if not char.char.isspace()]
+    assert [char.char for char in rewritten_chars] == [
+        char.char for char in source_chars
+    ]
+    for source_char, rewritten_char in zip(source_chars, rewritten_chars, strict=True):
+        assert rewritten_char.top == pytest.approx(source_char.top, abs=1)
+        assert rewritten_char.bottom == pytest.approx(source_char.bottom, abs=1)
+        assert rewritten_char.left == pytest.approx(source_char.left, abs=2)
+
+
+def test_add_text_splits_runs_between_columns():
+    pdfium = pytest.importorskip("pypdfium2")
+    # Two columns of two lines, read line by line across the gutter.
+    written_chars = (
+        _make_chars("ab cd")
+        + _make_chars("ef", left=150)
+        + _make_chars("gh\n", top=100)
+        + _make_chars("ij", top=100, left=150)
+    )
+    page_text = PDFPageText(0, written_chars)
+
+    runs = list(page_text.iter_runs())
+
+    assert [run.text for run in runs] == ["ab cd", "ef", "gh", "ij"]
+    assert [(run.left, run.right) for run in runs] == [
+        (20, 68),
+        (150, 168),
+        (20, 38),
+        (150, 168),
+    ]
+
+    pdf = pdfium.PdfDocument.new()
+    page = pdf.new_page(300, 400)
+    pdf_compressor.add_text_to_pdf_page(page, 0, [page_text])
+    assert len(list(page.get_objects())) == 4
+
+
+def test_extracted_page_text_is_columnar():
+    pdfium = pytest.importorskip("pypdfium2")
+    pdf = pdfium.PdfDocument.new()
+    page = pdf.new_page(300, 400)
+    written_chars = _make_chars("Hello")
+    pdf_compressor.add_text_to_pdf_page(page, 0, [written_chars])
+    pdf_buffer = io.BytesIO()
+    pdf.save(pdf_buffer)
+
+    page_text = extract_text_from_pdf(pdf_buffer.getvalue())[0]
+
+    assert isinstance(page_text, PDFPageText)
+    # Letters share a single style, pdfium adds spaces with a style of their own.
+    letter_styles = {
+        page_text.style_indexes[i]
+        for i, codepoint in enumerate(page_text.codepoints)
+        if codepoint != ord(" ")
+    }
+    assert len(letter_styles) == 1
+    assert page_text.text.replace(" ", "") == "Hello"
+    assert "".join(char.char for char in page_text) == page_text.text
+    assert page_text[0].char == "H"
+    assert page_text[-1] == list(page_text)[-1]
+    assert [char.char for char in page_text + page_text] == list(page_text.text * 2)
+
+
 @pytest.fixture(scope="module", autouse=True)
 def cleanup():
     yield
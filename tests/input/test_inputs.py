@@ -1,5 +1,6 @@
 import io
 
+import pypdfium2 as pdfium
 import pytest
 
 from mindee.error.mimetype_error import MimeTypeError
@@ -12,6 +13,7 @@
     PathInput,
     URLInputSource,
 )
+from mindee.pdf import get_linearized_page_count
 from tests.utils import FILE_TYPES_DIR
 
 
@@ -101,3 +103,114 @@ def test_image_input_from_base64():
 def test_txt_input_from_path():
     with pytest.raises(MimeTypeError):
         PathInput(FILE_TYPES_DIR / "receipt.txt")
+
+
+def _make_pdf(page_count: int) -> bytes:
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(page_count):
+        pdf.new_page(200, 300)
+    pdf_bytes = io.BytesIO()
+    pdf.save(pdf_bytes)
+    pdf.close()
+    return pdf_bytes.getvalue()
+
+
+@pytest.mark.pypdfium2
+def test_pdf_page_count_is_lazy(monkeypatch):
+    pdf_bytes = _make_pdf(3)
+    opened = []
+    pdf_document = pdfium.PdfDocument
+
+    def counting_pdf_document(*args, **kwargs):
+        opened.append(args)
+        return pdf_document(*args, **kwargs)
+
+    monkeypatch.setattr(pdfium, "PdfDocument", counting_pdf_document)
+
+    input_source = BytesInput(pdf_bytes, "lazy.pdf")
+    assert not opened
+    assert input_source.page_count == 3
+    assert input_source.page_count == 3
+    assert len(opened) == 1
+    assert input_source.file_object.tell() == 0
+
+    input_source.page_count = 1
+    assert input_source.page_count == 1
+
+
+def test_pdf_page_count_from_linearization_dict():
+    header_template = (
+        b"%%PDF-1.7\n1 0 obj\n<< /Linearized 1 /L %010d /H [ 600 150 ] /O 4 "
+        b"/E 900 /N 42 /T 1000 >>\nendobj\n%%%%EOF\n"
+    )
+    pdf_bytes = header_template % len(header_template % 0)
+
+    assert get_linearized_page_count(io.BytesIO(pdf_bytes)) == 42
+    assert BytesInput(pdf_bytes, "linearized.pdf").page_count == 42
+    # An incremental update makes the linearization dictionary stale.
+    assert get_linearized_page_count(io.BytesIO(pdf_bytes + b"\n")) is None
+
+
+@pytest.mark.parametrize(
+    ("header", "mimetype"),
+    [
+        (b"\x89PNG\r\n\x1a\n", "image/png"),
+        (b"\xff\xd8\xff\xe0", "image/jpeg"),
+        (b"II*\x00", "image/tiff"),
+        (b"MM\x00*", "image/tiff"),
+        (b"RIFF\x00\x00\x00\x00WEBPVP8 ", "image/webp"),
+        (b"\x00\x00\x00\x18ftypheic", "image/heic"),
+        (b"\x00\x00\x00\x18ftypmif1", "image/heif"),
+        (b"%PDF-1.7\n", "application/pdf"),
+    ],
+)
+def test_mimetype_sniffed_from_contents(header, mimetype):
+    input_source = BytesInput(header + b"\x00" * 32, "no_extension")
+    assert input_source.file_mimetype == mimetype
+    assert input_source.file_object.tell() == 0
+
+
+def test_mimetype_contents_override_extension():
+    input_source = BytesInput(b"\x89PNG\r\n\x1a\n" + b"\x00" * 32, "receipt.pdf")
+    assert input_source.file_mimetype == "image/png"
+
+
+def test_fix_pdf_with_junk_header():
+    pdf_bytes = b"%PDF-1.7\n%%EOF\n"
+    input_source = BytesInput(b"junk" * 20 + pdf_bytes, "invoice.pdf")
+    assert input_source.is_pdf()
+    input_source.fix_pdf()
+    assert input_source.file_object.read() == pdf_bytes
+
+    input_source = BytesInput(b"junk" * 200 + pdf_bytes, "invoice.pdf")
+    with pytest.raises(MimeTypeError, match="position 800"):
+        input_source.fix_pdf()
+
+
+def test_image_as_pdf_embeds_jpeg_as_is():
+    image_module = pytest.importorskip("PIL.Image")
+    jpeg_buffer = io.BytesIO()
+    image_module.effect_noise((120, 80), 64).convert("RGB").save(jpeg_buffer, "JPEG")
+    jpeg_input = BytesInput(jpeg_buffer.getvalue(), "photo.jpg")
+
+    image_pdf = jpeg_input.image_as_pdf()
+
+    assert jpeg_input.image_as_pdf() is image_pdf
+    pdf = pdfium.PdfDocument(image_pdf)
+    page = pdf[0]
+    assert page.get_size() == (120, 80)
+    pdf_image = next(page.get_objects())
+    assert bytes(pdf_image.get_data(decode_simple=False)) == jpeg_buffer.getvalue()
+    page.close()
+    pdf.close()
+
+    png_buffer = io.BytesIO()
+    image_module.new("RGBA", (30, 40)).save(png_buffer, "PNG")
+    png_pdf = pdfium.PdfDocument(
+        BytesInput(png_buffer.getvalue(), "a.png").image_as_pdf()
+    )
+    assert png_pdf[0].get_size() == (30, 40)
+    png_pdf.close()
+
+    with pytest.raises(MindeeSourceError):
+        BytesInput(_make_pdf(1), "doc.pdf").image_as_pdf()
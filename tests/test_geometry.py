@@ -135,3 +135,29 @@ def test_polygon_merge(rectangle_b, quadrangle_a):
         (0.381, 0.546),
         (0.124, 0.546),
     ]
+
+
+def test_perspective_coefficients(quadrangle_a):
+    quadrilateral = geometry.order_quadrilateral(
+        [Point(x * 1000, y * 1000) for x, y in quadrangle_a[2:] + quadrangle_a[:2]]
+    )
+    assert quadrilateral.top_left == pytest.approx((205, 407))
+    assert quadrilateral.bottom_right == pytest.approx((381, 430))
+    width, height = geometry.get_quadrilateral_size(quadrilateral)
+    assert (width, height) == (174, 23)
+
+    a, b, c, d, e, f, g, h = geometry.get_perspective_coefficients(
+        quadrilateral, width, height
+    )
+    for (x, y), corner in zip(
+        ((0, 0), (width, 0), (width, height), (0, height)), quadrilateral, strict=True
+    ):
+        divisor = g * x + h * y + 1
+        assert ((a * x + b * y + c) / divisor, (d * x + e * y + f) / divisor) == (
+            pytest.approx(corner)
+        )
+
+    with pytest.raises(MindeeGeometryError):
+        geometry.get_perspective_coefficients(
+            geometry.Quadrilateral(*[Point(1, 1)] * 4), 10, 10
+        )
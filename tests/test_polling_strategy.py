@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from mindee import (
+    AdaptivePollingStrategy,
+    FixedPollingStrategy,
+    JobDurationEstimator,
+    PollingOptions,
+)
+from mindee.error.mindee_error import MindeeClientError
+from mindee.mindee_http.retry_after import get_retry_after
+
+
+def test_default_polling_strategy_is_fixed():
+    options = PollingOptions(initial_delay_sec=3, delay_sec=2)
+    assert isinstance(options.strategy, FixedPollingStrategy)
+    assert options.get_initial_delay("model", 10) == 3
+    assert options.get_delay(1) == 2
+    assert options.get_delay(50) == 2
+    assert options.get_delay(1, retry_after_sec=5) == 5
+
+
+def test_adaptive_backoff_ceiling_and_jitter():
+    strategy = AdaptivePollingStrategy(
+        backoff_factor=2, max_delay_sec=10, jitter_ratio=0
+    )
+    options = PollingOptions(initial_delay_sec=2, delay_sec=1, strategy=strategy)
+    assert [options.get_delay(attempt) for attempt in range(1, 7)] == [
+        1,
+        2,
+        4,
+        8,
+        10,
+        10,
+    ]
+    assert options.get_delay(7, retry_after_sec=20) == 20
+
+    jittered = PollingOptions(
+        delay_sec=8, strategy=AdaptivePollingStrategy(jitter_ratio=0.5)
+    )
+    delays = [jittered.get_delay(1) for _ in range(50)]
+    assert all(4 <= delay <= 8 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_adaptive_initial_delay_from_estimator():
+    estimator = JobDurationEstimator(smoothing=0.5)
+    options = PollingOptions(
+        initial_delay_sec=2,
+        strategy=AdaptivePollingStrategy(
+            max_delay_sec=30, duration_estimator=estimator
+        ),
+    )
+    assert options.get_initial_delay("model", 1) == 2
+
+    options.strategy.record_duration("model", 2, 6)
+    assert estimator.estimate("model", 1) == 3
+    assert options.get_initial_delay("model", 4) == 12
+    assert options.get_initial_delay("model", 100) == 30
+    assert options.get_initial_delay("other-model", 1) == 2
+
+    options.strategy.record_duration("model", 1, 1)
+    assert estimator.estimate("model", 1) == 2
+    options.strategy.record_duration("fast-model", 1, 0.2)
+    assert options.get_initial_delay("fast-model", 1) == 1
+
+
+def test_adaptive_invalid_values():
+    with pytest.raises(MindeeClientError):
+        AdaptivePollingStrategy(backoff_factor=0.5)
+    with pytest.raises(MindeeClientError):
+        AdaptivePollingStrategy(max_delay_sec=0.5)
+    with pytest.raises(MindeeClientError):
+        AdaptivePollingStrategy(jitter_ratio=1)
+    with pytest.raises(MindeeClientError):
+        JobDurationEstimator(smoothing=0)
+
+
+def test_get_retry_after():
+    assert get_retry_after(httpx.Response(200)) is None
+    assert get_retry_after(httpx.Response(200, headers={"Retry-After": "3"})) == 3
+    assert (
+        get_retry_after(httpx.Response(200, headers={"Retry-After": "invalid"})) is None
+    )
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = get_retry_after(
+        httpx.Response(200, headers={"Retry-After": format_datetime(retry_at, True)})
+    )
+    assert delay is not None
+    assert 25 < delay <= 30
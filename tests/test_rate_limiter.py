@@ -0,0 +1,100 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+import respx
+
+from mindee import HTTPOptions
+from mindee.error.mindee_error import MindeeClientError
+from mindee.mindee_http.rate_limiter import (
+    ENQUEUE_BUCKET,
+    POLLING_BUCKET,
+    BucketLimit,
+    FileRateLimiter,
+    TokenBucketRateLimiter,
+)
+from mindee.v2 import AsyncClient
+from mindee.v2.client import Client
+from tests.v2.job_utils import BASE_URL, JOB_ID, make_job_json
+
+
+def test_token_bucket_burst_then_rate():
+    limiter = TokenBucketRateLimiter({POLLING_BUCKET: BucketLimit(10, burst=2)})
+    waits = [limiter.reserve(POLLING_BUCKET) for _ in range(4)]
+    assert waits[:2] == [0, 0]
+    assert waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == pytest.approx(0.2, abs=0.01)
+    # Buckets without a limit are not rate limited.
+    assert limiter.reserve(ENQUEUE_BUCKET) == 0
+
+
+def test_token_bucket_default_limit():
+    limiter = TokenBucketRateLimiter(default_limit=BucketLimit(1))
+    assert limiter.reserve(ENQUEUE_BUCKET) == 0
+    assert limiter.reserve(ENQUEUE_BUCKET) == pytest.approx(1, abs=0.01)
+    assert limiter.reserve(POLLING_BUCKET) == 0
+
+
+def test_file_rate_limiter_shared_budget(tmp_path):
+    path = tmp_path / "mindee_rate_limit.json"
+    limits = {ENQUEUE_BUCKET: BucketLimit(0.1, burst=1)}
+    # Each limiter stands for a separate process using the same file.
+    first = FileRateLimiter(path, limits)
+    second = FileRateLimiter(path, limits)
+    assert first.reserve(ENQUEUE_BUCKET) == 0
+    assert second.reserve(ENQUEUE_BUCKET) == pytest.approx(10, abs=0.5)
+    assert first.reserve(ENQUEUE_BUCKET) == pytest.approx(20, abs=0.5)
+    assert second.reserve(POLLING_BUCKET) == 0
+
+
+def test_invalid_bucket_limit():
+    with pytest.raises(MindeeClientError):
+        BucketLimit(0)
+    with pytest.raises(MindeeClientError):
+        BucketLimit(1, burst=0)
+
+
+@respx.mock
+def test_client_consults_rate_limiter(monkeypatch):
+    waits: list[float] = []
+    monkeypatch.setattr("mindee.mindee_http.rate_limiter.time.sleep", waits.append)
+    respx.get(f"{BASE_URL}/v2/jobs/{JOB_ID}").mock(
+        return_value=httpx.Response(200, json=make_job_json())
+    )
+    limiter = TokenBucketRateLimiter({POLLING_BUCKET: BucketLimit(2)})
+    with Client(
+        api_key="dummy", http_options=HTTPOptions(rate_limiter=limiter)
+    ) as client:
+        for _ in range(3):
+            client.get_job(JOB_ID)
+
+    assert len(waits) == 2
+    assert waits[0] == pytest.approx(0.5, abs=0.02)
+    assert waits[1] == pytest.approx(1, abs=0.02)
+
+
+@respx.mock
+def test_async_client_reserves_off_the_event_loop(tmp_path):
+    respx.get(f"{BASE_URL}/v2/jobs/{JOB_ID}").mock(
+        return_value=httpx.Response(200, json=make_job_json())
+    )
+    reserving_threads = []
+
+    class RecordingRateLimiter(FileRateLimiter):
+        def reserve(self, bucket: str) -> float:
+            reserving_threads.append(threading.get_ident())
+            return super().reserve(bucket)
+
+    limiter = RecordingRateLimiter(tmp_path / "mindee_rate_limit.json")
+
+    async def _run():
+        async with AsyncClient(
+            api_key="dummy", http_options=HTTPOptions(rate_limiter=limiter)
+        ) as client:
+            await client.get_job(JOB_ID)
+        return threading.get_ident()
+
+    event_loop_thread = asyncio.run(_run())
+    assert len(reserving_threads) == 1
+    assert reserving_threads[0] != event_loop_thread
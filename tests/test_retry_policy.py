@@ -0,0 +1,133 @@
+import asyncio
+import re
+
+import httpx
+import pytest
+import respx
+
+from mindee import BytesInput, ExtractionParameters, HTTPOptions
+from mindee.mindee_http.retry_policy import RetryBudget, RetryPolicy
+from mindee.v2 import AsyncClient
+from mindee.v2.client import Client
+from mindee.v2.error.mindee_http_error_v2 import MindeeHTTPErrorV2
+from tests.v2.job_utils import BASE_URL, JOB_ID, make_job_json
+
+ENQUEUE_PATTERN = re.compile(rf"{re.escape(BASE_URL)}/v2/.+/enqueue")
+JOB_URL = f"{BASE_URL}/v2/jobs/{JOB_ID}"
+UNAVAILABLE = httpx.Response(
+    503,
+    json={
+        "status": 503,
+        "code": "503-001",
+        "title": "Service Unavailable",
+        "detail": "forced failure from test",
+    },
+)
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    recorded: list[float] = []
+    monkeypatch.setattr("mindee.mindee_http.retry_policy.time.sleep", recorded.append)
+    return recorded
+
+
+def _make_client(policy: RetryPolicy) -> Client:
+    return Client(api_key="dummy", http_options=HTTPOptions(retry_policy=policy))
+
+
+def _enqueue(client: Client):
+    return client.enqueue(
+        BytesInput(b"dummy", "receipt.jpg"), ExtractionParameters("dummy-model")
+    )
+
+
+@respx.mock
+def test_get_retried_on_transient_status(sleeps) -> None:
+    route = respx.get(JOB_URL).mock(
+        side_effect=[
+            UNAVAILABLE,
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200, json=make_job_json()),
+        ]
+    )
+    policy = RetryPolicy(max_retries=3, base_delay_sec=0.5)
+    with _make_client(policy) as client:
+        response = client.get_job(JOB_ID)
+
+    assert response.job.id == JOB_ID
+    assert route.call_count == 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.5
+    assert sleeps[1] == 2
+    assert policy.metrics.request_count == 1
+    assert policy.metrics.attempt_count == 3
+    assert policy.metrics.retry_count == 2
+    assert policy.metrics.retries_by_reason == {"503": 1, "429": 1}
+
+
+@respx.mock
+def test_get_gives_up_after_max_retries(sleeps) -> None:
+    route = respx.get(JOB_URL).mock(return_value=UNAVAILABLE)
+    with (
+        _make_client(RetryPolicy(max_retries=2)) as client,
+        pytest.raises(MindeeHTTPErrorV2),
+    ):
+        client.get_job(JOB_ID)
+    assert route.call_count == 3
+    assert len(sleeps) == 2
+
+
+@respx.mock
+def test_enqueue_retried_only_on_connection_errors(sleeps) -> None:
+    route = respx.post(ENQUEUE_PATTERN).mock(
+        side_effect=[
+            httpx.ConnectError("Simulated connection failure"),
+            UNAVAILABLE,
+        ]
+    )
+    policy = RetryPolicy(max_retries=3)
+    with _make_client(policy) as client, pytest.raises(MindeeHTTPErrorV2):
+        _enqueue(client)
+    assert route.call_count == 2
+    assert policy.metrics.retries_by_reason == {"ConnectError": 1}
+
+    route.reset()
+    route.side_effect = httpx.ReadTimeout("Simulated read timeout")
+    with _make_client(policy) as client, pytest.raises(httpx.ReadTimeout):
+        _enqueue(client)
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_retry_budget_exhausted(sleeps) -> None:
+    respx.get(JOB_URL).mock(return_value=UNAVAILABLE)
+    policy = RetryPolicy(max_retries=5, budget=RetryBudget(ratio=0, min_retries=2))
+    with _make_client(policy) as client:
+        for _ in range(2):
+            with pytest.raises(MindeeHTTPErrorV2):
+                client.get_job(JOB_ID)
+    assert policy.metrics.retry_count == 2
+    assert policy.metrics.budget_exhausted_count == 2
+
+
+@respx.mock
+def test_async_get_retried(monkeypatch) -> None:
+    async def _no_sleep(_: float) -> None:
+        return None
+
+    monkeypatch.setattr("mindee.mindee_http.retry_policy.asyncio.sleep", _no_sleep)
+    route = respx.get(JOB_URL).mock(
+        side_effect=[UNAVAILABLE, httpx.Response(200, json=make_job_json())]
+    )
+    policy = RetryPolicy()
+
+    async def _run():
+        async with AsyncClient(
+            api_key="dummy", http_options=HTTPOptions(retry_policy=policy)
+        ) as client:
+            return await client.get_job(JOB_ID)
+
+    assert asyncio.run(_run()).job.id == JOB_ID
+    assert route.call_count == 2
+    assert policy.metrics.retry_count == 1
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
+import io
 import json
 
 import pytest
 
+from mindee.geometry.point import Point
+from mindee.image import image_extractor
 from mindee.image.image_extractor import extract_multiple_images_from_source
+from mindee.input.bytes_input import BytesInput
 from mindee.input.path_input import PathInput
+from mindee.pdf.render_options import RenderOptions
 from mindee.v1.product.barcode_reader import BarcodeReaderV1
 from tests.utils import V1_PRODUCT_DATA_DIR
 
 Image = pytest.importorskip("PIL.Image")
 
 
+def _make_blank_pdf(page_count: int) -> bytes:
+    pdfium = pytest.importorskip("pypdfium2")
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(page_count):
+        pdf.new_page(200, 100)
+    pdf_buffer = io.BytesIO()
+    pdf.save(pdf_buffer)
+    pdf.close()
+    return pdf_buffer.getvalue()
+
+
 @pytest.fixture
 def barcode_path():
     return V1_PRODUCT_DATA_DIR / "barcode_reader" / "default_sample.jpg"
@@ -44,3 +60,109 @@ def test_barcode_image_extraction(barcode_path, barcode_json_path):
     assert extracted_barcodes_2d[0].as_input_source().filename.endswith("jpg")
     assert extracted_barcodes_2d[1].as_input_source().filename.endswith("jpg")
     assert Image.open(extracted_barcodes_2d[1].buffer).size == (193, 201)
+
+
+@pytest.mark.pypdfium2
+def test_extraction_with_render_options():
+    input_source = BytesInput(_make_blank_pdf(1), "page.pdf")
+    half_page = [Point(0, 0), Point(0.5, 0), Point(0.5, 1), Point(0, 1)]
+
+    extracted = extract_multiple_images_from_source(
+        input_source, 0, [half_page], RenderOptions(dpi=144, grayscale=True)
+    )
+    with Image.open(extracted[0].buffer) as image:
+        assert image.size == (200, 200)
+        assert image.mode == "L"
+
+    extracted = extract_multiple_images_from_source(
+        input_source, 0, [half_page], RenderOptions(scale=4, max_pixels=20_000)
+    )
+    with Image.open(extracted[0].buffer) as image:
+        assert image.size == (100, 100)
+
+
+def test_image_extractor_renders_pages_with_crops_once(monkeypatch):
+    input_source = BytesInput(_make_blank_pdf(3), "pages.pdf")
+    half_page = [Point(0, 0), Point(0.5, 0), Point(0.5, 1), Point(0, 1)]
+    full_page = [Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)]
+
+    rendered_pages = []
+    original_render_page = image_extractor.render_page
+
+    def counting_render_page(page, *args):
+        rendered_pages.append(page.get_size())
+        return original_render_page(page, *args)
+
+    monkeypatch.setattr(image_extractor, "render_page", counting_render_page)
+
+    with image_extractor.ImageExtractor(input_source) as extractor:
+        extracted = extractor.extract_images(
+            {0: [half_page, full_page], 1: [], 2: [full_page]}
+        )
+        extracted_again = extractor.extract_page_images(2, [half_page])
+
+    assert len(rendered_pages) == 2
+    assert [image.filename for image in extracted] == [
+        "pages_page-001-item-001.jpg",
+        "pages_page-001-item-002.jpg",
+        "pages_page-003-item-001.jpg",
+    ]
+    with Image.open(extracted_again[0].buffer) as image:
+        assert image.size == (100, 100)
+
+
+def test_extracted_images_are_encoded_on_use(tmp_path):
+    input_source = BytesInput(_make_blank_pdf(1), "page.pdf")
+    half_page = [Point(0, 0), Point(0.5, 0), Point(0.5, 1), Point(0, 1)]
+    full_page = [Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)]
+
+    first, second = extract_multiple_images_from_source(
+        input_source, 0, [half_page, full_page]
+    )
+    assert first._buffer is None
+    assert second._buffer is None
+
+    first.write_to_file(tmp_path)
+
+    assert (tmp_path / first.filename).read_bytes() == first.buffer.getvalue()
+    assert second._buffer is None
+    with Image.open(second.buffer) as image:
+        assert image.size == (200, 100)
+
+
+def test_image_extractor_encodes_in_parallel_on_request():
+    input_source = BytesInput(_make_blank_pdf(2), "pages.pdf")
+    full_page = [Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)]
+
+    with image_extractor.ImageExtractor(input_source) as extractor:
+        extracted = extractor.extract_images(
+            {0: [full_page, full_page], 1: [full_page]}, encode_workers=2
+        )
+
+    assert all(image._buffer is not None for image in extracted)
+    with Image.open(extracted[2].buffer) as image:
+        assert image.size == (200, 100)
+
+
+def test_extraction_with_perspective():
+    # A white page holding a black square rotated by 45°.
+    page = Image.new("RGB", (200, 200), "white")
+    diamond = [(100, 20), (180, 100), (100, 180), (20, 100)]
+    ImageDraw = pytest.importorskip("PIL.ImageDraw")
+    ImageDraw.Draw(page).polygon(diamond, fill="black")
+    page_buffer = io.BytesIO()
+    page.save(page_buffer, format="PNG")
+    input_source = BytesInput(page_buffer.getvalue(), "diamond.png")
+    polygon = [Point(x / 200, y / 200) for x, y in diamond]
+
+    straight, deskewed = (
+        extract_multiple_images_from_source(input_source, 0, [polygon], None, False)[0],
+        extract_multiple_images_from_source(input_source, 0, [polygon], None, True)[0],
+    )
+
+    with Image.open(straight.buffer) as image:
+        assert image.size == (160, 160)
+    with Image.open(deskewed.buffer) as image:
+        assert image.size == (113, 113)
+        # Only the inside of the square is kept, without the white corners.
+        assert image.convert("L").crop((5, 5, 108, 108)).getextrema()[1] < 80
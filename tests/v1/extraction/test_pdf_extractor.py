@@ -1,5 +1,10 @@
+import gc
+
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
 import pytest
 
+from mindee.error.mindee_error import MindeeError
 from mindee.input.local_response import LocalResponse
 from mindee.input.path_input import PathInput
 from mindee.v1.client import Client
@@ -89,3 +94,118 @@ def test_pdf_should_extract_invoices_strict(
 
     assert extracted_pdfs_strict[1].page_count == 4
     assert extracted_pdfs_strict[1].filename == "invoice_5p_pages-002-005.pdf"
+
+
+@pytest.mark.pillow
+@pytest.mark.pypdfium2
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_pdf_source_parsed_once(tmp_path, monkeypatch, use_mmap):
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(6):
+        pdf.new_page(200, 300)
+    pdf.save(tmp_path / "batch.pdf")
+    pdf.close()
+
+    opened = []
+
+    class CountingPdfDocument(pdfium.PdfDocument):
+        def __init__(self, source, *args, **kwargs):
+            if not isinstance(source, pdfium_c.FPDF_DOCUMENT):
+                opened.append(type(source))
+            super().__init__(source, *args, **kwargs)
+
+    monkeypatch.setattr(pdfium, "PdfDocument", CountingPdfDocument)
+
+    pdf_input = PathInput(tmp_path / "batch.pdf")
+    with PDFExtractor(pdf_input, use_mmap=use_mmap) as extractor:
+        opened.clear()
+        extracted_pdfs = extractor.iter_documents([[0, 1], [2], [3, 4, 5]])
+        assert not opened
+        assert [extracted.page_count for extracted in extracted_pdfs] == [2, 1, 3]
+        assert extractor.extract_single_document([5]).page_count == 1
+    assert len(opened) == 1
+
+
+@pytest.mark.pillow
+@pytest.mark.pypdfium2
+def test_pdf_mmap_ignores_modified_input(tmp_path):
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(5):
+        pdf.new_page(200, 300)
+    pdf.save(tmp_path / "merged.pdf")
+    pdf.close()
+
+    pdf_input = PathInput(tmp_path / "merged.pdf")
+    with PDFExtractor(pdf_input, use_mmap=True) as extractor:
+        assert extractor._source_path == str(tmp_path / "merged.pdf")
+
+    pdf_input.merge_pdf_pages({0})
+    assert pdf_input.page_count == 1
+    with PDFExtractor(pdf_input) as extractor:
+        assert len(extractor._get_source_document()) == 1
+    with PDFExtractor(pdf_input, use_mmap=True) as extractor:
+        assert extractor._source_path is None
+        assert len(extractor._get_source_document()) == 1
+        assert extractor.extract_single_document([0]).page_count == 1
+    pdf_input.close()
+
+
+@pytest.mark.pillow
+@pytest.mark.pypdfium2
+def test_pdf_extractor_bounds_and_release(tmp_path):
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(3):
+        pdf.new_page(200, 300)
+    pdf.save(tmp_path / "bounds.pdf")
+    pdf.close()
+    pdf_input = PathInput(tmp_path / "bounds.pdf")
+
+    extractor = PDFExtractor(pdf_input, use_mmap=True)
+    assert extractor.extract_single_document([2]).page_count == 1
+    for page_index in (3, -1):
+        with pytest.raises(MindeeError):
+            extractor.extract_single_document([page_index])
+
+    source_mmap = extractor._source_mmap
+    del extractor
+    gc.collect()
+    # The document and its memory map are released without an explicit close.
+    assert source_mmap.closed
+    pdf_input.close()
+
+
+def test_pdf_split_to_files(tmp_path):
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(5):
+        pdf.new_page(200, 300)
+    pdf.save(tmp_path / "archive.pdf")
+    pdf.close()
+    output_dir = tmp_path / "chunks"
+    output_dir.mkdir()
+
+    with PDFExtractor(PathInput(tmp_path / "archive.pdf")) as extractor:
+        chunks = list(extractor.split_to_files(output_dir, 2))
+
+    assert [chunk.filename for chunk in chunks] == [
+        "archive_pages-001-002.pdf",
+        "archive_pages-003-004.pdf",
+        "archive_pages-005-005.pdf",
+    ]
+    assert all(chunk._file_object is None for chunk in chunks)
+    with chunks[0]:
+        pass
+    # Exiting an unused chunk does not open its file.
+    assert chunks[0]._file_object is None
+    assert [chunk.page_count for chunk in chunks] == [2, 2, 1]
+    # Counting pages does not leave the files open.
+    assert all(chunk._file_object is None for chunk in chunks)
+
+    with chunks[0].open_for_upload(close_file=True) as (_, uploaded, _):
+        first_upload = uploaded.read()
+    assert chunks[0]._file_object is None
+    # A closed chunk reopens its file when used again.
+    assert chunks[0].read_contents(close_file=True)[1] == first_upload
+    chunks[0].close()
+    assert chunks[0].file_object.read() == first_upload
+    for chunk in chunks:
+        chunk.close()
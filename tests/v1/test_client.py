@@ -1,9 +1,13 @@
 import binascii
 import contextlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import httpx
 import pytest
 
 from mindee import Base64Input, PathInput
+from mindee.client_options.http_options import HTTPOptions
 from mindee.error.mindee_error import MindeeClientError, MindeeError
 from mindee.error.mindee_http_error import MindeeHTTPError
 from mindee.input.local_input_source import LocalInputSource
@@ -170,3 +174,41 @@ def test_local_response_from_invalid_dict(dummy_client: Client):
     input_file = LocalResponse(V1_ERROR_DATA_DIR / "error_400_no_details.json")
     with pytest.raises(MindeeError):
         dummy_client.load_prediction(InvoiceV4, input_file)
+
+
+def test_endpoints_share_pooled_http_client():
+    client = Client("dummy", http_options=HTTPOptions(connect_timeout_sec=3))
+    invoice_endpoint = client._initialize_ots_endpoint(InvoiceV4)
+    receipt_endpoint = client._initialize_ots_endpoint(ReceiptV5)
+    custom_endpoint = client.create_endpoint("dummy-endpoint", "dummy-account")
+    # Building endpoints does not create the client, the first request does.
+    assert client.http_client is None
+    http_client = invoice_endpoint._get_http_client(10)
+    assert client.http_client is http_client
+    assert receipt_endpoint._get_http_client(10) is http_client
+    assert custom_endpoint._get_http_client(10) is http_client
+    assert client.http_client.timeout.connect == 3
+    client.close()
+    assert client.http_client.is_closed
+
+
+def test_pooled_http_client_created_once_across_threads(monkeypatch):
+    client = Client("dummy")
+    created = []
+    http_client_class = httpx.Client
+
+    def slow_http_client(*args, **kwargs):
+        # Widen the window between the check and the assignment.
+        time.sleep(0.01)
+        created.append(http_client_class(*args, **kwargs))
+        return created[-1]
+
+    monkeypatch.setattr(httpx, "Client", slow_http_client)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        http_clients = list(
+            executor.map(lambda _: client._get_http_client(10), range(8))
+        )
+
+    assert len(created) == 1
+    assert all(http_client is created[0] for http_client in http_clients)
+    client.close()
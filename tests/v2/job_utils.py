@@ -0,0 +1,59 @@
+from mindee.parsing.common.string_dict import StringDict
+
+JOB_ID = "12345678-1234-1234-1234-123456789ABC"
+MODEL_ID = "87654321-4321-4321-4321-CBA987654321"
+INFERENCE_ID = "12345678-1234-1234-1234-123456789DEF"
+BASE_URL = "https://api-v2.mindee.net"
+
+
+def make_job_json(
+    status: str = "Processing", job_id: str = JOB_ID, error: StringDict | None = None
+) -> StringDict:
+    """Build a minimal job payload, as sent back by the polling endpoint."""
+    return {
+        "job": {
+            "id": job_id,
+            "model_id": MODEL_ID,
+            "filename": "receipt.jpg",
+            "alias": "dummy-alias.jpg",
+            "created_at": "2025-07-03T14:27:58.974451",
+            "completed_at": (
+                "2025-07-03T14:28:01.974451" if status == "Processed" else None
+            ),
+            "status": status,
+            "polling_url": f"{BASE_URL}/v2/jobs/{job_id}",
+            "result_url": (
+                f"{BASE_URL}/v2/inferences/{INFERENCE_ID}"
+                if status == "Processed"
+                else None
+            ),
+            "webhooks": [],
+            "error": error,
+        }
+    }
+
+
+def make_extraction_json() -> StringDict:
+    """Build a minimal extraction inference payload."""
+    return {
+        "inference": {
+            "id": INFERENCE_ID,
+            "job": {"id": JOB_ID},
+            "model": {"id": MODEL_ID},
+            "file": {
+                "name": "receipt.jpg",
+                "alias": None,
+                "page_count": 1,
+                "mime_type": "image/jpeg",
+            },
+            "active_options": {
+                "raw_text": False,
+                "polygon": False,
+                "confidence": False,
+                "rag": False,
+                "text_context": False,
+                "data_schema": {"replace": False},
+            },
+            "result": {"fields": {}},
+        }
+    }
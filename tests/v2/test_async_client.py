@@ -0,0 +1,170 @@
+import asyncio
+import re
+
+import httpx
+import pytest
+import respx
+
+from mindee import BytesInput, ExtractionParameters, ExtractionResponse
+from mindee.client_options.polling_options import PollingOptions
+from mindee.error.mindee_error import MindeeError
+from mindee.v2 import AsyncClient
+from mindee.v2.error.mindee_http_error_v2 import MindeeHTTPErrorV2
+from mindee.v2.parsing.job.job_response import JobResponse
+from tests.v2.job_utils import (
+    BASE_URL,
+    INFERENCE_ID,
+    JOB_ID,
+    make_extraction_json,
+    make_job_json,
+)
+
+ENQUEUE_PATTERN = re.compile(rf"{re.escape(BASE_URL)}/v2/.+/enqueue")
+
+
+def _fast_params() -> ExtractionParameters:
+    return ExtractionParameters(
+        "dummy-model",
+        polling_options=PollingOptions(initial_delay_sec=1, delay_sec=1, max_retries=3),
+    )
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    async def _no_sleep(_: float) -> None:
+        return None
+
+    monkeypatch.setattr("mindee.v2.async_client.asyncio.sleep", _no_sleep)
+
+
+@pytest.mark.v2
+@respx.mock
+def test_async_enqueue() -> None:
+    respx.post(ENQUEUE_PATTERN).mock(
+        return_value=httpx.Response(202, json=make_job_json())
+    )
+
+    async def _run() -> JobResponse:
+        async with AsyncClient(api_key="dummy") as client:
+            return await client.enqueue(
+                BytesInput(b"dummy", "receipt.jpg"), ExtractionParameters("dummy")
+            )
+
+    response = asyncio.run(_run())
+    assert response.job.id == JOB_ID
+    assert response.job.status == "Processing"
+
+
+@pytest.mark.v2
+@respx.mock
+def test_async_enqueue_error() -> None:
+    respx.post(ENQUEUE_PATTERN).mock(
+        return_value=httpx.Response(
+            400,
+            json={
+                "status": 400,
+                "code": "400-001",
+                "title": "Bad Request",
+                "detail": "forced failure from test",
+            },
+        )
+    )
+
+    async def _run() -> None:
+        async with AsyncClient(api_key="dummy") as client:
+            await client.enqueue(
+                BytesInput(b"dummy", "receipt.jpg"), ExtractionParameters("dummy")
+            )
+
+    with pytest.raises(MindeeHTTPErrorV2) as e:
+        asyncio.run(_run())
+    assert e.value.detail == "forced failure from test"
+
+
+@pytest.mark.v2
+@respx.mock
+def test_async_enqueue_and_get_result(no_sleep) -> None:
+    respx.post(ENQUEUE_PATTERN).mock(
+        return_value=httpx.Response(202, json=make_job_json())
+    )
+    respx.get(f"{BASE_URL}/v2/jobs/{JOB_ID}").mock(
+        side_effect=[
+            httpx.Response(200, json=make_job_json()),
+            httpx.Response(200, json=make_job_json("Processed")),
+        ]
+    )
+    respx.get(f"{BASE_URL}/v2/inferences/{INFERENCE_ID}").mock(
+        return_value=httpx.Response(200, json=make_extraction_json())
+    )
+
+    async def _run() -> ExtractionResponse:
+        async with AsyncClient(api_key="dummy") as client:
+            return await client.enqueue_and_get_result(
+                ExtractionResponse, BytesInput(b"dummy", "receipt.jpg"), _fast_params()
+            )
+
+    response = asyncio.run(_run())
+    assert isinstance(response, ExtractionResponse)
+    assert response.inference.id == INFERENCE_ID
+
+
+@pytest.mark.v2
+@respx.mock
+def test_async_enqueue_and_get_result_many_in_flight(no_sleep) -> None:
+    respx.post(ENQUEUE_PATTERN).mock(
+        return_value=httpx.Response(202, json=make_job_json())
+    )
+    respx.get(f"{BASE_URL}/v2/jobs/{JOB_ID}").mock(
+        return_value=httpx.Response(200, json=make_job_json("Processed"))
+    )
+    respx.get(f"{BASE_URL}/v2/inferences/{INFERENCE_ID}").mock(
+        return_value=httpx.Response(200, json=make_extraction_json())
+    )
+
+    async def _run() -> list[ExtractionResponse]:
+        async with AsyncClient(api_key="dummy") as client:
+            return await asyncio.gather(
+                *[
+                    client.enqueue_and_get_result(
+                        ExtractionResponse,
+                        BytesInput(b"dummy", "receipt.jpg"),
+                        _fast_params(),
+                    )
+                    for _ in range(20)
+                ]
+            )
+
+    responses = asyncio.run(_run())
+    assert len(responses) == 20
+    assert all(r.inference.id == INFERENCE_ID for r in responses)
+
+
+@pytest.mark.v2
+@respx.mock
+def test_async_enqueue_and_get_result_failed_job(no_sleep) -> None:
+    respx.post(ENQUEUE_PATTERN).mock(
+        return_value=httpx.Response(202, json=make_job_json())
+    )
+    respx.get(f"{BASE_URL}/v2/jobs/{JOB_ID}").mock(
+        return_value=httpx.Response(
+            200,
+            json=make_job_json(
+                "Failed",
+                error={
+                    "status": 500,
+                    "title": "Server Error",
+                    "code": "500-001",
+                    "detail": "Simulated failure",
+                },
+            ),
+        )
+    )
+
+    async def _run() -> None:
+        async with AsyncClient(api_key="dummy") as client:
+            await client.enqueue_and_get_result(
+                ExtractionResponse, BytesInput(b"dummy", "receipt.jpg"), _fast_params()
+            )
+
+    with pytest.raises(MindeeError, match="Simulated failure"):
+        asyncio.run(_run())
@@ -1,4 +1,5 @@
 import concurrent.futures
+import io
 import json
 import os
 import re
@@ -8,7 +9,17 @@
 import pytest
 import respx
 
-from mindee import ExtractionParameters, ExtractionResponse, LocalResponse
+from mindee import (
+    AdaptivePollingStrategy,
+    BytesInput,
+    ExtractionParameters,
+    ExtractionResponse,
+    FileInput,
+    JobDurationEstimator,
+    LocalResponse,
+    PollingOptions,
+)
+from mindee.client_options.http_options import HTTPOptions
 from mindee.error.mindee_error import MindeeError
 from mindee.input.local_input_source import LocalInputSource
 from mindee.input.path_input import PathInput
@@ -23,6 +34,14 @@
 from mindee.v2.parsing.job.job_response import JobResponse
 from mindee.v2.product.extraction.extraction_inference import ExtractionInference
 from tests.utils import FILE_TYPES_DIR, V2_DATA_DIR, V2_PRODUCT_DATA_DIR, dummy_envvars
+from tests.v2.job_utils import (
+    BASE_URL,
+    INFERENCE_ID,
+    JOB_ID,
+    MODEL_ID,
+    make_extraction_json,
+    make_job_json,
+)
 
 
 @pytest.fixture
@@ -338,3 +357,104 @@ def test_explicit_500_server_error(findoc_model_id: str) -> None:
         client.enqueue(input_source, params)
 
     assert "Couldn't deserialize server error" in str(exc_info.value)
+
+
+@pytest.mark.v2
+@respx.mock
+def test_adaptive_polling_retry_after_and_estimate(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("mindee.v2.client.sleep", sleeps.append)
+    respx.post(re.compile(rf"{re.escape(BASE_URL)}/v2/.+/enqueue")).mock(
+        return_value=httpx.Response(202, json=make_job_json())
+    )
+    respx.get(f"{BASE_URL}/v2/jobs/{JOB_ID}").mock(
+        side_effect=[
+            httpx.Response(200, json=make_job_json(), headers={"Retry-After": "5"}),
+            httpx.Response(200, json=make_job_json("Processed")),
+            httpx.Response(200, json=make_job_json("Processed")),
+        ]
+    )
+    respx.get(f"{BASE_URL}/v2/inferences/{INFERENCE_ID}").mock(
+        return_value=httpx.Response(200, json=make_extraction_json())
+    )
+    polling_options = PollingOptions(
+        initial_delay_sec=2,
+        delay_sec=1,
+        strategy=AdaptivePollingStrategy(
+            jitter_ratio=0, duration_estimator=JobDurationEstimator()
+        ),
+    )
+
+    with Client(api_key="dummy") as client:
+        for _ in range(2):
+            client.enqueue_and_get_result(
+                ExtractionResponse,
+                BytesInput(b"dummy", "receipt.jpg"),
+                ExtractionParameters(MODEL_ID, polling_options=polling_options),
+            )
+
+    # Fixed initial delay, then the server's Retry-After,
+    # then the learned processing time of the first job.
+    assert sleeps == [2, 5, 3]
+
+
+@pytest.mark.v2
+@respx.mock
+def test_pooled_http_client_reused() -> None:
+    respx.get(f"{BASE_URL}/v2/jobs/{JOB_ID}").mock(
+        return_value=httpx.Response(200, json=make_job_json())
+    )
+    client = Client(
+        api_key="dummy",
+        http_options=HTTPOptions(connect_timeout_sec=3, read_timeout_sec=30),
+    )
+    assert client.mindee_api.http_client is None
+
+    client.get_job(JOB_ID)
+    http_client = client.mindee_api.http_client
+    assert http_client is not None
+    client.get_job(JOB_ID)
+    assert client.mindee_api.http_client is http_client
+    assert http_client.timeout.connect == 3
+    assert http_client.timeout.read == 30
+
+    client.close()
+    assert http_client.is_closed
+
+
+class _ChunkRecordingBytesIO(io.BytesIO):
+    def __init__(self, data: bytes, name: str) -> None:
+        super().__init__(data)
+        self.name = name
+        self.read_sizes: list[int] = []
+
+    def read(self, size: int | None = -1) -> bytes:
+        chunk = super().read(size)
+        self.read_sizes.append(len(chunk))
+        return chunk
+
+
+@pytest.mark.v2
+@respx.mock
+def test_enqueue_streams_file_on_retry(monkeypatch) -> None:
+    monkeypatch.setattr("mindee.mindee_http.retry_policy.time.sleep", lambda _: None)
+    payload = b"\xff\xd8\xff" + b"0" * 300_000
+    file = _ChunkRecordingBytesIO(payload, "receipt.jpg")
+    input_source = FileInput(file)
+    file.read_sizes.clear()
+    route = respx.post(re.compile(rf"{re.escape(BASE_URL)}/v2/.+/enqueue")).mock(
+        side_effect=[
+            httpx.ConnectError("refused"),
+            httpx.Response(202, json=make_job_json()),
+        ]
+    )
+
+    with Client(api_key="dummy") as client:
+        response = client.enqueue(input_source, ExtractionParameters(MODEL_ID))
+
+    assert response.job.id == JOB_ID
+    assert route.call_count == 2
+    for call in route.calls:
+        assert payload in call.request.content
+    assert max(file.read_sizes) < len(payload)
+    assert file.closed
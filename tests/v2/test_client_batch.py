@@ -0,0 +1,123 @@
+import re
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from mindee import BytesInput, ExtractionParameters, ExtractionResponse
+from mindee.client_options.polling_options import PollingOptions
+from mindee.error.mindee_error import MindeeClientError
+from mindee.v2.client import Client
+from mindee.v2.error.mindee_http_error_v2 import MindeeHTTPErrorV2
+from tests.v2.job_utils import (
+    BASE_URL,
+    INFERENCE_ID,
+    JOB_ID,
+    make_extraction_json,
+    make_job_json,
+)
+
+ENQUEUE_PATTERN = re.compile(rf"{re.escape(BASE_URL)}/v2/.+/enqueue")
+
+
+def _make_items(count: int, model_id: str = "dummy-model"):
+    return [
+        (
+            BytesInput(b"dummy", f"receipt_{i}.jpg"),
+            ExtractionParameters(
+                model_id,
+                alias=str(i),
+                polling_options=PollingOptions(
+                    initial_delay_sec=1, delay_sec=1, max_retries=3
+                ),
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr("mindee.v2.client.sleep", lambda _: None)
+
+
+@pytest.mark.v2
+@respx.mock
+def test_enqueue_many_bounded_in_flight() -> None:
+    lock = threading.Lock()
+    in_flight = 0
+    max_seen = 0
+
+    def delayed_response(_: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_seen
+        with lock:
+            in_flight += 1
+            max_seen = max(max_seen, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return httpx.Response(202, json=make_job_json())
+
+    respx.post(ENQUEUE_PATTERN).mock(side_effect=delayed_response)
+
+    with Client(api_key="dummy") as client:
+        results = list(client.enqueue_many(_make_items(12), max_in_flight=3))
+
+    assert len(results) == 12
+    assert all(result.is_success for result in results)
+    assert all(result.result.job.id == JOB_ID for result in results)
+    assert sorted(result.index for result in results) == list(range(12))
+    assert max_seen <= 3
+
+
+@pytest.mark.v2
+@respx.mock
+def test_process_many_captures_errors(no_sleep) -> None:
+    def enqueue_response(request: httpx.Request) -> httpx.Response:
+        if b"bad-model" in request.content:
+            return httpx.Response(
+                422,
+                json={
+                    "status": 422,
+                    "code": "422-001",
+                    "title": "Invalid model",
+                    "detail": "forced failure from test",
+                },
+            )
+        return httpx.Response(202, json=make_job_json())
+
+    respx.post(ENQUEUE_PATTERN).mock(side_effect=enqueue_response)
+    respx.get(f"{BASE_URL}/v2/jobs/{JOB_ID}").mock(
+        return_value=httpx.Response(200, json=make_job_json("Processed"))
+    )
+    respx.get(f"{BASE_URL}/v2/inferences/{INFERENCE_ID}").mock(
+        return_value=httpx.Response(200, json=make_extraction_json())
+    )
+
+    items = _make_items(4) + _make_items(1, model_id="bad-model")
+    with Client(api_key="dummy") as client:
+        results = list(client.process_many(ExtractionResponse, items, max_in_flight=2))
+
+    assert len(results) == 5
+    failures = [result for result in results if not result.is_success]
+    assert len(failures) == 1
+    assert failures[0].index == 4
+    assert failures[0].result is None
+    assert isinstance(failures[0].error, MindeeHTTPErrorV2)
+    successes = [result for result in results if result.is_success]
+    assert all(
+        isinstance(result.result, ExtractionResponse)
+        and result.result.inference.id == INFERENCE_ID
+        for result in successes
+    )
+
+
+@pytest.mark.v2
+def test_enqueue_many_invalid_max_in_flight() -> None:
+    with (
+        Client(api_key="dummy") as client,
+        pytest.raises(MindeeClientError),
+    ):
+        list(client.enqueue_many(_make_items(1), max_in_flight=0))
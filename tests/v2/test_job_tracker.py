@@ -0,0 +1,83 @@
+import threading
+from concurrent.futures import CancelledError, wait
+
+import pytest
+
+from mindee.client_options.polling_options import PollingOptions
+from mindee.error.mindee_error import MindeeClientError, MindeeError
+from mindee.v2.parsing.job.job_response import JobResponse
+from mindee.v2.polling import JobTracker
+from tests.v2.job_utils import make_job_json
+
+FAST_POLLING = PollingOptions(initial_delay_sec=1, delay_sec=1, max_retries=3)
+
+
+class _FakeClient:
+    """Answers polling requests, jobs are processed after a given number of polls."""
+
+    def __init__(self, polls_before_done: int = 1, status: str = "Processed"):
+        self.polls_before_done = polls_before_done
+        self.status = status
+        self.calls: dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def get_job(self, job_id: str) -> JobResponse:
+        with self.lock:
+            self.calls[job_id] = self.calls.get(job_id, 0) + 1
+            count = self.calls[job_id]
+        if count < self.polls_before_done:
+            return JobResponse(make_job_json(job_id=job_id))
+        return JobResponse(make_job_json(self.status, job_id=job_id))
+
+
+@pytest.mark.v2
+def test_tracker_resolves_many_jobs_with_flat_thread_count():
+    client = _FakeClient(polls_before_done=2)
+    threads_before = threading.active_count()
+    with JobTracker(client, FAST_POLLING, max_workers=2) as tracker:  # type: ignore[arg-type]
+        futures = [tracker.register(f"job-{i}") for i in range(50)]
+        threads_during = threading.active_count()
+        done, not_done = wait(futures, timeout=10)
+
+    assert not not_done
+    assert all(f.result().job.status == "Processed" for f in done)
+    assert {f.result().job.id for f in done} == {f"job-{i}" for i in range(50)}
+    assert all(count == 2 for count in client.calls.values())
+    # One scheduler thread, plus at most the polling workers.
+    assert threads_during - threads_before <= 3
+
+
+@pytest.mark.v2
+def test_tracker_failed_job_and_callback():
+    client = _FakeClient(status="Failed")
+    called = threading.Event()
+    with JobTracker(client, FAST_POLLING) as tracker:  # type: ignore[arg-type]
+        future = tracker.register("job-failed", callback=lambda _: called.set())
+        with pytest.raises(MindeeError, match="Parsing failed for job job-failed"):
+            future.result(timeout=10)
+    assert called.is_set()
+
+
+@pytest.mark.v2
+def test_tracker_max_retries():
+    client = _FakeClient(polls_before_done=100)
+    options = PollingOptions(initial_delay_sec=1, delay_sec=1, max_retries=1)
+    with JobTracker(client) as tracker:  # type: ignore[arg-type]
+        future = tracker.register("job-slow", options)
+        with pytest.raises(MindeeError, match="Couldn't retrieve document"):
+            future.result(timeout=10)
+    assert client.calls["job-slow"] == 1
+
+
+@pytest.mark.v2
+def test_tracker_close_cancels_pending_jobs():
+    client = _FakeClient()
+    tracker = JobTracker(client, FAST_POLLING)  # type: ignore[arg-type]
+    future = tracker.register("job-pending", expected_duration_sec=60)
+    assert tracker.pending_count == 1
+    tracker.close()
+    with pytest.raises(CancelledError):
+        future.result()
+    assert not client.calls
+    with pytest.raises(MindeeClientError):
+        tracker.register("job-late")